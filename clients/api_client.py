@@ -1,61 +1,248 @@
-from typing import Any
+import json
+from collections.abc import Mapping
+from functools import cached_property, wraps
+from typing import Any, Awaitable, Callable, Generic, Self, TypeVar
 
 import allure  # Импортируем allure
-from httpx import Client, URL, Response, QueryParams
+from httpx import AsyncClient, Client, URL, Response, QueryParams
 from httpx._types import RequestData, RequestFiles
+from pydantic import BaseModel
 
+from tools.http.timings import RequestTimer, RequestTimingsSchema
 
-class APIClient:
-    def __init__(self, client: Client):
-        self.client = client
+Model = TypeVar("Model", bound=BaseModel)
+Function = TypeVar("Function", bound=Callable[..., Any])
+
+
+class APIResponse:
+    """
+    Обёртка над httpx.Response, которая разбирает JSON тело ответа ровно один раз.
+
+    Байты тела декодируются одним json.loads без промежуточного response.text. Результат
+    запоминается и переиспользуется и в json(), и в parse(), поэтому модель для проверок
+    и объект для validate_json_schema строятся из одного и того же разбора.
+    Все остальные атрибуты (status_code, headers, request и т.д.) берутся из httpx.Response.
+    """
+
+    def __init__(self, response: Response, timings: RequestTimingsSchema | None = None):
+        self.response = response
+        self.timings = timings  # Длительности фаз запроса, собранные APIClient
+        self.models: dict[type[BaseModel], BaseModel] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "response":  # Защита от рекурсии, пока объект не инициализирован (например, при копировании)
+            raise AttributeError(name)
+
+        return getattr(self.response, name)
+
+    def __repr__(self) -> str:
+        return f"<APIResponse [{self.response.status_code}]>"
+
+    @cached_property
+    def payload(self) -> Any:
+        return json.loads(self.response.content)
+
+    def json(self) -> Any:
+        """
+        Возвращает тело ответа в виде Python объекта. Объект общий для всех вызовов, изменять его нельзя.
+
+        :return: Результат разбора JSON тела ответа.
+        """
+        return self.payload
+
+    def parse(self, model: type[Model]) -> Model:
+        """
+        Валидирует тело ответа pydantic моделью. Результат запоминается для каждой модели.
+
+        :param model: Класс pydantic модели ответа.
+        :return: Экземпляр модели.
+        """
+        if model not in self.models:
+            self.models[model] = model.model_validate(self.payload)
+
+        return self.models[model]
+
+
+# Что возвращают методы запросов: APIResponse у синхронного клиента, awaitable с ним у асинхронного
+ResponseT = TypeVar("ResponseT", APIResponse, Awaitable[APIResponse])
+
+
+def api_step(title: str) -> Callable[[Function], Function]:
+    """
+    Allure шаг метода API клиента. Шаг создаётся только у клиентов с allure_steps: метод асинхронного
+    клиента лишь создаёт корутину, и шаг закрылся бы раньше, чем выполнится запрос.
+
+    :param title: Заголовок шага, как в allure.step.
+    :return: Декоратор метода.
+    """
+
+    def decorator(function: Function) -> Function:
+        step_function = allure.step(title)(function)
+
+        @wraps(function)
+        def wrapper(self: "BaseAPIClient", *args, **kwargs):
+            if self.allure_steps:
+                return step_function(self, *args, **kwargs)
+
+            return function(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def close_request_files(files: RequestFiles | None):
+    """
+    Закрывает открытые файлы, переданные в запрос. Файлы отправляются частями при выполнении
+    запроса, поэтому асинхронный клиент может закрыть их только после того, как запрос дождались.
+
+    :param files: Аргумент files запроса.
+    """
+    if not files:
+        return
+
+    for value in files.values() if isinstance(files, Mapping) else (value for _, value in files):
+        file = value[1] if isinstance(value, tuple) else value
+        if hasattr(file, "close"):
+            file.close()
 
-    @allure.step("Make GET request to {url}")
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+
+class BaseAPIClient(Generic[ResponseT]):
+    """
+    Общая часть APIClient и AsyncAPIClient.
+
+    Методы get/post/patch/delete и *_api методы доменных клиентов только описывают запрос, а выполняет
+    его request конкретного клиента: APIClient возвращает APIResponse, AsyncAPIClient — awaitable,
+    который нужно дождаться. Поэтому запросы каждого эндпоинта описываются один раз в базовом доменном
+    клиенте (например, BaseCoursesClient) и используются обоими клиентами.
+    """
+    allure_steps: bool = True  # Создавать ли allure шаги, см. api_step
+
+    def request(self, method: str, url: URL | str, **kwargs) -> ResponseT:
+        """
+        Выполняет запрос.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Остальные аргументы httpx.Client.request или httpx.AsyncClient.request.
+        Файлы из files закрываются после отправки запроса.
+        :return: Объект APIResponse с данными ответа и длительностями фаз.
+        """
+        raise NotImplementedError
+
+    @api_step("Make GET request to {url}")
+    def get(self, url: URL | str, params: QueryParams | None = None) -> ResponseT:
         """
         Выполняет GET-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param params: GET-параметры запроса (например, ?key=value).
-        :return: Объект Response с данными ответа.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.get(url, params=params)
+        return self.request("GET", url, params=params)
 
-    @allure.step("Make POST request to {url}")  # Добавили allure шаг
+    @api_step("Make POST request to {url}")
     def post(
             self,
             url: URL | str,
             json: Any | None = None,
             data: RequestData | None = None,
             files: RequestFiles | None = None
-    ) -> Response:
+    ) -> ResponseT:
         """
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные в формате JSON.
         :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
-        :param files: Файлы для загрузки на сервер.
-        :return: Объект Response с данными ответа.
+        :param files: Файлы для загрузки на сервер. Закрываются после отправки запроса.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.post(url, json=json, data=data, files=files)
+        return self.request("POST", url, json=json, data=data, files=files)
 
-    @allure.step("Make PATCH request to {url}")  # Добавили allure шаг
-    def patch(self, url: URL | str, json: Any | None = None) -> Response:
+    @api_step("Make PATCH request to {url}")
+    def patch(self, url: URL | str, json: Any | None = None) -> ResponseT:
         """
         Выполняет PATCH-запрос (частичное обновление данных).
 
         :param url: URL-адрес эндпоинта.
         :param json: Данные для обновления в формате JSON.
-        :return: Объект Response с данными ответа.
+        :return: Объект APIResponse с данными ответа.
         """
-        return self.client.patch(url, json=json)
+        return self.request("PATCH", url, json=json)
 
-    @allure.step("Make DELETE request to {url}")  # Добавили allure шаг
-    def delete(self, url: URL | str) -> Response:
+    @api_step("Make DELETE request to {url}")
+    def delete(self, url: URL | str) -> ResponseT:
         """
         Выполняет DELETE-запрос (удаление данных).
 
         :param url: URL-адрес эндпоинта.
-        :return: Объект Response с данными ответа.
+        :return: Объект APIResponse с данными ответа.
+        """
+        return self.request("DELETE", url)
+
+
+class APIClient(BaseAPIClient[APIResponse]):
+    def __init__(self, client: Client):
+        self.client = client
+
+    def request(self, method: str, url: URL | str, **kwargs) -> APIResponse:
+        """
+        Выполняет запрос, замеряя длительности его фаз через расширение httpx "trace".
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Остальные аргументы httpx.Client.request.
+        :return: Объект APIResponse с данными ответа и длительностями фаз.
         """
-        return self.client.delete(url)
\ No newline at end of file
+        timer = RequestTimer()
+        try:
+            response = self.client.request(method, url, extensions=timer.extensions(), **kwargs)
+        finally:
+            close_request_files(kwargs.get("files"))
+
+        return APIResponse(response, timings=timer.finish())
+
+
+class AsyncAPIClient(BaseAPIClient[Awaitable[APIResponse]]):
+    """
+    Асинхронный аналог APIClient, работающий поверх httpx.AsyncClient.
+
+    Allure шаги здесь не создаются: allure хранит стек шагов в потоке,
+    и при конкурентном выполнении корутин шаги разных запросов перемешивались бы между собой.
+    """
+    allure_steps = False
+
+    def __init__(self, client: AsyncClient, owns_client: bool = False):
+        """
+        :param client: HTTP-клиент. Клиенты из get_async_* общие для всех экземпляров текущего event loop.
+        :param owns_client: Закрыть ли client при выходе из async with. Включается только для клиента,
+        созданного специально для этого экземпляра.
+        """
+        self.client = client
+        self.owns_client = owns_client
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        # Общий клиент нельзя закрывать: им продолжают пользоваться другие экземпляры
+        if self.owns_client:
+            await self.client.aclose()
+
+    async def request(self, method: str, url: URL | str, **kwargs) -> APIResponse:
+        """
+        Выполняет асинхронный запрос, замеряя длительности его фаз через расширение httpx "trace".
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param kwargs: Остальные аргументы httpx.AsyncClient.request.
+        :return: Объект APIResponse с данными ответа и длительностями фаз.
+        """
+        timer = RequestTimer()
+        try:
+            response = await self.client.request(method, url, extensions=timer.extensions(asynchronous=True), **kwargs)
+        finally:
+            close_request_files(kwargs.get("files"))
+
+        return APIResponse(response, timings=timer.finish())
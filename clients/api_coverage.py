@@ -1,5 +1,242 @@
-from swagger_coverage_tool import SwaggerCoverageTracker
+import atexit
+import collections
+import functools
+import inspect
+import os
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Callable, Awaitable, TYPE_CHECKING
+
+import httpx
+
+from tools.logger import get_logger
+from tools.routes import route_registry
+
+if TYPE_CHECKING:
+    from swagger_coverage_tool import SwaggerCoverageTracker
+    from swagger_coverage_tool.src.tracker.models import EndpointCoverage
+
+logger = get_logger("API_COVERAGE_TRACKER")
+
+# Слушатель получает шаблон маршрута (например, "/api/v1/courses/{course_id}"),
+# полученный ответ и длительность запроса в секундах
+ResponseListener = Callable[[str, httpx.Response, float], None]
+
+# Шаблон маршрута, который сейчас выполняет декорированный метод. Нужен event hooks,
+# которые видят только httpx.Request с уже подставленными в URL идентификаторами
+current_endpoint: ContextVar[str | None] = ContextVar("current_endpoint", default=None)
+
+
+def get_route_template(request: httpx.Request) -> str:
+    """
+    Функция возвращает ключ группировки запроса: шаблон маршрута выполняемого метода API клиента,
+    шаблон из реестра маршрутов или, если путь не сопоставился ни одному шаблону, сам путь URL.
+
+    :param request: Объект запроса HTTPX.
+    :return: Шаблон маршрута, например "/api/v1/courses/{course_id}".
+    """
+    return current_endpoint.get() or route_registry.match(request.url.path) or request.url.path
+
+
+# Ключ агрегированного покрытия: шаблон маршрута, метод, статус-код, имена query параметров,
+# есть ли тело запроса и есть ли тело ответа
+CoverageKey = tuple[str, str, int, tuple[str, ...], bool, bool]
+
+
+class APICoverageTracker:
+    """
+    Трекер покрытия, который умеет оборачивать как синхронные, так и асинхронные методы API клиентов.
+
+    Покрытие не пишется в файл на каждый вызов: ответы сводятся в счётчики по ключу
+    (маршрут, метод, статус, query параметры, наличие тел), которые сохраняются одним пакетом
+    через flush в конце сессии воркера или при выходе из интерпретатора. Пока coverage_enabled
+    выключен (например, на время нагрузки), ответы получают только слушатели.
+
+    Помимо покрытия, трекер передаёт каждый ответ подписанным слушателям вместе
+    с шаблоном маршрута, что позволяет группировать метрики по эндпоинтам.
+
+    swagger_coverage_tool (вместе с requests и своими настройками) импортируется при сохранении
+    покрытия, а не при импорте клиентов, поэтому не замедляет сбор тестов.
+    """
+
+    def __init__(self, service: str):
+        self.service = service
+        self.listeners: list[ResponseListener] = []
+        self.coverage_enabled = True
+        self.reset()
+
+        atexit.register(self.flush)
+        # Дочерний процесс не должен повторно сохранить покрытие, накопленное родителем до fork
+        os.register_at_fork(after_in_child=self.reset)
+
+    def reset(self):
+        self.lock = threading.Lock()
+        self.counters: collections.Counter[CoverageKey] = collections.Counter()
+
+    @functools.cached_property
+    def swagger_tracker(self) -> "SwaggerCoverageTracker":
+        from swagger_coverage_tool import SwaggerCoverageTracker
+
+        return SwaggerCoverageTracker(service=self.service)
+
+    def add_listener(self, listener: ResponseListener):
+        """
+        Подписывает слушателя на все ответы, прошедшие через декорированные методы.
+
+        :param listener: Функция, принимающая шаблон маршрута, объект httpx.Response и длительность запроса.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: ResponseListener):
+        """
+        Отписывает ранее добавленного слушателя.
+
+        :param listener: Функция, переданная ранее в add_listener.
+        """
+        self.listeners.remove(listener)
+
+    @staticmethod
+    def has_body(headers: httpx.Headers) -> bool:
+        return headers.get("content-length", "0") != "0" or "transfer-encoding" in headers
+
+    def get_coverage_key(self, endpoint: str, response: httpx.Response) -> CoverageKey:
+        """
+        Строит ключ покрытия без обращения к request.read(): для потоковой загрузки файла
+        это прочитало бы в память всё тело запроса. Наличие тела определяется по заголовкам.
+
+        :param endpoint: Шаблон маршрута, указанный в декораторе.
+        :param response: Ответ, который вернул декорированный метод.
+        :return: Ключ агрегированного покрытия.
+        """
+        try:
+            is_response_covered = bool(response.content)
+        except httpx.ResponseNotRead:
+            is_response_covered = self.has_body(response.headers)
+
+        request = response.request
+        return (
+            endpoint,
+            request.method,
+            response.status_code,
+            tuple(request.url.params.keys()),
+            self.has_body(request.headers),
+            is_response_covered,
+        )
+
+    def build_endpoint_coverage(self, key: CoverageKey) -> "EndpointCoverage":
+        from swagger_coverage_tool.src.tracker.models import EndpointCoverage
+
+        endpoint, method, status_code, query_parameters, is_request_covered, is_response_covered = key
+        return EndpointCoverage(
+            name=endpoint,
+            method=method,
+            service=self.service,
+            status_code=status_code,
+            query_parameters=list(query_parameters),
+            is_request_covered=is_request_covered,
+            is_response_covered=is_response_covered,
+        )
+
+    def flush(self):
+        """
+        Сохраняет накопленное покрытие в каталог результатов swagger-coverage-tool и обнуляет счётчики.
+
+        На каждый ключ пишется один файл, сколько бы раз он ни встретился. swagger-coverage-tool save-report
+        считает файлы, поэтому total_cases в отчёте — число различных вариантов запросов, а не вызовов.
+        """
+        with self.lock:
+            counters, self.counters = self.counters, collections.Counter()
+
+        if not counters:
+            return
+
+        try:
+            results_dir = self.swagger_tracker.settings.results_dir
+            results_dir.mkdir(parents=True, exist_ok=True)
+
+            for key in counters:
+                coverage = self.build_endpoint_coverage(key)
+                results_dir.joinpath(f"{uuid.uuid4()}.json").write_text(coverage.model_dump_json())
+        except Exception as error:
+            logger.error("Unable to save endpoint coverage: %s", error)
+            return
+
+        logger.info("Saved coverage of %s calls as %s records to %s", counters.total(), len(counters), results_dir)
+
+    def handle_response(self, endpoint: str, response: httpx.Response, started_at: float):
+        """
+        Учитывает покрытие эндпоинта и оповещает слушателей о полученном ответе.
+
+        :param endpoint: Шаблон маршрута, указанный в декораторе.
+        :param response: Ответ, который вернул декорированный метод.
+        :param started_at: Момент вызова метода по time.perf_counter().
+        """
+        if self.coverage_enabled:
+            try:
+                key = self.get_coverage_key(endpoint, response)
+            except Exception as error:
+                logger.error("Unable to build endpoint coverage for HTTPX: %s", error)
+            else:
+                with self.lock:
+                    self.counters[key] += 1
+
+        if not self.listeners:
+            return
+
+        try:
+            elapsed = response.elapsed.total_seconds()
+        except RuntimeError:
+            # Транспорты, отдающие готовое тело (например, httpx.MockTransport), не заполняют elapsed
+            elapsed = time.perf_counter() - started_at
+
+        for listener in self.listeners:
+            listener(endpoint, response, elapsed)
+
+    async def handle_awaitable_response(
+            self,
+            endpoint: str,
+            awaitable: Awaitable[httpx.Response],
+            started_at: float
+    ) -> httpx.Response:
+        token = current_endpoint.set(endpoint)
+        try:
+            response = await awaitable
+        finally:
+            current_endpoint.reset(token)
+
+        self.handle_response(endpoint, response, started_at)
+        return response
+
+    def track_coverage_httpx(self, endpoint: str):
+        route_registry.register(endpoint)  # Шаблон нужен для группировки запросов вне декорированных методов
+
+        def wrapper(func: Callable[..., httpx.Response] | Callable[..., Awaitable[httpx.Response]]):
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def inner(*args, **kwargs):
+                started_at = time.perf_counter()
+                token = current_endpoint.set(endpoint)
+                try:
+                    response = func(*args, **kwargs)
+                finally:
+                    current_endpoint.reset(token)
+
+                # Метод асинхронного клиента возвращает awaitable: запрос выполнится, когда его дождутся
+                if inspect.isawaitable(response):
+                    return self.handle_awaitable_response(endpoint, response, started_at)
+
+                self.handle_response(endpoint, response, started_at)
+                return response
+
+            inner.__signature__ = signature
+            return inner
+
+        return wrapper
+
 
 # Инициализируем трекер для нашего сервиса "api-course"
 # ВАЖНО: 'api-course' должен точно совпадать с ключом `key` в SWAGGER_COVERAGE_SERVICES
-tracker = SwaggerCoverageTracker(service="api-course")
\ No newline at end of file
+tracker = APICoverageTracker(service="api-course")
@@ -1,50 +1,67 @@
-import allure  # Импортируем allure
-from httpx import Response
+from typing import Awaitable
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, APIResponse, AsyncAPIClient, BaseAPIClient, ResponseT, api_step
 from clients.api_coverage import tracker  # Импортируем трекер из api_coverage.py
 from clients.authentication.authentication_schema import LoginRequestSchema, RefreshRequestSchema, LoginResponseSchema
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
 from tools.routes import APIRoutes  # Импортируем enum APIRoutes
 
 
-class AuthenticationClient(APIClient):
+class BaseAuthenticationClient(BaseAPIClient[ResponseT]):
     """
-    Клиент для работы с /api/v1/authentication
+    Запросы к /api/v1/authentication, общие для AuthenticationClient и AsyncAuthenticationClient
     """
 
-    @allure.step("Authenticate user")  # Добавили allure шаг
+    @api_step("Authenticate user")
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
-    def login_api(self, request: LoginRequestSchema) -> Response:
+    def login_api(self, request: LoginRequestSchema) -> ResponseT:
         """
         Метод выполняет аутентификацию пользователя.
         :param request: Словарь с email и password.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/login",
             json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Refresh authentication token")  # Добавили allure шаг
+    @api_step("Refresh authentication token")
     @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
-    def refresh_api(self, request: RefreshRequestSchema) -> Response:
+    def refresh_api(self, request: RefreshRequestSchema) -> ResponseT:
         """
         Метод обновляет токен авторизации.
 
         :param request: Словарь с refreshToken.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.post(
             f"{APIRoutes.AUTHENTICATION}/refresh",
             json=request.model_dump(by_alias=True)
         )
 
+
+class AuthenticationClient(BaseAuthenticationClient[APIResponse], APIClient):
+    """
+    Клиент для работы с /api/v1/authentication
+    """
+
     # Теперь используем pydantic-модель для аннотации
     def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
         response = self.login_api(request)
         # Инициализируем модель через валидацию JSON строки
-        return LoginResponseSchema.model_validate_json(response.text)
+        return response.parse(LoginResponseSchema)
+
+    def refresh(self, request: RefreshRequestSchema) -> LoginResponseSchema:
+        """
+        Метод обновляет токен авторизации с валидацией ответа.
+
+        :param request: Модель запроса с refreshToken.
+        :return: Валидированная модель ответа с новой парой токенов.
+        :raises HTTPStatusError: Если сервер отклонил refresh токен.
+        """
+        response = self.refresh_api(request)
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(LoginResponseSchema)
 
 
 def get_authentication_client() -> AuthenticationClient:
@@ -53,4 +70,28 @@ def get_authentication_client() -> AuthenticationClient:
 
     :return: Готовый к использованию AuthenticationClient.
     """
-    return AuthenticationClient(client=get_public_http_client())
\ No newline at end of file
+    return AuthenticationClient(client=get_public_http_client())
+
+
+class AsyncAuthenticationClient(BaseAuthenticationClient[Awaitable[APIResponse]], AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/authentication. Типизированные методы повторяют AuthenticationClient.
+    """
+
+    async def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+        response = await self.login_api(request)
+        return response.parse(LoginResponseSchema)
+
+    async def refresh(self, request: RefreshRequestSchema) -> LoginResponseSchema:
+        response = await self.refresh_api(request)
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(LoginResponseSchema)
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создаёт экземпляр AsyncAuthenticationClient поверх общего для event loop HTTP-клиента.
+
+    :return: Готовый к использованию AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from tools.fakers import fake
 
 # Добавили суффикс Schema вместо Dict
@@ -16,8 +16,8 @@ class LoginRequestSchema(BaseModel):  # Наследуем от BaseModel вме
     """
     Описание структуры запроса на аутентификацию.
     """
-    email: str = Field(default_factory=fake.email())
-    password: str = Field(default_factory=fake.password())
+    email: str = Field(default_factory=fake.email)
+    password: str = Field(default_factory=fake.password)
 
 
 # Добавили суффикс Schema вместо Dict
@@ -33,4 +33,6 @@ class RefreshRequestSchema(BaseModel):  # Наследуем от BaseModel вм
     """
     Описание структуры запроса для обновления токена.
     """
+    model_config = ConfigDict(populate_by_name=True)
+
     refresh_token: str = Field(alias="refreshToken")  # Использовали alise
\ No newline at end of file
@@ -0,0 +1,304 @@
+import asyncio
+import base64
+import contextlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Generator, Callable, Hashable
+from weakref import WeakKeyDictionary
+
+from httpx import AsyncClient, Auth, Client, Request, Response, HTTPStatusError, codes
+
+from clients.authentication.authentication_client import get_authentication_client, get_async_authentication_client
+from clients.authentication.authentication_schema import (
+    LoginRequestSchema,
+    RefreshRequestSchema,
+    TokenSchema
+)
+from tools.logger import get_logger
+
+logger = get_logger("AUTHENTICATION_SESSION")
+
+
+def get_token_expiry(token: str) -> float | None:
+    """
+    Извлекает время истечения (claim "exp") из JWT без проверки подписи.
+
+    :param token: JWT токен.
+    :return: Unix-время истечения токена или None, если токен не является JWT с полем exp.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)  # Восстанавливаем отброшенный base64url паддинг
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class AuthenticationSession(Auth):
+    """
+    Bearer-авторизация пользователя, которая сама следит за сроком жизни access токена.
+
+    Перед каждым запросом проверяет exp токена и, если до истечения осталось меньше
+    token_refresh_leeway секунд, обновляет пару токенов через AuthenticationClient.refresh.
+    Если сервер всё же ответил 401, токен обновляется и запрос повторяется один раз.
+    К повторному логину сессия прибегает, только если refresh токен отклонён.
+
+    В httpx.AsyncClient сессия работает так же, но логинится и обновляет токен через
+    AsyncAuthenticationClient. Одна сессия пользователя общая для его синхронного клиента и асинхронных
+    клиентов всех event loop, поэтому токен, полученный одним из них, используют и остальные.
+    """
+
+    def __init__(self, email: str, password: str, token_refresh_leeway: float):
+        self.email = email
+        self.password = password
+        self.token_refresh_leeway = token_refresh_leeway
+
+        self.lock = threading.Lock()
+        # asyncio.Lock привязывается к event loop, поэтому у каждого loop своя
+        self.async_locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
+        self.token: TokenSchema | None = None
+        self.access_token_expires_at: float | None = None
+        self.refresh_token_expires_at: float | None = None
+
+    def set_token(self, token: TokenSchema):
+        self.token = token
+        self.access_token_expires_at = get_token_expiry(token.access_token)
+        self.refresh_token_expires_at = get_token_expiry(token.refresh_token)
+
+    def login(self):
+        request = LoginRequestSchema(email=self.email, password=self.password)
+        self.set_token(get_authentication_client().login(request).token)
+
+    def refresh(self):
+        if self.token is None or self.is_expired(self.refresh_token_expires_at):
+            self.login()
+            return
+
+        try:
+            request = RefreshRequestSchema(refresh_token=self.token.refresh_token)
+            self.set_token(get_authentication_client().refresh(request).token)
+        except HTTPStatusError as error:
+            logger.warning("Unable to refresh token for %s, logging in again: %s", self.email, error)
+            self.login()
+
+    def is_expired(self, expires_at: float | None) -> bool:
+        return expires_at is not None and expires_at - self.token_refresh_leeway <= time.time()
+
+    @property
+    def is_alive(self) -> bool:
+        """
+        Сессию можно продолжать без повторного логина, пока действует refresh токен.
+        """
+        return self.token is not None and not self.is_expired(self.refresh_token_expires_at)
+
+    def get_access_token(self) -> str:
+        with self.lock:
+            if self.token is None:
+                self.login()
+            elif self.is_expired(self.access_token_expires_at):
+                self.refresh()
+
+            return self.token.access_token
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        access_token = self.get_access_token()
+        request.headers["Authorization"] = f"Bearer {access_token}"
+        response = yield request
+
+        if response.status_code == codes.UNAUTHORIZED:
+            with self.lock:
+                # Токен мог уже обновить другой поток, пока этот ждал ответа
+                if self.token.access_token == access_token:
+                    self.refresh()
+                access_token = self.token.access_token
+
+            request.headers["Authorization"] = f"Bearer {access_token}"
+            yield request
+
+    async def async_login(self):
+        request = LoginRequestSchema(email=self.email, password=self.password)
+        self.set_token((await get_async_authentication_client().login(request)).token)
+
+    async def async_refresh(self):
+        if self.token is None or self.is_expired(self.refresh_token_expires_at):
+            await self.async_login()
+            return
+
+        try:
+            request = RefreshRequestSchema(refresh_token=self.token.refresh_token)
+            self.set_token((await get_async_authentication_client().refresh(request)).token)
+        except HTTPStatusError as error:
+            logger.warning("Unable to refresh token for %s, logging in again: %s", self.email, error)
+            await self.async_login()
+
+    @contextlib.asynccontextmanager
+    async def async_locked(self) -> AsyncIterator[None]:
+        """
+        Захватывает блокировку сессии из корутины, не блокируя event loop.
+
+        Корутины одного loop сначала ждут друг друга на asyncio.Lock этого loop, поэтому threading.Lock,
+        общий с синхронным клиентом и другими loop, ждёт в отдельном потоке не больше одной корутины на loop.
+        """
+        loop_lock = self.async_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+        async with loop_lock:
+            if not self.lock.acquire(blocking=False):
+                acquire = asyncio.ensure_future(asyncio.to_thread(self.lock.acquire))
+                try:
+                    await asyncio.shield(acquire)
+                except asyncio.CancelledError:
+                    # Поток всё равно захватит блокировку, поэтому её нужно отпустить за отменённую корутину
+                    acquire.add_done_callback(lambda _: self.lock.release())
+                    raise
+            try:
+                yield
+            finally:
+                self.lock.release()
+
+    async def async_get_access_token(self) -> str:
+        async with self.async_locked():
+            if self.token is None:
+                await self.async_login()
+            elif self.is_expired(self.access_token_expires_at):
+                await self.async_refresh()
+
+            return self.token.access_token
+
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        access_token = await self.async_get_access_token()
+        request.headers["Authorization"] = f"Bearer {access_token}"
+        response = yield request
+
+        if response.status_code == codes.UNAUTHORIZED:
+            async with self.async_locked():
+                # Токен мог уже обновить другой поток или корутина, пока эта ждала ответа
+                if self.token.access_token == access_token:
+                    await self.async_refresh()
+                access_token = self.token.access_token
+
+            request.headers["Authorization"] = f"Bearer {access_token}"
+            yield request
+
+
+class AuthenticationSessionCache:
+    """
+    LRU-кеш авторизованных HTTP-клиентов ограниченного размера.
+
+    При вытеснении клиент закрывается вместе со своим пулом соединений, поэтому число
+    открытых сокетов не растёт с количеством созданных за прогон пользователей.
+    Клиенты, чей refresh токен истёк, считаются устаревшими и пересоздаются.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Hashable, tuple[Client, AuthenticationSession]] = OrderedDict()
+
+    def get_or_create(
+            self,
+            key: Hashable,
+            factory: Callable[[], tuple[Client, AuthenticationSession]]
+    ) -> Client:
+        """
+        Возвращает клиент из кеша или создаёт его через factory.
+
+        :param key: Ключ кеша (например, AuthenticationUserSchema).
+        :param factory: Функция, создающая клиент и его сессию авторизации.
+        :return: Авторизованный httpx.Client.
+        """
+        with self.lock:
+            if entry := self.entries.get(key):
+                client, session = entry
+                if session.is_alive and not client.is_closed:
+                    self.entries.move_to_end(key)
+                    return client
+
+                del self.entries[key]
+                client.close()
+
+        client, session = factory()
+
+        with self.lock:
+            self.entries[key] = (client, session)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                _, (evicted_client, _) = self.entries.popitem(last=False)
+                evicted_client.close()
+
+        return client
+
+    def clear(self):
+        """
+        Закрывает и удаляет из кеша все клиенты.
+        """
+        with self.lock:
+            for client, _ in self.entries.values():
+                client.close()
+
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class AsyncAuthenticationSessionCache:
+    """
+    LRU-кеш авторизованных httpx.AsyncClient ограниченного размера для одного event loop.
+
+    Работает как AuthenticationSessionCache, но клиенты создаются и закрываются корутинами.
+    Кеш используется только из потока своего event loop, поэтому блокировки не нужны.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, tuple[AsyncClient, AuthenticationSession]] = OrderedDict()
+
+    async def get_or_create(
+            self,
+            key: Hashable,
+            factory: Callable[[], Awaitable[tuple[AsyncClient, AuthenticationSession]]]
+    ) -> AsyncClient:
+        """
+        Возвращает клиент из кеша или создаёт его через factory.
+
+        :param key: Ключ кеша (например, AuthenticationUserSchema).
+        :param factory: Корутинная функция, создающая клиент и его сессию авторизации.
+        :return: Авторизованный httpx.AsyncClient.
+        """
+        if entry := self.entries.get(key):
+            client, session = entry
+            if session.is_alive and not client.is_closed:
+                self.entries.move_to_end(key)
+                return client
+
+            del self.entries[key]
+            await client.aclose()
+
+        client, session = await factory()
+
+        if entry := self.entries.get(key):
+            # Пока шёл логин, клиент для этого ключа успела создать другая корутина
+            await client.aclose()
+            return entry[0]
+
+        self.entries[key] = (client, session)
+        while len(self.entries) > self.maxsize:
+            _, (evicted_client, _) = self.entries.popitem(last=False)
+            await evicted_client.aclose()
+
+        return client
+
+    async def clear(self):
+        """
+        Закрывает и удаляет из кеша все клиенты.
+        """
+        entries = list(self.entries.values())
+        self.entries.clear()
+
+        for client, _ in entries:
+            await client.aclose()
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -1,7 +1,6 @@
-import allure  # Импортируем allure
-from httpx import Response
+from typing import Awaitable
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, APIResponse, AsyncAPIClient, BaseAPIClient, ResponseT, api_step
 from clients.api_coverage import tracker  # Импортируем трекер
 from clients.courses.courses_schema import (
     GetCoursesQuerySchema,
@@ -12,70 +11,80 @@ from clients.courses.courses_schema import (
     GetCourseQuerySchema,
     GetCourseResponseSchema
 )
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.private_http_builder import (
+    get_private_http_client,
+    get_async_private_http_client,
+    AuthenticationUserSchema
+)
 from tools.routes import APIRoutes  # Импортируем enum APIRoutes
 
 
-class CoursesClient(APIClient):
+class BaseCoursesClient(BaseAPIClient[ResponseT]):
     """
-    Клиент для работы с /api/v1/courses
+    Запросы к /api/v1/courses, общие для CoursesClient и AsyncCoursesClient
     """
 
-    @allure.step("Get courses")  # Добавили allure шаг
+    @api_step("Get courses")
     @tracker.track_coverage_httpx(APIRoutes.COURSES)
-    def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
+    def get_courses_api(self, query: GetCoursesQuerySchema) -> ResponseT:
         """
         Метод получения списка курсов.
         :param query: Модель запроса с userId.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True))
 
-    @allure.step("Get course by id {course_id}")  # Добавили allure шаг
+    @api_step("Get course by id {course_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
-    def get_course_api(self, course_id: str) -> Response:
+    def get_course_api(self, course_id: str) -> ResponseT:
         """
         Метод получения курса.
         :param course_id: Идентификатор курса.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.COURSES}/{course_id}")
 
-    @allure.step("Create course")  # Добавили allure шаг
+    @api_step("Create course")
     @tracker.track_coverage_httpx(APIRoutes.COURSES)
-    def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+    def create_course_api(self, request: CreateCourseRequestSchema) -> ResponseT:
         """
         Метод создания курса.
         :param request: Модель запроса с title, maxScore, minScore, description,
         estimatedTime, previewFileId, createdByUserId.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True))
 
-    @allure.step("Update course by id {course_id}")  # Добавили allure шаг
+    @api_step("Update course by id {course_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
-    def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> Response:
+    def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> ResponseT:
         """
         Метод обновления курса.
         :param course_id: Идентификатор курса.
         :param request: Модель запроса с title, maxScore, minScore, description, estimatedTime.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.patch(
             f"{APIRoutes.COURSES}/{course_id}",
             json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Delete course by id {course_id}")  # Добавили allure шаг
+    @api_step("Delete course by id {course_id}")
     @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
-    def delete_course_api(self, course_id: str) -> Response:
+    def delete_course_api(self, course_id: str) -> ResponseT:
         """
         Метод удаления курса.
         :param course_id: Идентификатор курса.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.COURSES}/{course_id}")
 
+
+class CoursesClient(BaseCoursesClient[APIResponse], APIClient):
+    """
+    Клиент для работы с /api/v1/courses
+    """
+
     def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
         """
         Метод создания курса с валидацией ответа.
@@ -86,7 +95,7 @@ class CoursesClient(APIClient):
         """
         response = self.create_course_api(request)
         response.raise_for_status()  # Проверка на ошибки HTTP
-        return CreateCourseResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateCourseResponseSchema)
 
     def get_course(self, query: GetCourseQuerySchema) -> GetCourseResponseSchema:
         """
@@ -97,7 +106,7 @@ class CoursesClient(APIClient):
         """
         response = self.get_course_api(query.model_dump(by_alias=True)["id"])
         response.raise_for_status()  # Проверка на ошибки HTTP
-        return GetCourseResponseSchema.model_validate_json(response.text)
+        return response.parse(GetCourseResponseSchema)
 
     def update_course(self, course_id: str, request: UpdateCourseRequestSchema) -> UpdateCourseResponseSchema:
         """
@@ -109,7 +118,7 @@ class CoursesClient(APIClient):
         """
         response = self.update_course_api(course_id, request)
         response.raise_for_status()  # Проверка на ошибки HTTP
-        return UpdateCourseResponseSchema.model_validate_json(response.text)
+        return response.parse(UpdateCourseResponseSchema)
 
 
 def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
@@ -117,4 +126,33 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     Функция создаёт экземпляр CoursesClient с уже настроенным HTTP-клиентом.
     :return: Готовый к использованию CoursesClient.
     """
-    return CoursesClient(client=get_private_http_client(user))
\ No newline at end of file
+    return CoursesClient(client=get_private_http_client(user))
+
+
+class AsyncCoursesClient(BaseCoursesClient[Awaitable[APIResponse]], AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/courses. Типизированные методы повторяют CoursesClient.
+    """
+
+    async def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
+        response = await self.create_course_api(request)
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(CreateCourseResponseSchema)
+
+    async def get_course(self, query: GetCourseQuerySchema) -> GetCourseResponseSchema:
+        response = await self.get_course_api(query.model_dump(by_alias=True)["id"])
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(GetCourseResponseSchema)
+
+    async def update_course(self, course_id: str, request: UpdateCourseRequestSchema) -> UpdateCourseResponseSchema:
+        response = await self.update_course_api(course_id, request)
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(UpdateCourseResponseSchema)
+
+
+async def get_async_courses_client(user: AuthenticationUserSchema) -> AsyncCoursesClient:
+    """
+    Функция создаёт экземпляр AsyncCoursesClient с уже авторизованным HTTP-клиентом.
+    :return: Готовый к использованию AsyncCoursesClient.
+    """
+    return AsyncCoursesClient(client=await get_async_private_http_client(user))
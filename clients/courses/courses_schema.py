@@ -38,7 +38,7 @@ class CreateCourseRequestSchema(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     # Добавили генерацию случайного заголовка
-    title: str = Field(default_factory=fake.sentence)
+    title: str = Field(default_factory=fake.title)
     # Добавили генерацию случайного максимального балла
     max_score: int = Field(alias="maxScore", default_factory=fake.max_score)
     # Добавили генерацию случайного минимального балла
@@ -68,7 +68,7 @@ class UpdateCourseRequestSchema(BaseModel):
     """
     model_config = ConfigDict(populate_by_name=True)
 
-    title: str | None = Field(alias="title", default_factory=fake.sentence)
+    title: str | None = Field(alias="title", default_factory=fake.title)
     max_score: int | None = Field(alias="maxScore", default_factory=fake.max_score)
     min_score: int | None = Field(alias="minScore", default_factory=fake.min_score)
     description: str | None = Field(default_factory=fake.text)
@@ -1,23 +1,87 @@
+import contextlib
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
 import allure
 from httpx import Request, Response
 
+from clients.api_coverage import get_route_template
+from config import settings
 from tools.http.curl import make_curl_from_request
+from tools.http.timings import RequestTimer, RequestTimingsSchema
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
+from tools.trace.sink import write_trace_record
 
 # Инициализируем логгер один раз на весь модуль
 logger = get_logger("HTTP_CLIENT")
 
+# Запросы текущего теста, для которых cURL ещё не сформирован. Храним сами объекты httpx.Request:
+# это ссылка без копирования заголовков и тела, а текст команды строится только при необходимости.
+# Буфер свой у каждого теста (см. collect_pending_curl_requests), поэтому запросы, которые в это
+# время выполняют другие потоки, в него не попадают. Вне теста буфера нет и запросы не запоминаются
+pending_curl_requests: ContextVar[deque[Request] | None] = ContextVar("pending_curl_requests", default=None)
 
-def curl_event_hook(request: Request):
+
+@contextlib.contextmanager
+def collect_pending_curl_requests() -> Iterator[None]:
     """
-    Event hook для автоматического прикрепления cURL команды к Allure отчету.
+    Создаёт буфер отложенных запросов на время выполнения теста.
+    """
+    token = pending_curl_requests.set(deque(maxlen=settings.curl_attachments.max_pending_requests))
+    try:
+        yield
+    finally:
+        pending_curl_requests.reset(token)
+
+
+def attach_curl_command(request: Request):
+    """
+    Формирует cURL команду для запроса и прикрепляет её к Allure отчету.
 
     :param request: HTTP-запрос, переданный в `httpx` клиент.
     """
-    curl_command = make_curl_from_request(request)
+    curl_command = make_curl_from_request(request, max_body_size=settings.curl_attachments.max_body_size)
     allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
 
 
+def attach_pending_curl_commands():
+    """
+    Прикрепляет к Allure отчету cURL команды всех отложенных запросов текущего теста.
+    Вызывается, когда тест упал.
+    """
+    requests = pending_curl_requests.get()
+    if requests is None:
+        return
+
+    while requests:
+        attach_curl_command(requests.popleft())
+
+
+def curl_event_hook(request: Request):
+    """
+    Event hook для прикрепления cURL команды к Allure отчету согласно CURL_ATTACHMENTS.POLICY.
+
+    В режимах on_failure и sampled запрос только запоминается, а команда формируется,
+    если тест упадёт (см. attach_pending_curl_commands).
+
+    :param request: HTTP-запрос, переданный в `httpx` клиент.
+    """
+    policy = settings.curl_attachments.policy
+
+    if policy == "off":
+        return
+
+    if policy == "always" or (policy == "sampled" and random.random() < settings.curl_attachments.sample_rate):
+        attach_curl_command(request)
+        return
+
+    if (requests := pending_curl_requests.get()) is not None:
+        requests.append(request)
+
+
 def log_request_event_hook(request: Request):  # Создаем event hook для логирования запроса
     """
     Логирует информацию об отправленном HTTP-запросе.
@@ -25,7 +89,7 @@ def log_request_event_hook(request: Request):  # Создаем event hook дл
     :param request: Объект запроса HTTPX.
     """
     # Пишем в лог информационное сообщение о запроса
-    logger.info(f'Make {request.method} request to {request.url}')
+    logger.info('Make %s request to %s (route %s)', request.method, request.url, get_route_template(request))
 
 
 def log_response_event_hook(response: Response):  # Создаем event hook для логирования ответа
@@ -36,5 +100,132 @@ def log_response_event_hook(response: Response):  # Создаем event hook д
     """
     # Пишем в лог информационное сообщение о полученном ответе
     logger.info(
-        f"Got response {response.status_code} {response.reason_phrase} from {response.url}"
-    )
\ No newline at end of file
+        "Got response %s %s from %s (route %s)",
+        response.status_code,
+        response.reason_phrase,
+        response.url,
+        get_route_template(response.request)
+    )
+
+
+def get_content_length(headers) -> int | None:
+    content_length = headers.get("content-length")
+    return int(content_length) if content_length is not None else None
+
+
+def trace_request_event_hook(request: Request):
+    """
+    Запоминает момент отправки запроса для trace_response_event_hook.
+
+    :param request: Объект запроса HTTPX.
+    """
+    request.extensions["trace_started_at"] = (time.time(), time.perf_counter())
+
+
+def trace_response_event_hook(response: Response):
+    """
+    Записывает обмен запросом и ответом в JSONL файл трассировки воркера (см. tools.trace).
+
+    Фазы соединения и отправки берутся из RequestTimer, который APIClient передаёт в extensions запроса.
+    Если таймера нет или транспорт не сообщает события httpcore (например, httpx.MockTransport),
+    время до первого байта считается от запуска trace_request_event_hook.
+
+    :param response: Объект ответа HTTPX. Хук вызывается до чтения тела ответа.
+    """
+    request = response.request
+    started_at, started_counter = request.extensions.get("trace_started_at", (time.time(), time.perf_counter()))
+    elapsed_ms = (time.perf_counter() - started_counter) * 1000
+
+    timer: RequestTimer | None = request.extensions.get("timer")
+    timings = timer.finish() if timer else RequestTimingsSchema(total_ms=elapsed_ms)
+    if timings.ttfb_ms is None:
+        timings.ttfb_ms = elapsed_ms
+
+    write_trace_record(
+        method=request.method,
+        route=get_route_template(request),
+        status_code=response.status_code,
+        request_size=get_content_length(request.headers),
+        response_size=get_content_length(response.headers),
+        started_at=started_at,
+        timings=timings
+    )
+
+
+def build_event_hooks() -> dict[str, list[Callable]]:
+    """
+    Собирает event hooks для httpx.Client. Хуки трассировки добавляются, только если TRACE.ENABLED.
+
+    :return: Словарь хуков для аргумента event_hooks.
+    """
+    request_hooks: list[Callable] = [curl_event_hook, log_request_event_hook]  # Логируем исходящие HTTP-запросы
+    response_hooks: list[Callable] = [log_response_event_hook]  # Логируем полученные HTTP-ответы
+
+    if settings.trace.enabled:
+        request_hooks.append(trace_request_event_hook)
+        response_hooks.append(trace_response_event_hook)
+
+    return {"request": request_hooks, "response": response_hooks}
+
+
+# Асинхронные версии хуков для httpx.AsyncClient: он ожидает, что каждый хук является корутиной
+
+async def async_curl_event_hook(request: Request):
+    """
+    Асинхронная версия curl_event_hook для httpx.AsyncClient.
+
+    :param request: HTTP-запрос, переданный в `httpx` клиент.
+    """
+    curl_event_hook(request)
+
+
+async def async_log_request_event_hook(request: Request):
+    """
+    Асинхронная версия log_request_event_hook для httpx.AsyncClient.
+
+    :param request: Объект запроса HTTPX.
+    """
+    log_request_event_hook(request)
+
+
+async def async_log_response_event_hook(response: Response):
+    """
+    Асинхронная версия log_response_event_hook для httpx.AsyncClient.
+
+    :param response: Объект ответа HTTPX.
+    """
+    log_response_event_hook(response)
+
+
+async def async_trace_request_event_hook(request: Request):
+    """
+    Асинхронная версия trace_request_event_hook для httpx.AsyncClient.
+
+    :param request: Объект запроса HTTPX.
+    """
+    trace_request_event_hook(request)
+
+
+async def async_trace_response_event_hook(response: Response):
+    """
+    Асинхронная версия trace_response_event_hook для httpx.AsyncClient.
+
+    :param response: Объект ответа HTTPX.
+    """
+    trace_response_event_hook(response)
+
+
+def build_async_event_hooks() -> dict[str, list[Callable]]:
+    """
+    Собирает event hooks для httpx.AsyncClient. Хуки трассировки добавляются, только если TRACE.ENABLED.
+
+    :return: Словарь хуков для аргумента event_hooks.
+    """
+    request_hooks: list[Callable] = [async_curl_event_hook, async_log_request_event_hook]
+    response_hooks: list[Callable] = [async_log_response_event_hook]
+
+    if settings.trace.enabled:
+        request_hooks.append(async_trace_request_event_hook)
+        response_hooks.append(async_trace_response_event_hook)
+
+    return {"request": request_hooks, "response": response_hooks}
\ No newline at end of file
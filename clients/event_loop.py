@@ -0,0 +1,89 @@
+import asyncio
+import contextvars
+import os
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from clients.private_http_builder import close_async_private_http_clients
+from clients.public_http_builder import close_async_public_http_client
+
+Result = TypeVar("Result")
+
+# Общий event loop процесса и поток, в котором он работает
+_event_loop: asyncio.AbstractEventLoop | None = None
+_event_loop_thread: threading.Thread | None = None
+_event_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Функция возвращает общий event loop процесса, работающий в фоновом потоке.
+
+    Loop создаётся при первом обращении и живёт до close_event_loop, поэтому асинхронные
+    клиенты из get_async_* (и их авторизация) переиспользуются между вызовами run_coroutine.
+
+    :return: Запущенный event loop.
+    """
+    global _event_loop, _event_loop_thread
+
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            _event_loop_thread = threading.Thread(target=_event_loop.run_forever, name="event-loop", daemon=True)
+            _event_loop_thread.start()
+
+        return _event_loop
+
+
+async def run_in_context(coroutine: Coroutine[Any, Any, Result], context: contextvars.Context) -> Result:
+    return await asyncio.get_running_loop().create_task(coroutine, context=context)
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, Result]) -> Result:
+    """
+    Выполняет корутину в общем event loop процесса и ждёт её результат.
+
+    Корутина выполняется в копии контекста вызывающего потока, поэтому её запросы попадают в буфер
+    cURL команд и трассировку того теста, который её запустил.
+
+    :param coroutine: Корутина, например создание пачки сущностей через asyncio.gather.
+    :return: Результат корутины. Исключение корутины пробрасывается вызывающему.
+    """
+    context = contextvars.copy_context()
+    return asyncio.run_coroutine_threadsafe(run_in_context(coroutine, context), get_event_loop()).result()
+
+
+async def close_async_http_clients():
+    await close_async_private_http_clients()
+    await close_async_public_http_client()
+
+
+def close_event_loop():
+    """
+    Функция закрывает асинхронные клиенты общего event loop и останавливает его.
+    Следующий вызов get_event_loop создаст новый loop.
+    """
+    global _event_loop, _event_loop_thread
+
+    with _event_loop_lock:
+        loop, thread = _event_loop, _event_loop_thread
+        _event_loop = _event_loop_thread = None
+
+    if loop is None:
+        return
+
+    asyncio.run_coroutine_threadsafe(close_async_http_clients(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def reset_event_loop():
+    global _event_loop, _event_loop_thread, _event_loop_lock
+
+    # Поток loop не переживает fork: дочерний процесс создаст свой loop при первом обращении
+    _event_loop = _event_loop_thread = None
+    _event_loop_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=reset_event_loop)
@@ -1,90 +1,99 @@
-import allure
-from httpx import Response
+from typing import Awaitable
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, APIResponse, AsyncAPIClient, BaseAPIClient, ResponseT, api_step
 from clients.api_coverage import tracker
 from clients.exercises.exercises_schema import GetExercisesQuerySchema, CreateExerciseRequestSchema, \
     UpdateExerciseRequestSchema, GetExercisesResponseSchema, GetExerciseResponseSchema, CreateExerciseResponseSchema, \
     UpdateExerciseResponseSchema
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.private_http_builder import (
+    get_private_http_client,
+    get_async_private_http_client,
+    AuthenticationUserSchema
+)
 from tools.routes import APIRoutes
 
 
-class ExercisesClient(APIClient):
+class BaseExercisesClient(BaseAPIClient[ResponseT]):
     """
-    Клиент для работы с /api/v1/exercises
+    Запросы к /api/v1/exercises, общие для ExercisesClient и AsyncExercisesClient
     """
 
-    @allure.step("Get exercises")
+    @api_step("Get exercises")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
-    def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
+    def get_exercises_api(self, query: GetExercisesQuerySchema) -> ResponseT:
         """
         Метод получения списка заданий.
 
         :param query: Словарь с courseId.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(APIRoutes.EXERCISES, params=query.model_dump(by_alias=True))
 
-    @allure.step("Get exercise by id {exercise_id}")
+    @api_step("Get exercise by id {exercise_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.EXERCISES}/{{exercise_id}}')
-    def get_exercise_api(self, exercise_id: str) -> Response:
+    def get_exercise_api(self, exercise_id: str) -> ResponseT:
         """
         Метод получения задания.
 
         :param exercise_id: Идентификатор задания.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
-    @allure.step("Create exercise")
+    @api_step("Create exercise")
     @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
-    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+    def create_exercise_api(self, request: CreateExerciseRequestSchema) -> ResponseT:
         """
         Метод создания задания.
 
         :param request: Словарь с title, courseId, maxScore, minScore, orderIndex, description, estimatedTime.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.post(APIRoutes.EXERCISES, json=request.model_dump(by_alias=True))
 
-    @allure.step("Update exercise by id {exercise_id}")
+    @api_step("Update exercise by id {exercise_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.EXERCISES}/{{exercise_id}}')
-    def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> Response:
+    def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> ResponseT:
         """
         Метод обновления задания.
 
         :param exercise_id: Идентификатор задания.
         :param request: Словарь с title, maxScore, minScore, orderIndex, description, estimatedTime.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.patch(
             f"{APIRoutes.EXERCISES}/{exercise_id}",
             json=request.model_dump(by_alias=True)
         )
 
-    @allure.step("Delete exercise by id {exercise_id}")
+    @api_step("Delete exercise by id {exercise_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.EXERCISES}/{{exercise_id}}')
-    def delete_exercise_api(self, exercise_id: str) -> Response:
+    def delete_exercise_api(self, exercise_id: str) -> ResponseT:
         """
         Метод удаления задания.
 
         :param exercise_id: Идентификатор задания.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
 
+
+class ExercisesClient(BaseExercisesClient[APIResponse], APIClient):
+    """
+    Клиент для работы с /api/v1/exercises
+    """
+
     def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
         response = self.get_exercises_api(query)
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        return response.parse(GetExercisesResponseSchema)
 
     def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
         response = self.get_exercise_api(exercise_id)
-        return GetExerciseResponseSchema.model_validate_json(response.text)
+        return response.parse(GetExerciseResponseSchema)
 
     def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
         response = self.create_exercise_api(request)
-        return CreateExerciseResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateExerciseResponseSchema)
 
     def update_exercise(
             self,
@@ -92,7 +101,7 @@ class ExercisesClient(APIClient):
             request: UpdateExerciseRequestSchema
     ) -> UpdateExerciseResponseSchema:
         response = self.update_exercise_api(exercise_id, request)
-        return UpdateExerciseResponseSchema.model_validate_json(response.text)
+        return response.parse(UpdateExerciseResponseSchema)
 
 
 def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
@@ -101,4 +110,39 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
 
     :return: Готовый к использованию ExercisesClient.
     """
-    return ExercisesClient(client=get_private_http_client(user))
\ No newline at end of file
+    return ExercisesClient(client=get_private_http_client(user))
+
+
+class AsyncExercisesClient(BaseExercisesClient[Awaitable[APIResponse]], AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/exercises. Типизированные методы повторяют ExercisesClient.
+    """
+
+    async def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
+        response = await self.get_exercises_api(query)
+        return response.parse(GetExercisesResponseSchema)
+
+    async def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
+        response = await self.get_exercise_api(exercise_id)
+        return response.parse(GetExerciseResponseSchema)
+
+    async def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
+        response = await self.create_exercise_api(request)
+        return response.parse(CreateExerciseResponseSchema)
+
+    async def update_exercise(
+            self,
+            exercise_id: str,
+            request: UpdateExerciseRequestSchema
+    ) -> UpdateExerciseResponseSchema:
+        response = await self.update_exercise_api(exercise_id, request)
+        return response.parse(UpdateExerciseResponseSchema)
+
+
+async def get_async_exercises_client(user: AuthenticationUserSchema) -> AsyncExercisesClient:
+    """
+    Функция создаёт экземпляр AsyncExercisesClient с уже авторизованным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncExercisesClient.
+    """
+    return AsyncExercisesClient(client=await get_async_private_http_client(user))
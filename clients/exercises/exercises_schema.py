@@ -43,7 +43,7 @@ class CreateExerciseRequestSchema(BaseModel):
     """
     model_config = ConfigDict(populate_by_name=True)
 
-    title: str = Field(default_factory=fake.sentence)
+    title: str = Field(default_factory=fake.title)
     course_id: str = Field(alias="courseId", default_factory=fake.uuid4)
     max_score: int = Field(alias="maxScore", default_factory=fake.max_score)
     min_score: int = Field(alias="minScore", default_factory=fake.min_score)
@@ -67,7 +67,7 @@ class UpdateExerciseRequestSchema(BaseModel):
     """
     model_config = ConfigDict(populate_by_name=True)
 
-    title: str | None = Field(alias="title", default_factory=fake.sentence)
+    title: str | None = Field(alias="title", default_factory=fake.title)
     max_score: int | None = Field(alias="maxScore", default_factory=fake.max_score)
     min_score: int | None = Field(alias="minScore", default_factory=fake.min_score)
     order_index: int | None = Field(alias="orderIndex", default_factory=fake.integer)
@@ -1,58 +1,121 @@
+import hashlib
+import time
+from typing import Awaitable, BinaryIO
+
 import allure
-from httpx import Response
+from pydantic import HttpUrl
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, APIResponse, AsyncAPIClient, BaseAPIClient, ResponseT, api_step
 from clients.api_coverage import tracker  # Импортируем трекер
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.files.files_schema import (
+    CreateFileRequestSchema,
+    CreateFileResponseSchema,
+    CreateGeneratedFileRequestSchema,
+    DownloadFileResultSchema
+)
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_private_http_client,
+    get_async_private_http_client
+)
+from tools.files import CHUNK_SIZE, GeneratedFile
 from tools.routes import APIRoutes  # Импортируем enum APIRoutes
 
+UploadRequestSchema = CreateFileRequestSchema | CreateGeneratedFileRequestSchema
+
 
-class FilesClient(APIClient):
+def open_upload_file(request: UploadRequestSchema) -> BinaryIO:
     """
-    Клиент для работы с /api/v1/files
+    Открывает содержимое загружаемого файла для потокового чтения.
+
+    :param request: Запрос на создание файла с путём к файлу или с размером сгенерированного содержимого.
+    :return: Бинарный файлоподобный объект, который httpx читает частями при отправке запроса.
+    """
+    if isinstance(request, CreateGeneratedFileRequestSchema):
+        return GeneratedFile(size=request.upload_size, seed=request.seed)
+
+    return request.upload_file.open("rb")
+
+
+class BaseFilesClient(BaseAPIClient[ResponseT]):
+    """
+    Запросы к /api/v1/files, общие для FilesClient и AsyncFilesClient
     """
 
-    @allure.step("Get file by id {file_id}")
+    @api_step("Get file by id {file_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
-    def get_file_api(self, file_id: str) -> Response:
+    def get_file_api(self, file_id: str) -> ResponseT:
         """
         Метод получения файла.
 
         :param file_id: Идентификатор файла.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.FILES}/{file_id}")
 
-    @allure.step("Create file")
+    @api_step("Create file")
     @tracker.track_coverage_httpx(APIRoutes.FILES)
-    def create_file_api(self, request: CreateFileRequestSchema) -> Response:
+    def create_file_api(self, request: UploadRequestSchema) -> ResponseT:
         """
         Метод создания файла.
 
-        :param request: Словарь с filename, directory, upload_file.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :param request: Словарь с filename, directory и upload_file или upload_size.
+        :return: Ответ от сервера в виде объекта APIResponse
         """
+        # Файл не читается в память целиком: httpx отправляет его частями прямо из открытого объекта,
+        # а закрывается он после отправки запроса (см. BaseAPIClient.request)
         return self.post(
             APIRoutes.FILES,
-            data=request.model_dump(by_alias=True, exclude={'upload_file'}),
-            files={"upload_file": request.upload_file.read_bytes()}
+            data=request.model_dump(by_alias=True, include={'filename', 'directory'}),
+            files={"upload_file": (request.filename, open_upload_file(request))}
         )
 
-    @allure.step("Delete file by id {file_id}")
+    @api_step("Delete file by id {file_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
-    def delete_file_api(self, file_id: str) -> Response:
+    def delete_file_api(self, file_id: str) -> ResponseT:
         """
         Метод удаления файла.
 
         :param file_id: Идентификатор файла.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.FILES}/{file_id}")
 
-    def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
+
+class FilesClient(BaseFilesClient[APIResponse], APIClient):
+    """
+    Клиент для работы с /api/v1/files
+    """
+
+    def create_file(self, request: UploadRequestSchema) -> CreateFileResponseSchema:
         response = self.create_file_api(request)
-        return CreateFileResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateFileResponseSchema)
+
+    @allure.step("Download file {url}")
+    def download_file(self, url: HttpUrl | str, chunk_size: int = CHUNK_SIZE) -> DownloadFileResultSchema:
+        """
+        Метод скачивания раздаваемого сервером файла. Тело ответа не накапливается в памяти:
+        хеш содержимого считается по мере получения частей.
+
+        :param url: Ссылка на файл, например file.url из ответа создания файла.
+        :param chunk_size: Размер обрабатываемой за раз части в байтах.
+        :return: Размер, SHA-256 содержимого и длительность скачивания.
+        :raises httpx.HTTPStatusError: Если сервер ответил ошибкой.
+        """
+        size, digest = 0, hashlib.sha256()
+        started_at = time.perf_counter()
+
+        with self.client.stream("GET", str(url)) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(chunk_size):
+                size += len(chunk)
+                digest.update(chunk)
+
+        return DownloadFileResultSchema(
+            size=size,
+            sha256=digest.hexdigest(),
+            elapsed=time.perf_counter() - started_at
+        )
 
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
@@ -61,4 +124,47 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
 
     :return: Готовый к использованию FilesClient.
     """
-    return FilesClient(client=get_private_http_client(user))
\ No newline at end of file
+    return FilesClient(client=get_private_http_client(user))
+
+
+class AsyncFilesClient(BaseFilesClient[Awaitable[APIResponse]], AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/files. Типизированные методы повторяют FilesClient.
+    """
+
+    async def create_file(self, request: UploadRequestSchema) -> CreateFileResponseSchema:
+        response = await self.create_file_api(request)
+        return response.parse(CreateFileResponseSchema)
+
+    async def download_file(self, url: HttpUrl | str, chunk_size: int = CHUNK_SIZE) -> DownloadFileResultSchema:
+        """
+        Метод потокового скачивания раздаваемого сервером файла.
+
+        :param url: Ссылка на файл, например file.url из ответа создания файла.
+        :param chunk_size: Размер обрабатываемой за раз части в байтах.
+        :return: Размер, SHA-256 содержимого и длительность скачивания.
+        :raises httpx.HTTPStatusError: Если сервер ответил ошибкой.
+        """
+        size, digest = 0, hashlib.sha256()
+        started_at = time.perf_counter()
+
+        async with self.client.stream("GET", str(url)) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                size += len(chunk)
+                digest.update(chunk)
+
+        return DownloadFileResultSchema(
+            size=size,
+            sha256=digest.hexdigest(),
+            elapsed=time.perf_counter() - started_at
+        )
+
+
+async def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Функция создаёт экземпляр AsyncFilesClient с уже авторизованным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncFilesClient.
+    """
+    return AsyncFilesClient(client=await get_async_private_http_client(user))
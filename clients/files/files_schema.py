@@ -17,11 +17,23 @@ class CreateFileRequestSchema(BaseModel):
     """
     Описание структуры запроса на создание файла.
     """
-    filename: str = Field(default_factory=lambda: f"{fake.uuid4()}.png")
+    filename: str = Field(default_factory=lambda: fake.filename("png"))
     directory: str = Field(default="tests")
     upload_file: FilePath
 
 
+class CreateGeneratedFileRequestSchema(BaseModel):
+    """
+    Описание структуры запроса на создание файла со сгенерированным содержимым.
+
+    Файла на диске нет: upload_size байт генерируются при отправке (см. tools.files.GeneratedFile).
+    """
+    filename: str = Field(default_factory=lambda: fake.filename("bin"))
+    directory: str = Field(default="tests")
+    upload_size: int = Field(gt=0)
+    seed: int = Field(default_factory=lambda: fake.integer(start=0, end=2 ** 31))
+
+
 class CreateFileResponseSchema(BaseModel):
     """
     Описание структуры ответа создания файла.
@@ -29,6 +41,19 @@ class CreateFileResponseSchema(BaseModel):
     file: FileSchema
 
 
+class DownloadFileResultSchema(BaseModel):
+    """
+    Описание результата потокового скачивания файла.
+    """
+    size: int  # Размер скачанного содержимого в байтах
+    sha256: str
+    elapsed: float  # Длительность скачивания в секундах
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.size / 1024 / 1024 / self.elapsed if self.elapsed else 0.0
+
+
 class GetFileResponseSchema(BaseModel):
     """
     Описание структуры запроса получения файла.
@@ -1,12 +1,19 @@
+import asyncio
+import threading
 from functools import lru_cache
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
-from httpx import Client
+from httpx import AsyncClient, Client
 from pydantic import BaseModel
 
-from clients.authentication.authentication_client import get_authentication_client
-from clients.authentication.authentication_schema import LoginRequestSchema
-# Импортируем хуки логирования запроса и ответа
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.authentication.authentication_session import (
+    AsyncAuthenticationSessionCache,
+    AuthenticationSession,
+    AuthenticationSessionCache
+)
+# Импортируем сборку хуков логирования и трассировки запроса и ответа
+from clients.event_hooks import build_event_hooks, build_async_event_hooks
+from clients.public_http_builder import get_http_client_limits, get_http_transport, get_async_http_transport
 from config import settings
 
 
@@ -16,18 +23,145 @@ class AuthenticationUserSchema(BaseModel, frozen=True):
 
 
 @lru_cache(maxsize=None)
+def get_authentication_session_cache() -> AuthenticationSessionCache:
+    """
+    Функция возвращает кеш авторизованных клиентов процесса. Кеш ограничен по размеру
+    AUTHENTICATION.CACHE_SIZE и закрывает вытесненные клиенты.
+
+    :return: Экземпляр AuthenticationSessionCache.
+    """
+    return AuthenticationSessionCache(maxsize=settings.authentication.cache_size)
+
+
+# Сессии авторизации пользователей. Сессия живёт, пока её использует хотя бы один клиент из кешей
+_authentication_sessions: WeakValueDictionary[AuthenticationUserSchema, AuthenticationSession] = WeakValueDictionary()
+_authentication_sessions_lock = threading.Lock()
+
+
+def get_authentication_session(user: AuthenticationUserSchema) -> AuthenticationSession:
+    """
+    Функция возвращает сессию авторизации пользователя, общую для его синхронного и асинхронных клиентов.
+    Клиент, созданный для пользователя, у которого уже есть действующий токен, не выполняет логин.
+
+    :param user: Данные для аутентификации пользователя.
+    :return: Экземпляр AuthenticationSession.
+    """
+    with _authentication_sessions_lock:
+        session = _authentication_sessions.get(user)
+        if session is None:
+            session = _authentication_sessions[user] = AuthenticationSession(
+                email=user.email,
+                password=user.password,
+                token_refresh_leeway=settings.authentication.token_refresh_leeway
+            )
+
+        return session
+
+
+def build_private_http_client(user: AuthenticationUserSchema) -> tuple[Client, AuthenticationSession]:
+    """
+    Функция авторизует пользователя и создаёт экземпляр httpx.Client с обновляемым токеном доступа.
+
+    :param user: Данные для аутентификации пользователя.
+    :return: Пара из готового к использованию httpx.Client и его сессии авторизации.
+    """
+    session = get_authentication_session(user)
+    session.get_access_token()  # Логинимся, только если у сессии ещё нет действующего токена
+
+    client = Client(
+        timeout=settings.http_client.timeout,
+        base_url=settings.http_client.client_url,
+        auth=session,
+        limits=get_http_client_limits(),
+        http2=settings.http_client.http2,
+        transport=get_http_transport(),
+        event_hooks=build_event_hooks(),
+    )
+    return client, session
+
+
 def get_private_http_client(user: AuthenticationUserSchema) -> Client:
-    authentication_client = get_authentication_client()
+    """
+    Функция возвращает авторизованный httpx.Client для пользователя.
+
+    Клиенты кешируются по пользователю: повторные вызовы не выполняют логин заново,
+    а истекающий access токен обновляется через refresh эндпоинт.
+
+    :param user: Данные для аутентификации пользователя.
+    :return: Готовый к использованию объект httpx.Client.
+    """
+    return get_authentication_session_cache().get_or_create(user, lambda: build_private_http_client(user))
 
-    login_request = LoginRequestSchema(email=user.email, password=user.password)
-    login_response = authentication_client.login(login_request)
 
-    return Client(
+def close_private_http_clients():
+    """
+    Функция закрывает все закешированные авторизованные клиенты.
+    """
+    get_authentication_session_cache().clear()
+
+
+# Кеши авторизованных асинхронных клиентов, свои для каждого event loop
+_async_authentication_session_caches: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncAuthenticationSessionCache
+] = WeakKeyDictionary()
+
+
+def get_async_authentication_session_cache() -> AsyncAuthenticationSessionCache:
+    """
+    Функция возвращает кеш авторизованных асинхронных клиентов текущего event loop.
+
+    :return: Экземпляр AsyncAuthenticationSessionCache.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _async_authentication_session_caches:
+        _async_authentication_session_caches[loop] = AsyncAuthenticationSessionCache(
+            maxsize=settings.authentication.cache_size
+        )
+
+    return _async_authentication_session_caches[loop]
+
+
+async def build_async_private_http_client(user: AuthenticationUserSchema) -> tuple[AsyncClient, AuthenticationSession]:
+    """
+    Функция авторизует пользователя и создаёт экземпляр httpx.AsyncClient с обновляемым токеном доступа.
+
+    :param user: Данные для аутентификации пользователя.
+    :return: Пара из готового к использованию httpx.AsyncClient и его сессии авторизации.
+    """
+    session = get_authentication_session(user)
+    await session.async_get_access_token()  # Логинимся, только если у сессии ещё нет действующего токена
+
+    client = AsyncClient(
         timeout=settings.http_client.timeout,
         base_url=settings.http_client.client_url,
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
-        event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],  # Логируем исходящие HTTP-запросы
-            "response": [log_response_event_hook]  # Логируем полученные HTTP-ответы
-        },
-    )
\ No newline at end of file
+        auth=session,
+        limits=get_http_client_limits(),
+        http2=settings.http_client.http2,
+        transport=get_async_http_transport(),
+        event_hooks=build_async_event_hooks(),
+    )
+    return client, session
+
+
+async def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция возвращает авторизованный httpx.AsyncClient для пользователя.
+
+    Как и в get_private_http_client, клиенты кешируются по пользователю, а истекающий access токен
+    обновляется через refresh эндпоинт. httpx.AsyncClient привязан к event loop, в котором был создан,
+    поэтому кеш свой для каждого loop.
+
+    :param user: Данные для аутентификации пользователя.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return await get_async_authentication_session_cache().get_or_create(
+        user, lambda: build_async_private_http_client(user)
+    )
+
+
+async def close_async_private_http_clients():
+    """
+    Функция закрывает все закешированные авторизованные асинхронные клиенты текущего event loop.
+    """
+    if cache := _async_authentication_session_caches.pop(asyncio.get_running_loop(), None):
+        await cache.clear()
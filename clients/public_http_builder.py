@@ -1,21 +1,172 @@
-from httpx import Client
+import asyncio
+import threading
+from weakref import WeakKeyDictionary
 
-# Импортируем хуки логирования запроса и ответа
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from httpx import (
+    AsyncClient,
+    AsyncBaseTransport,
+    AsyncHTTPTransport,
+    BaseTransport,
+    Client,
+    HTTPTransport,
+    Limits,
+    MockTransport
+)
+
+# Импортируем сборку хуков логирования и трассировки запроса и ответа
+from clients.event_hooks import build_event_hooks, build_async_event_hooks
 from config import settings
+from tools.http.cassette import AsyncRecordingTransport, RecordingTransport, ReplayTransport, get_cassette
 
+# Общий публичный клиент и блокировка для его ленивого создания из разных потоков
+_public_http_client: Client | None = None
+_public_http_client_lock = threading.Lock()
+# Общие асинхронные клиенты: httpx.AsyncClient привязан к event loop, поэтому клиент свой на каждый loop
+_async_public_http_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient] = WeakKeyDictionary()
 
-def get_public_http_client() -> Client:
+
+def get_http_client_limits() -> Limits:
+    """
+    Функция возвращает ограничения пула соединений из настроек.
+
+    :return: Объект httpx.Limits.
+    """
+    return Limits(
+        max_connections=settings.http_client.max_connections,
+        max_keepalive_connections=settings.http_client.max_keepalive_connections,
+        keepalive_expiry=settings.http_client.keepalive_expiry,
+    )
+
+
+def get_http_transport() -> BaseTransport | None:
+    """
+    Функция возвращает транспорт для режима HTTP_CLIENT.MODE.
+
+    :return: Транспорт кассеты, транспорт фейкового сервера либо None для обычного транспорта httpx.
+    """
+    if settings.http_client.mode == "record":
+        transport = HTTPTransport(limits=get_http_client_limits(), http2=settings.http_client.http2)
+        return RecordingTransport(transport, get_cassette())
+
+    if settings.http_client.mode == "replay":
+        return ReplayTransport(get_cassette())
+
+    if settings.http_client.mode == "fake":
+        from tools.fake_server.server import get_fake_server  # Фейковый сервер нужен только в режиме fake
+
+        return MockTransport(get_fake_server().handle_request)
+
+    return None
+
+
+def get_async_http_transport() -> AsyncBaseTransport | None:
+    """
+    Функция возвращает асинхронный транспорт для режима HTTP_CLIENT.MODE.
+
+    :return: Транспорт кассеты, транспорт фейкового сервера либо None для обычного транспорта httpx.
     """
-    Функция создаёт экземпляр httpx.Client с базовыми настройками.
+    if settings.http_client.mode == "record":
+        transport = AsyncHTTPTransport(limits=get_http_client_limits(), http2=settings.http_client.http2)
+        return AsyncRecordingTransport(transport, get_cassette())
+
+    if settings.http_client.mode == "replay":
+        return ReplayTransport(get_cassette())
+
+    if settings.http_client.mode == "fake":
+        from tools.fake_server.server import get_fake_server  # Фейковый сервер нужен только в режиме fake
+
+        return MockTransport(get_fake_server().handle_request)
+
+    return None
+
+
+def build_public_http_client() -> Client:
+    """
+    Функция создаёт новый экземпляр httpx.Client с базовыми настройками.
 
     :return: Готовый к использованию объект httpx.Client.
     """
     return Client(
         timeout=settings.http_client.timeout,
         base_url=settings.http_client.client_url,
-        event_hooks={
-            "request": [curl_event_hook, log_request_event_hook],  # Логируем исходящие HTTP-запросы
-            "response": [log_response_event_hook]  # Логируем полученные HTTP-ответы
-        }
-    )
\ No newline at end of file
+        limits=get_http_client_limits(),
+        http2=settings.http_client.http2,
+        transport=get_http_transport(),
+        event_hooks=build_event_hooks()
+    )
+
+
+def get_public_http_client() -> Client:
+    """
+    Функция возвращает общий на процесс экземпляр httpx.Client с базовыми настройками.
+
+    Клиент создаётся при первом обращении, а его пул соединений с keep-alive переиспользуется
+    всеми публичными клиентами, в том числе при авторизации в get_private_http_client.
+
+    :return: Готовый к использованию объект httpx.Client.
+    """
+    global _public_http_client
+
+    with _public_http_client_lock:
+        if _public_http_client is None or _public_http_client.is_closed:
+            _public_http_client = build_public_http_client()
+
+        return _public_http_client
+
+
+def close_public_http_client():
+    """
+    Функция закрывает общий публичный клиент и его пул соединений.
+    Следующий вызов get_public_http_client создаст новый клиент.
+    """
+    global _public_http_client
+
+    with _public_http_client_lock:
+        if _public_http_client is not None:
+            _public_http_client.close()
+            _public_http_client = None
+
+
+def build_async_public_http_client() -> AsyncClient:
+    """
+    Функция создаёт новый экземпляр httpx.AsyncClient с базовыми настройками.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.http_client.timeout,
+        base_url=settings.http_client.client_url,
+        limits=get_http_client_limits(),
+        http2=settings.http_client.http2,
+        transport=get_async_http_transport(),
+        event_hooks=build_async_event_hooks()
+    )
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Функция возвращает общий для текущего event loop экземпляр httpx.AsyncClient с базовыми настройками.
+
+    Клиент переиспользуется всеми асинхронными публичными клиентами loop, в том числе при авторизации
+    в get_async_private_http_client. Вне event loop каждый вызов создаёт новый клиент.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return build_async_public_http_client()
+
+    client = _async_public_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_public_http_clients[loop] = build_async_public_http_client()
+
+    return client
+
+
+async def close_async_public_http_client():
+    """
+    Функция закрывает общий асинхронный публичный клиент текущего event loop.
+    """
+    if client := _async_public_http_clients.pop(asyncio.get_running_loop(), None):
+        await client.aclose()
@@ -1,64 +1,92 @@
-import allure  # Импортируем allure
-from httpx import Response
+from typing import Awaitable
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, APIResponse, AsyncAPIClient, BaseAPIClient, ResponseT, api_step
 from clients.api_coverage import tracker  # Импортируем трекер
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.private_http_builder import (
+    get_private_http_client,
+    get_async_private_http_client,
+    AuthenticationUserSchema
+)
 from clients.users.users_schema import UpdateUserRequestSchema, GetUserResponseSchema
 from tools.routes import APIRoutes  # Импортируем enum APIRoutes
 
 
-class PrivateUsersClient(APIClient):
+class BasePrivateUsersClient(BaseAPIClient[ResponseT]):
     """
-    Клиент для работы с /api/v1/users
+    Запросы к /api/v1/users, общие для PrivateUsersClient и AsyncPrivateUsersClient
     """
-    @allure.step("Get user me")  # Добавили allure шаг
+    @api_step("Get user me")
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/me')
-    def get_user_me_api(self) -> Response:
+    def get_user_me_api(self) -> ResponseT:
         """
         Метод получения текущего пользователя.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.USERS}/me")
 
-    @allure.step("Get user by id {user_id}")  # Добавили allure шаг
+    @api_step("Get user by id {user_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
-    def get_user_api(self, user_id: str) -> Response:
+    def get_user_api(self, user_id: str) -> ResponseT:
         """
         Метод получения пользователя по идентификатору.
         :param user_id: Идентификатор пользователя.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.get(f"{APIRoutes.USERS}/{user_id}")
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
-        response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
-
-    @allure.step("Update user by id {user_id}")  # Добавили allure шаг
+    @api_step("Update user by id {user_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
-    def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
+    def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> ResponseT:
         """
         Метод обновления пользователя по идентификатору.
         :param user_id: Идентификатор пользователя.
         :param request: Словарь с email, lastName, firstName, middleName.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
 
-    @allure.step("Delete user by id {user_id}")  # Добавили allure шаг
+    @api_step("Delete user by id {user_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
-    def delete_user_api(self, user_id: str) -> Response:
+    def delete_user_api(self, user_id: str) -> ResponseT:
         """
         Метод удаления пользователя по идентификатору.
         :param user_id: Идентификатор пользователя.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.delete(f"{APIRoutes.USERS}/{user_id}")
 
+
+class PrivateUsersClient(BasePrivateUsersClient[APIResponse], APIClient):
+    """
+    Клиент для работы с /api/v1/users
+    """
+
+    def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = self.get_user_api(user_id)
+        return response.parse(GetUserResponseSchema)
+
+
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
     """
     Функция создаёт экземпляр PrivateUsersClient с уже настроенным HTTP-клиентом.
     :return: Готовый к использованию PrivateUsersClient.
     """
-    return PrivateUsersClient(client=get_private_http_client(user))
\ No newline at end of file
+    return PrivateUsersClient(client=get_private_http_client(user))
+
+
+class AsyncPrivateUsersClient(BasePrivateUsersClient[Awaitable[APIResponse]], AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users. Типизированные методы повторяют PrivateUsersClient.
+    """
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return response.parse(GetUserResponseSchema)
+
+
+async def get_async_private_users_client(user: AuthenticationUserSchema) -> AsyncPrivateUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPrivateUsersClient с уже авторизованным HTTP-клиентом.
+    :return: Готовый к использованию AsyncPrivateUsersClient.
+    """
+    return AsyncPrivateUsersClient(client=await get_async_private_http_client(user))
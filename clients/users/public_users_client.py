@@ -1,31 +1,36 @@
-import allure  # Импортируем allure
-from httpx import Response
+from typing import Awaitable
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, APIResponse, AsyncAPIClient, BaseAPIClient, ResponseT, api_step
 from clients.api_coverage import tracker  # Импортируем трекер
-from clients.public_http_builder import get_public_http_client
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
 from clients.users.users_schema import CreateUserResponseSchema, CreateUserRequestSchema
 from tools.routes import APIRoutes  # Импортируем enum APIRoutes
 
 
-class PublicUsersClient(APIClient):
+class BasePublicUsersClient(BaseAPIClient[ResponseT]):
     """
-    Клиент для работы с /api/v1/users
+    Публичные запросы к /api/v1/users, общие для PublicUsersClient и AsyncPublicUsersClient
     """
 
-    @allure.step("Create user")  # Добавили allure шаг
+    @api_step("Create user")
     @tracker.track_coverage_httpx(APIRoutes.USERS)
-    def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+    def create_user_api(self, request: CreateUserRequestSchema) -> ResponseT:
         """
         Метод создает пользователя.
         :param request: Словарь с email, password, lastName, firstName, middleName.
-        :return: Ответ от сервера в виде объекта httpx.Response
+        :return: Ответ от сервера в виде объекта APIResponse
         """
         return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
 
+
+class PublicUsersClient(BasePublicUsersClient[APIResponse], APIClient):
+    """
+    Клиент для работы с /api/v1/users
+    """
+
     def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        return response.parse(CreateUserResponseSchema)
 
 
 def get_public_users_client() -> PublicUsersClient:
@@ -34,4 +39,23 @@ def get_public_users_client() -> PublicUsersClient:
 
     :return: Готовый к использованию PublicUsersClient.
     """
-    return PublicUsersClient(client=get_public_http_client())
\ No newline at end of file
+    return PublicUsersClient(client=get_public_http_client())
+
+
+class AsyncPublicUsersClient(BasePublicUsersClient[Awaitable[APIResponse]], AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users. Типизированные методы повторяют PublicUsersClient.
+    """
+
+    async def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
+        response = await self.create_user_api(request)
+        return response.parse(CreateUserResponseSchema)
+
+
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPublicUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPublicUsersClient.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
@@ -1,20 +1,96 @@
-from typing import Self
+import importlib.util
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath
+from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float
+    # Параметры пула соединений общего публичного клиента
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30
+    http2: bool = False  # Для HTTP/2 требуется пакет h2 из requirements.txt
+    # live — запросы к серверу, record — запросы к серверу с записью в кассету, replay — ответы из кассеты без сервера,
+    # fake — ответы фейкового сервера tools.fake_server в памяти процесса
+    mode: Literal["live", "record", "replay", "fake"] = "live"
+    cassette_file: Path = Path("./cassettes/api.jsonl.gz")
+    cassette_seed: int = 0  # Seed Faker в режимах record и replay, чтобы тестовые данные совпадали между прогонами
+
+    @field_validator("http2")
+    @classmethod
+    def validate_http2(cls, http2: bool) -> bool:
+        # Без h2 httpx упал бы с ImportError только при создании первого клиента
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ValueError("HTTP/2 requires the h2 package: pip install -r requirements.txt or httpx[http2]")
+        return http2
 
     @property
     def client_url(self) -> str:
         return str(self.url)
 
 
+class AuthenticationConfig(BaseModel):
+    cache_size: int = 64  # Сколько авторизованных клиентов держать открытыми одновременно
+    token_refresh_leeway: float = 30  # За сколько секунд до истечения access токена его пора обновить
+
+
+class EntityPoolConfig(BaseModel):
+    shared_size: int = 1  # Наборов сущностей для тестов, которые только читают данные
+
+
+class FactoriesConfig(BaseModel):
+    max_concurrency: int = 16  # Сколько запросов одновременно выполнять в fixtures.factories и пуле сущностей
+
+
+class CurlAttachmentsConfig(BaseModel):
+    # always — прикреплять cURL каждого запроса, on_failure — только для упавших тестов,
+    # sampled — для доли sample_rate запросов и для упавших тестов, off — не прикреплять
+    policy: Literal["always", "on_failure", "sampled", "off"] = "on_failure"
+    sample_rate: float = 0.1
+    max_body_size: int = 10_000  # Максимум байт тела запроса в cURL команде
+    max_pending_requests: int = 100  # Сколько последних запросов теста хранить до его завершения
+
+
+class LatencyConfig(BaseModel):
+    p95_ms: float = 1000  # Допустимый 95-й перцентиль длительности запросов к спискам сущностей
+
+
+class AssertionsConfig(BaseModel):
+    # full — allure шаг на каждую проверку, grouped — шаг на сущность с таблицей проверок,
+    # fast — шаги только для упавших проверок
+    verbosity: Literal["full", "grouped", "fast"] = "full"
+
+
+class AllureWriterConfig(BaseModel):
+    enabled: bool = True  # Писать результаты Allure в фоновом потоке (иначе синхронно из потока теста)
+    queue_size: int = 1000  # Сколько файлов может ждать записи, прежде чем тест будет ждать фоновый поток
+    batch_size: int = 100  # Сколько файлов фоновый поток забирает из очереди за раз
+
+
+class LoggingConfig(BaseModel):
+    level: str = "DEBUG"  # Уровень логгеров, для которых не задан уровень канала
+    # Уровни отдельных каналов: ключ — имя логгера или шаблон,
+    # например {"HTTP_CLIENT": "WARNING", "*_ASSERTIONS": "INFO"}
+    channels: dict[str, str] = {}
+
+
+class TraceConfig(BaseModel):
+    enabled: bool = False  # Писать ли JSONL трассировку запросов (анализ: python -m tools.trace)
+    results_dir: Path = Path("./trace-results")
+    buffer_size: int = 1024 * 1024  # Размер буфера записи файла трассировки, байт
+
+
 class TestDataConfig(BaseModel):
     image_png_file: FilePath
+    generated_file_size: int = 10 * 1024 * 1024  # Размер сгенерированного файла в тестах скачивания, байт
+    list_size: int = 50  # Сколько сущностей создавать в тестах получения больших списков
+    # Seed генерации тестовых данных. Если не задан, выбирается на прогон и пишется в лог и environment Allure
+    seed: int | None = None
 
 
 class Settings(BaseSettings):
@@ -26,6 +102,15 @@ class Settings(BaseSettings):
     )
     test_data: TestDataConfig
     http_client: HTTPClientConfig
+    authentication: AuthenticationConfig = AuthenticationConfig()
+    entity_pool: EntityPoolConfig = EntityPoolConfig()
+    factories: FactoriesConfig = FactoriesConfig()
+    curl_attachments: CurlAttachmentsConfig = CurlAttachmentsConfig()
+    latency: LatencyConfig = LatencyConfig()
+    assertions: AssertionsConfig = AssertionsConfig()
+    allure_writer: AllureWriterConfig = AllureWriterConfig()
+    logging: LoggingConfig = LoggingConfig()
+    trace: TraceConfig = TraceConfig()
     allure_results_dir: DirectoryPath  # Добавили новое поле
 
     # Добавили метод initialize
@@ -38,5 +123,24 @@ class Settings(BaseSettings):
         return Settings(allure_results_dir=allure_results_dir)
 
 
-# Теперь вызываем метод initialize
-settings = Settings.initialize()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Функция создаёт настройки при первом вызове: читает .env и создаёт папку allure-results.
+
+    :return: Экземпляр Settings, общий для процесса.
+    """
+    return Settings.initialize()
+
+
+class LazySettings:
+    """
+    Прокси к настройкам: `from config import settings` ничего не читает при импорте,
+    настройки создаются при первом обращении к любому атрибуту.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+
+settings: Settings = LazySettings()  # type: ignore[assignment]
\ No newline at end of file
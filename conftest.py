@@ -4,6 +4,11 @@ pytest_plugins = (
     "fixtures.courses",
     "fixtures.exercises",
     "fixtures.authentication",
+    "fixtures.pool",
+    "fixtures.http_clients",
+    "fixtures.latency",
+    "fixtures.api_coverage",
+    "fixtures.trace",
 
     "fixtures.allure"
 )
\ No newline at end of file
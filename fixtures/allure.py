@@ -1,11 +1,72 @@
+from pathlib import Path
+
+import allure_commons
 import pytest
+from allure_commons.logger import AllureFileLogger
 
+from clients.event_hooks import attach_pending_curl_commands, collect_pending_curl_requests
+from config import settings
 from tools.allure.environment import create_allure_environment_file
+from tools.allure.results_writer import AllureResultsWriter
+
+allure_results_writer_key = pytest.StashKey[AllureResultsWriter]()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config):
+    # allure-pytest регистрирует AllureFileLogger только при запуске с --alluredir
+    report_dir = config.option.allure_report_dir
+    file_logger = next(
+        (plugin for plugin in allure_commons.plugin_manager.get_plugins() if isinstance(plugin, AllureFileLogger)),
+        None
+    )
+    if not report_dir or file_logger is None or not settings.allure_writer.enabled:
+        return
+
+    writer = AllureResultsWriter(
+        report_dir=Path(report_dir).absolute(),
+        queue_size=settings.allure_writer.queue_size,
+        batch_size=settings.allure_writer.batch_size
+    )
+    name = allure_commons.plugin_manager.get_name(file_logger)
+    allure_commons.plugin_manager.unregister(file_logger)
+    allure_commons.plugin_manager.register(writer)
+    config.stash[allure_results_writer_key] = writer
+
+    def close_allure_results_writer():
+        # Контейнеры сессионных фикстур приходят уже после их завершения, поэтому закрываем писатель
+        # последним. AllureFileLogger возвращаем на место: его снимает с регистрации cleanup allure-pytest
+        writer.close()
+        allure_commons.plugin_manager.unregister(writer)
+        allure_commons.plugin_manager.register(file_logger, name)
+
+    config.add_cleanup(close_allure_results_writer)
 
 
 @pytest.fixture(scope='session', autouse=True)
-def save_allure_environment_file():
+def save_allure_environment_file(pytestconfig: pytest.Config):
     # До начала автотестов ничего не делаем
     yield  # Запукаются автотесты...
     # После завершения автотестов создаем файл environment.properties
-    create_allure_environment_file()
\ No newline at end of file
+    create_allure_environment_file()
+
+    # Дожидаемся записи результатов всех тестов, поставленных в очередь фонового писателя
+    if writer := pytestconfig.stash.get(allure_results_writer_key, None):
+        writer.flush()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Каждый тест собирает отложенные запросы в свой буфер, который отбрасывается по его завершении
+    with collect_pending_curl_requests():
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Хук выполняется до того, как allure закроет шаг теста, поэтому вложения попадают в упавший тест
+    outcome = yield
+
+    # cURL команды формируются только для упавших тестов: skip и xfail сюда не относятся
+    if outcome.get_result().failed:
+        attach_pending_curl_commands()
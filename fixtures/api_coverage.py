@@ -0,0 +1,10 @@
+import pytest
+
+from clients.api_coverage import APICoverageTracker, tracker
+
+
+@pytest.fixture(scope='session', autouse=True)
+def api_coverage() -> APICoverageTracker:
+    yield tracker
+    # Покрытие копится в памяти и сохраняется одним пакетом после завершения автотестов воркера
+    tracker.flush()
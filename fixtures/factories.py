@@ -0,0 +1,192 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from clients.courses.courses_client import get_async_courses_client
+from clients.courses.courses_schema import CourseSchema, CreateCourseRequestSchema, GetCourseResponseSchema
+from clients.event_loop import run_coroutine
+from clients.exercises.exercises_client import get_async_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, ExerciseSchema, GetExerciseResponseSchema
+from clients.files.files_client import get_async_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from config import settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture
+from tools.fakers import fake
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+
+
+async def gather_limited(
+        function: Callable[[Item], Awaitable[Result]],
+        items: Iterable[Item],
+        max_concurrency: int | None = None
+) -> list[Result]:
+    """
+    Выполняет function для каждого элемента конкурентно в текущем event loop с ограниченной параллельностью.
+
+    :param function: Корутинная функция, создающая или получающая одну сущность.
+    :param items: Аргументы вызовов.
+    :param max_concurrency: Максимум одновременных вызовов, по умолчанию FACTORIES.MAX_CONCURRENCY.
+    :return: Результаты в порядке элементов items. Первое исключение пробрасывается вызывающему,
+    а незавершённые вызовы отменяются.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or settings.factories.max_concurrency)
+
+    async def run(item: Item) -> Result:
+        async with semaphore:
+            return await function(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def create_courses(
+        count: int,
+        user: UserFixture,
+        preview_file: FileFixture | None = None,
+        max_concurrency: int | None = None
+) -> list[CourseFixture]:
+    """
+    Создаёт count курсов пользователя конкурентно через AsyncCoursesClient.
+
+    Тела запросов генерируются заранее одним пакетом fake.batch до отправки запросов, поэтому
+    при заданном seed данные не зависят от порядка их выполнения.
+
+    :param count: Количество курсов.
+    :param user: Пользователь, от имени которого создаются курсы.
+    :param preview_file: Файл превью. Если не передан, создаётся один файл на все курсы.
+    :param max_concurrency: Максимум одновременных запросов.
+    :return: Курсы в порядке создания запросов.
+    """
+    if preview_file is None:
+        file_request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        files_client = await get_async_files_client(user.authentication_user)
+        preview_file = FileFixture(request=file_request, response=await files_client.create_file(file_request))
+
+    courses_client = await get_async_courses_client(user.authentication_user)
+    requests = fake.batch.course_requests(
+        count,
+        preview_file_id=preview_file.response.file.id,
+        created_by_user_id=user.response.user.id
+    )
+
+    async def create_course(request: CreateCourseRequestSchema) -> CourseFixture:
+        return CourseFixture(request=request, response=await courses_client.create_course(request))
+
+    return await gather_limited(create_course, requests, max_concurrency)
+
+
+def make_courses(
+        count: int,
+        user: UserFixture,
+        preview_file: FileFixture | None = None,
+        max_concurrency: int | None = None
+) -> list[CourseFixture]:
+    """
+    Создаёт count курсов пользователя конкурентно в общем event loop процесса (см. create_courses).
+    """
+    return run_coroutine(create_courses(count, user, preview_file, max_concurrency))
+
+
+async def create_exercises(
+        count: int,
+        course: CourseFixture,
+        user: UserFixture,
+        max_concurrency: int | None = None
+) -> list[ExerciseFixture]:
+    """
+    Создаёт count заданий курса конкурентно через AsyncExercisesClient.
+
+    :param count: Количество заданий.
+    :param course: Курс, в котором создаются задания.
+    :param user: Пользователь, от имени которого создаются задания.
+    :param max_concurrency: Максимум одновременных запросов.
+    :return: Задания в порядке создания запросов.
+    """
+    exercises_client = await get_async_exercises_client(user.authentication_user)
+    requests = fake.batch.exercise_requests(count, course_id=course.response.course.id)
+
+    async def create_exercise(request: CreateExerciseRequestSchema) -> ExerciseFixture:
+        return ExerciseFixture(request=request, response=await exercises_client.create_exercise(request))
+
+    return await gather_limited(create_exercise, requests, max_concurrency)
+
+
+def make_exercises(
+        count: int,
+        course: CourseFixture,
+        user: UserFixture,
+        max_concurrency: int | None = None
+) -> list[ExerciseFixture]:
+    """
+    Создаёт count заданий курса конкурентно в общем event loop процесса (см. create_exercises).
+    """
+    return run_coroutine(create_exercises(count, course, user, max_concurrency))
+
+
+async def fetch_courses(
+        course_ids: Iterable[str],
+        user: UserFixture,
+        max_concurrency: int | None = None
+) -> list[CourseSchema]:
+    """
+    Получает курсы по идентификаторам конкурентными запросами GET /api/v1/courses/{course_id}.
+
+    :param course_ids: Идентификаторы курсов.
+    :param user: Пользователь, от имени которого выполняются запросы.
+    :param max_concurrency: Максимум одновременных запросов.
+    :return: Курсы в порядке идентификаторов.
+    """
+    courses_client = await get_async_courses_client(user.authentication_user)
+
+    async def fetch_course(course_id: str) -> CourseSchema:
+        response = await courses_client.get_course_api(course_id)
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(GetCourseResponseSchema).course
+
+    return await gather_limited(fetch_course, course_ids, max_concurrency)
+
+
+def get_courses_by_id(course_ids: Iterable[str], user: UserFixture) -> list[CourseSchema]:
+    """
+    Получает курсы по идентификаторам конкурентно в общем event loop процесса (см. fetch_courses).
+    """
+    return run_coroutine(fetch_courses(course_ids, user))
+
+
+async def fetch_exercises(
+        exercise_ids: Iterable[str],
+        user: UserFixture,
+        max_concurrency: int | None = None
+) -> list[ExerciseSchema]:
+    """
+    Получает задания по идентификаторам конкурентными запросами GET /api/v1/exercises/{exercise_id}.
+
+    :param exercise_ids: Идентификаторы заданий.
+    :param user: Пользователь, от имени которого выполняются запросы.
+    :param max_concurrency: Максимум одновременных запросов.
+    :return: Задания в порядке идентификаторов.
+    """
+    exercises_client = await get_async_exercises_client(user.authentication_user)
+
+    async def fetch_exercise(exercise_id: str) -> ExerciseSchema:
+        response = await exercises_client.get_exercise_api(exercise_id)
+        response.raise_for_status()  # Проверка на ошибки HTTP
+        return response.parse(GetExerciseResponseSchema).exercise
+
+    return await gather_limited(fetch_exercise, exercise_ids, max_concurrency)
+
+
+def get_exercises_by_id(exercise_ids: Iterable[str], user: UserFixture) -> list[ExerciseSchema]:
+    """
+    Получает задания по идентификаторам конкурентно в общем event loop процесса (см. fetch_exercises).
+    """
+    return run_coroutine(fetch_exercises(exercise_ids, user))
@@ -0,0 +1,15 @@
+import pytest
+
+from clients.event_loop import close_event_loop
+from clients.private_http_builder import close_private_http_clients
+from clients.public_http_builder import close_public_http_client
+
+
+@pytest.fixture(scope='session', autouse=True)
+def http_clients_lifecycle():
+    # Общий публичный и авторизованные клиенты создаются лениво при первом запросе
+    yield
+    # После завершения автотестов закрываем все пулы соединений, в том числе асинхронных клиентов фабрик
+    close_event_loop()
+    close_private_http_clients()
+    close_public_http_client()
@@ -0,0 +1,15 @@
+import allure
+import pytest
+
+from clients.api_coverage import tracker
+from tools.http.latency import latency_registry
+
+
+@pytest.fixture(scope='session', autouse=True)
+def latency_metrics():
+    # Подписываем реестр на все ответы API клиентов до начала автотестов
+    tracker.add_listener(latency_registry.record_response)
+    yield latency_registry
+    tracker.remove_listener(latency_registry.record_response)
+    # После завершения автотестов прикрепляем к отчету таблицу длительностей по маршрутам
+    allure.attach(latency_registry.format_table(), "Latency by route", allure.attachment_type.TEXT)
\ No newline at end of file
@@ -0,0 +1,201 @@
+import itertools
+import threading
+from typing import Literal, get_args
+
+import pytest
+from pydantic import BaseModel
+
+from clients.courses.courses_client import CoursesClient, get_courses_client, get_async_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.event_loop import run_coroutine
+from clients.exercises.exercises_client import ExercisesClient, get_exercises_client, get_async_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.files.files_client import FilesClient, get_files_client, get_async_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.private_users_client import PrivateUsersClient, get_private_users_client
+from clients.users.public_users_client import get_async_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.factories import gather_limited
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture
+
+
+# Глубина набора: до какой сущности цепочки пользователь → файл → курс → задание его создавать
+EntityDepth = Literal["user", "file", "course", "exercise"]
+
+
+# Связанный набор сущностей: пользователь, его файл, курс с этим файлом и задание в курсе.
+# Сущности глубже запрошенной глубины не создаются и равны None
+class EntityBundle(BaseModel):
+    user: UserFixture
+    file: FileFixture | None = None
+    course: CourseFixture | None = None
+    exercise: ExerciseFixture | None = None
+
+    @property
+    def private_users_client(self) -> PrivateUsersClient:  # Клиенты авторизованы от владельца набора
+        return get_private_users_client(self.user.authentication_user)
+
+    @property
+    def files_client(self) -> FilesClient:
+        return get_files_client(self.user.authentication_user)
+
+    @property
+    def courses_client(self) -> CoursesClient:
+        return get_courses_client(self.user.authentication_user)
+
+    @property
+    def exercises_client(self) -> ExercisesClient:
+        return get_exercises_client(self.user.authentication_user)
+
+
+# Заранее сгенерированные тела запросов для набора сущностей. Идентификаторы связанных сущностей
+# (файла, пользователя, курса) подставляются при создании набора. Без user набор создаётся от имени владельца
+class EntityRequests(BaseModel):
+    user: CreateUserRequestSchema | None = None
+    file: CreateFileRequestSchema | None = None
+    course: CreateCourseRequestSchema | None = None
+    exercise: CreateExerciseRequestSchema | None = None
+
+
+class EntityPool:
+    """
+    Пул заранее созданных наборов сущностей на воркер.
+
+    Общие наборы (checkout) выдаются по кругу тестам, которые только читают данные,
+    поэтому такие тесты не делают ни одного HTTP-запроса на подготовку. Тесты, которые
+    изменяют или удаляют сущности, получают собственный набор (lease) только той глубины,
+    которая им нужна (маркер lease). Файл, курс и задание такого набора создаются от имени
+    одного на воркер владельца, поэтому аренда не тратит запросы на создание и логин пользователя.
+    Тесты, которые изменяют или удаляют самого пользователя, используют function_user.
+    """
+
+    def __init__(self, shared_size: int):
+        self.shared_size = shared_size
+
+        self.lock = threading.Lock()
+        self.shared: list[EntityBundle] = []
+        self.shared_cycle: itertools.cycle | None = None
+        self.owner: UserFixture | None = None  # Владелец арендованных наборов
+
+    @staticmethod
+    def build_requests(depth: EntityDepth = "exercise", with_user: bool = True) -> EntityRequests:
+        """
+        Генерирует тела запросов набора. Вызывается в потоке, который создаёт наборы, до их конкурентного
+        создания: так при заданном seed данные каждого набора не зависят от порядка выполнения потоков,
+        и записанная кассета (HTTP_CLIENT.MODE=record) совпадает с запросами при воспроизведении.
+
+        :param depth: До какой сущности генерировать запросы.
+        :param with_user: Создавать ли для набора собственного пользователя.
+        :return: Тела запросов набора.
+        """
+        index = get_args(EntityDepth).index(depth)
+
+        return EntityRequests(
+            user=CreateUserRequestSchema() if with_user else None,
+            file=CreateFileRequestSchema(upload_file=settings.test_data.image_png_file) if index >= 1 else None,
+            course=CreateCourseRequestSchema() if index >= 2 else None,
+            exercise=CreateExerciseRequestSchema() if index >= 3 else None
+        )
+
+    @staticmethod
+    async def create_user(request: CreateUserRequestSchema) -> UserFixture:
+        return UserFixture(request=request, response=await get_async_public_users_client().create_user(request))
+
+    @classmethod
+    async def create_bundle(cls, requests: EntityRequests, owner: UserFixture | None = None) -> EntityBundle:
+        user = owner or await cls.create_user(requests.user)
+        if requests.file is None:
+            return EntityBundle(user=user)
+
+        files_client = await get_async_files_client(user.authentication_user)
+        file_response = await files_client.create_file(requests.file)
+        file = FileFixture(request=requests.file, response=file_response)
+        if requests.course is None:
+            return EntityBundle(user=user, file=file)
+
+        course_request = requests.course.model_copy(
+            update={"preview_file_id": file_response.file.id, "created_by_user_id": user.response.user.id}
+        )
+        courses_client = await get_async_courses_client(user.authentication_user)
+        course_response = await courses_client.create_course(course_request)
+        course = CourseFixture(request=course_request, response=course_response)
+        if requests.exercise is None:
+            return EntityBundle(user=user, file=file, course=course)
+
+        exercise_request = requests.exercise.model_copy(update={"course_id": course_response.course.id})
+        exercises_client = await get_async_exercises_client(user.authentication_user)
+        exercise_response = await exercises_client.create_exercise(exercise_request)
+
+        return EntityBundle(
+            user=user,
+            file=file,
+            course=course,
+            exercise=ExerciseFixture(request=exercise_request, response=exercise_response)
+        )
+
+    def create_bundles(self, count: int) -> list[EntityBundle]:
+        requests = [self.build_requests() for _ in range(count)]
+        return run_coroutine(gather_limited(self.create_bundle, requests))
+
+    def seed(self):
+        """
+        Создаёт общие наборы одним конкурентным пакетом.
+        """
+        self.shared = self.create_bundles(self.shared_size)
+        self.shared_cycle = itertools.cycle(self.shared)
+
+    def checkout(self) -> EntityBundle:
+        """
+        Выдаёт общий набор сущностей только для чтения.
+
+        :return: Набор, который нельзя изменять или удалять.
+        """
+        with self.lock:
+            if self.shared_cycle is None:
+                self.seed()
+
+            return next(self.shared_cycle)
+
+    def get_owner(self) -> UserFixture:
+        """
+        Возвращает владельца арендованных наборов, создавая его при первом обращении.
+
+        :return: Пользователь, от имени которого создаются арендованные наборы.
+        """
+        with self.lock:
+            if self.owner is None:
+                self.owner = run_coroutine(self.create_user(CreateUserRequestSchema()))
+
+            return self.owner
+
+    def lease(self, depth: EntityDepth = "exercise") -> EntityBundle:
+        """
+        Создаёт набор сущностей в эксклюзивное пользование.
+
+        :param depth: До какой сущности создавать набор, например "file" — только файл владельца.
+        :return: Набор, файл, курс и задание которого тест может изменять и удалять. Пользователь набора —
+        общий владелец арендованных наборов, изменять и удалять его нельзя.
+        """
+        owner = self.get_owner()
+        return run_coroutine(self.create_bundle(self.build_requests(depth, with_user=False), owner))
+
+
+@pytest.fixture(scope="session")
+def entity_pool() -> EntityPool:
+    return EntityPool(shared_size=settings.entity_pool.shared_size)
+
+
+@pytest.fixture
+def shared_entities(entity_pool: EntityPool) -> EntityBundle:
+    return entity_pool.checkout()
+
+
+@pytest.fixture
+def leased_entities(request: pytest.FixtureRequest, entity_pool: EntityPool) -> EntityBundle:
+    # Глубина задаётся маркером теста, например @pytest.mark.lease(depth="file")
+    marker = request.node.get_closest_marker("lease")
+    return entity_pool.lease(**(marker.kwargs if marker else {}))
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from config import settings
+from tools.trace.sink import clear_trace_results, trace_test_phase
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session: pytest.Session):
+    # Файлы трассировки дописываются, поэтому результаты прошлых прогонов удаляем до старта xdist воркеров.
+    # Воркеры запускает контроллер, поэтому в самих воркерах ничего не удаляем
+    if os.environ.get("PYTEST_XDIST_WORKER") or not settings.trace.enabled:
+        return
+
+    clear_trace_results(settings.trace.results_dir)
+
+
+# Фазы теста размечаются в контексте, в котором pytest выполняет фикстуры и сам тест,
+# поэтому запросы фикстур попадают в setup и teardown, а запросы теста — в call
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item: pytest.Item):
+    with trace_test_phase(item.nodeid, "setup"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    with trace_test_phase(item.nodeid, "call"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item: pytest.Item):
+    with trace_test_phase(item.nodeid, "teardown"):
+        yield
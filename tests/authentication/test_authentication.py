@@ -6,8 +6,7 @@ from allure_commons.types import Severity  # Импортируем enum Severit
 
 from clients.authentication.authentication_client import AuthenticationClient
 from clients.authentication.authentication_schema import LoginRequestSchema, LoginResponseSchema
-from clients.users.public_users_client import PublicUsersClient
-from fixtures.users import UserFixture
+from fixtures.pool import EntityBundle
 from tools.allure.epics import AllureEpic  # Импортируем enum AllureEpic
 from tools.allure.features import AllureFeature  # Импортируем enum AllureFeature
 from tools.allure.stories import AllureStory  # Импортируем enum AllureStory
@@ -31,15 +30,14 @@ class TestAuthentication:
     @allure.sub_suite(AllureStory.LOGIN)  # allure.sub_suite == allure.story
     def test_login(
             self,
-            function_user: UserFixture,
-            public_users_client: PublicUsersClient,
+            shared_entities: EntityBundle,
             authentication_client: AuthenticationClient
     ):
-        request = LoginRequestSchema(email=function_user.email, password=function_user.password)
+        request = LoginRequestSchema(email=shared_entities.user.email, password=shared_entities.user.password)
         response = authentication_client.login_api(request)
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(LoginResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_login_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        validate_json_schema(response.json(), LoginResponseSchema)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import base64
+import json
+import time
+
+import allure
+import pytest
+from httpx import Client
+
+from clients.authentication.authentication_schema import TokenSchema
+from clients.authentication.authentication_session import (
+    AuthenticationSession,
+    AuthenticationSessionCache,
+    get_token_expiry
+)
+from fixtures.users import UserFixture
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+
+TOKEN_REFRESH_LEEWAY = 30
+
+
+def build_jwt(expires_in: float) -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+    return f"{encode({'alg': 'HS256'})}.{encode({'exp': time.time() + expires_in})}.signature"
+
+
+def build_token(access_expires_in: float, refresh_expires_in: float) -> TokenSchema:
+    return TokenSchema(
+        tokenType="bearer",
+        accessToken=build_jwt(access_expires_in),
+        refreshToken=build_jwt(refresh_expires_in)
+    )
+
+
+class RecordingSession(AuthenticationSession):
+    """
+    Сессия, которая запоминает, когда она логинилась и обновляла токен.
+    """
+
+    def __init__(self, email: str, password: str):
+        super().__init__(email=email, password=password, token_refresh_leeway=TOKEN_REFRESH_LEEWAY)
+        self.calls: list[str] = []
+
+    def login(self):
+        self.calls.append("login")
+        super().login()
+
+    def refresh(self):
+        self.calls.append("refresh")
+        super().refresh()
+
+
+@pytest.fixture
+def user_session(function_user: UserFixture) -> RecordingSession:
+    return RecordingSession(email=function_user.email, password=function_user.password)
+
+
+@pytest.mark.regression
+@pytest.mark.authentication
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.AUTHENTICATION)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.AUTHENTICATION)
+class TestAuthenticationSession:
+    @allure.title("Read token expiry from JWT exp claim")
+    def test_get_token_expiry(self):
+        expires_at = get_token_expiry(build_jwt(60))
+
+        assert expires_at is not None and abs(expires_at - (time.time() + 60)) < 1
+        assert get_token_expiry("not-a-jwt") is None
+
+    @allure.title("Log in once and reuse valid access token")
+    def test_get_access_token_reuses_valid_token(self, user_session: RecordingSession):
+        access_token = user_session.get_access_token()
+
+        assert user_session.get_access_token() == access_token
+        assert user_session.calls == ["login"]
+        assert user_session.is_alive
+
+    @allure.title("Refresh access token that expires within leeway")
+    def test_get_access_token_refreshes_expiring_token(self, user_session: RecordingSession):
+        user_session.get_access_token()
+        user_session.access_token_expires_at = time.time() + TOKEN_REFRESH_LEEWAY - 1
+
+        user_session.get_access_token()
+
+        assert user_session.calls == ["login", "refresh"]
+        assert not user_session.is_expired(user_session.access_token_expires_at)
+
+    @allure.title("Log in again when refresh token has expired")
+    def test_get_access_token_logs_in_with_expired_refresh_token(self, user_session: RecordingSession):
+        user_session.get_access_token()
+        user_session.access_token_expires_at = user_session.refresh_token_expires_at = time.time() - 1
+        assert not user_session.is_alive
+
+        user_session.get_access_token()
+
+        assert user_session.calls == ["login", "refresh", "login"]
+        assert user_session.is_alive
+
+
+@pytest.mark.regression
+@pytest.mark.authentication
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.AUTHENTICATION)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.AUTHENTICATION)
+class TestAuthenticationSessionCache:
+    @staticmethod
+    def build_client(refresh_expires_in: float = 86400) -> tuple[Client, AuthenticationSession]:
+        # Токены выдаём сами: кешу важен только срок жизни refresh токена сессии
+        session = AuthenticationSession(
+            email="user@example.com",
+            password="password",
+            token_refresh_leeway=TOKEN_REFRESH_LEEWAY
+        )
+        session.set_token(build_token(access_expires_in=1800, refresh_expires_in=refresh_expires_in))
+        return Client(), session
+
+    @allure.title("Evict and close least recently used client")
+    def test_evicts_least_recently_used_client(self):
+        cache = AuthenticationSessionCache(maxsize=2)
+        first = cache.get_or_create("first", self.build_client)
+        second = cache.get_or_create("second", self.build_client)
+
+        assert cache.get_or_create("first", self.build_client) is first  # "second" становится самым старым
+        third = cache.get_or_create("third", self.build_client)
+
+        assert len(cache) == 2
+        assert second.is_closed
+        assert not first.is_closed and not third.is_closed
+        assert cache.get_or_create("second", self.build_client) is not second
+
+    @allure.title("Recreate client whose refresh token has expired")
+    def test_recreates_client_with_expired_session(self):
+        cache = AuthenticationSessionCache(maxsize=2)
+        stale = cache.get_or_create("user", lambda: self.build_client(refresh_expires_in=-1))
+
+        fresh = cache.get_or_create("user", self.build_client)
+
+        assert fresh is not stale
+        assert stale.is_closed
+        assert len(cache) == 1
+
+    @allure.title("Close all clients on clear")
+    def test_clear_closes_clients(self):
+        cache = AuthenticationSessionCache(maxsize=2)
+        clients = [cache.get_or_create(key, self.build_client) for key in ("first", "second")]
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert all(client.is_closed for client in clients)
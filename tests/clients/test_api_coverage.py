@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+import allure
+import httpx
+import pytest
+
+from clients.api_coverage import APICoverageTracker
+
+
+def build_response(method: str, url: str, status_code: int) -> httpx.Response:
+    return httpx.Response(status_code, json={}, request=httpx.Request(method, url))
+
+
+@pytest.mark.regression
+@allure.title("Flush endpoint coverage as one record per key")
+def test_flush_writes_one_record_per_coverage_key(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    coverage_tracker = APICoverageTracker(service="api-course")
+    monkeypatch.setattr(coverage_tracker.swagger_tracker.settings, "results_dir", tmp_path)
+
+    for _ in range(3):
+        coverage_tracker.handle_response(
+            "/api/v1/courses/{course_id}", build_response("GET", "http://test/api/v1/courses/1", 200), 0
+        )
+    coverage_tracker.handle_response(
+        "/api/v1/courses/{course_id}", build_response("GET", "http://test/api/v1/courses/2", 404), 0
+    )
+    coverage_tracker.flush()
+
+    records = [json.loads(file.read_text()) for file in tmp_path.glob("*.json")]
+    assert sorted((record["name"], record["status_code"]) for record in records) == [
+        ("/api/v1/courses/{course_id}", 200),
+        ("/api/v1/courses/{course_id}", 404)
+    ]
+    assert not coverage_tracker.counters
+
+
+@pytest.mark.regression
+@allure.title("Skip endpoint coverage while coverage tracking is disabled")
+def test_disabled_coverage_still_notifies_listeners():
+    coverage_tracker = APICoverageTracker(service="api-course")
+    endpoints: list[str] = []
+    coverage_tracker.add_listener(lambda endpoint, response, elapsed: endpoints.append(endpoint))
+
+    coverage_tracker.coverage_enabled = False
+    coverage_tracker.handle_response("/api/v1/users/me", build_response("GET", "http://test/api/v1/users/me", 200), 0)
+
+    assert not coverage_tracker.counters
+    assert endpoints == ["/api/v1/users/me"]
@@ -0,0 +1,53 @@
+import copy
+import json
+
+import allure
+import httpx
+import pytest
+
+from clients.api_client import APIResponse
+from clients.users.users_schema import GetUserResponseSchema, UserSchema
+
+
+@pytest.fixture
+def api_response(monkeypatch: pytest.MonkeyPatch) -> tuple[APIResponse, list[bytes]]:
+    """
+    Ответ с пользователем и список тел, которые после его создания разобрал json.loads.
+    """
+    user = UserSchema(id="user-id", email="user@example.com")
+    response = httpx.Response(200, json={"user": user.model_dump(by_alias=True)}, request=httpx.Request("GET", "/"))
+
+    decoded: list[bytes] = []
+    loads = json.loads
+
+    def recording_loads(content: bytes):
+        decoded.append(content)
+        return loads(content)
+
+    monkeypatch.setattr(json, "loads", recording_loads)
+    return APIResponse(response), decoded
+
+
+@pytest.mark.regression
+@allure.title("Decode response body once for json and parse")
+def test_api_response_decodes_body_once(api_response: tuple[APIResponse, list[bytes]]):
+    response, decoded = api_response
+
+    payload = response.json()
+    model = response.parse(GetUserResponseSchema)
+
+    assert response.json() is payload
+    assert response.parse(GetUserResponseSchema) is model
+    assert model.user.id == payload["user"]["id"] == "user-id"
+    assert len(decoded) == 1
+
+
+@pytest.mark.regression
+@allure.title("Delegate response attributes to httpx.Response")
+def test_api_response_delegates_attributes(api_response: tuple[APIResponse, list[bytes]]):
+    response, _ = api_response
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert repr(response) == "<APIResponse [200]>"
+    assert copy.copy(response).status_code == 200
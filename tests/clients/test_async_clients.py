@@ -0,0 +1,148 @@
+import asyncio
+import time
+from http import HTTPStatus
+
+import allure
+import pytest
+from httpx import AsyncClient
+
+from clients.authentication.authentication_session import AuthenticationSession
+from clients.event_loop import run_coroutine
+from clients.private_http_builder import get_async_private_http_client
+from clients.users.private_users_client import (
+    AsyncPrivateUsersClient,
+    PrivateUsersClient,
+    get_async_private_users_client
+)
+from clients.users.users_schema import GetUserResponseSchema
+from fixtures.factories import gather_limited
+from fixtures.users import UserFixture
+from tools.assertions.base import assert_status_code
+
+
+def count_refreshes(session: AuthenticationSession, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Подменяет async_refresh сессии обёрткой, которая запоминает access токен на момент каждого обновления.
+    """
+    refreshes: list[str] = []
+    refresh = session.async_refresh
+
+    async def counted_refresh():
+        refreshes.append(session.token.access_token)
+        await refresh()
+
+    monkeypatch.setattr(session, "async_refresh", counted_refresh)
+    return refreshes
+
+
+async def get_user_me(client: AsyncPrivateUsersClient) -> GetUserResponseSchema:
+    response = await client.get_user_me_api()
+    assert_status_code(response.status_code, HTTPStatus.OK)
+    return response.parse(GetUserResponseSchema)
+
+
+@pytest.mark.regression
+@allure.title("Async client shares authentication session with sync client")
+def test_async_client_shares_authentication_session(
+        function_user: UserFixture,
+        private_users_client: PrivateUsersClient
+):
+    async_client = run_coroutine(get_async_private_users_client(function_user.authentication_user))
+
+    assert async_client.client.auth is private_users_client.client.auth
+    assert run_coroutine(get_user_me(async_client)).user.id == function_user.response.user.id
+
+
+@pytest.mark.regression
+@allure.title("Async client refreshes expired access token before request")
+def test_async_client_refreshes_expired_access_token(function_user: UserFixture, monkeypatch: pytest.MonkeyPatch):
+    async_client = run_coroutine(get_async_private_users_client(function_user.authentication_user))
+    session: AuthenticationSession = async_client.client.auth
+    refreshes = count_refreshes(session, monkeypatch)
+    expired_access_token = session.token.access_token
+
+    monkeypatch.setattr(session, "access_token_expires_at", time.time() - 1)
+    run_coroutine(get_user_me(async_client))
+
+    assert refreshes == [expired_access_token]
+    assert session.token.access_token != expired_access_token
+    assert not session.is_expired(session.access_token_expires_at)
+
+
+@pytest.mark.regression
+@allure.title("Async client refreshes token and retries request after 401")
+def test_async_client_retries_unauthorized_request(function_user: UserFixture, monkeypatch: pytest.MonkeyPatch):
+    async_client = run_coroutine(get_async_private_users_client(function_user.authentication_user))
+    session: AuthenticationSession = async_client.client.auth
+    refreshes = count_refreshes(session, monkeypatch)
+
+    # Токен без exp сессия не обновляет заранее, поэтому его отклонит сервер
+    session.set_token(session.token.model_copy(update={"access_token": "invalid-access-token"}))
+    user = run_coroutine(get_user_me(async_client)).user
+
+    assert user.id == function_user.response.user.id
+    assert refreshes == ["invalid-access-token"]
+    assert session.token.access_token != "invalid-access-token"
+
+
+@pytest.mark.regression
+@allure.title("Async client closes only HTTP client it owns")
+def test_async_client_exit_closes_only_owned_client(function_user: UserFixture):
+    async def exit_clients():
+        shared_client = await get_async_private_http_client(function_user.authentication_user)
+        async with AsyncPrivateUsersClient(client=shared_client):
+            pass
+
+        owned_client = AsyncClient()
+        async with AsyncPrivateUsersClient(client=owned_client, owns_client=True):
+            pass
+
+        return shared_client, owned_client
+
+    shared_client, owned_client = run_coroutine(exit_clients())
+
+    assert not shared_client.is_closed
+    assert owned_client.is_closed
+    assert run_coroutine(get_async_private_http_client(function_user.authentication_user)) is shared_client
+
+
+@pytest.mark.regression
+@allure.title("Limit concurrency and keep item order in gather_limited")
+def test_gather_limited_limits_concurrency_and_keeps_order():
+    running, max_running = 0, 0
+
+    async def square(item: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (item % 3))  # Вызовы завершаются не в порядке элементов
+        running -= 1
+        return item * item
+
+    results = run_coroutine(gather_limited(square, range(10), max_concurrency=3))
+
+    assert results == [item * item for item in range(10)]
+    assert max_running == 3
+
+
+@pytest.mark.regression
+@allure.title("Cancel unfinished calls when one call of gather_limited fails")
+def test_gather_limited_cancels_unfinished_calls_on_error():
+    cancelled: list[int] = []
+
+    async def fail_first(item: int):
+        if item == 0:
+            raise ValueError("first call failed")
+
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    with pytest.raises(ValueError, match="first call failed"):
+        run_coroutine(gather_limited(fail_first, range(4), max_concurrency=4))
+
+    # Отмена доставляется задачам на следующей итерации loop, даём им её обработать
+    run_coroutine(asyncio.sleep(0))
+    assert sorted(cancelled) == [1, 2, 3]
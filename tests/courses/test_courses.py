@@ -6,18 +6,22 @@ from allure_commons.types import Severity  # Импортируем enum Severit
 
 from clients.courses.courses_client import CoursesClient
 from clients.courses.courses_schema import UpdateCourseRequestSchema, UpdateCourseResponseSchema, GetCoursesQuerySchema, \
-    GetCoursesResponseSchema, CreateCourseRequestSchema, CreateCourseResponseSchema
-from fixtures.courses import CourseFixture
-from fixtures.files import FileFixture
+    GetCoursesResponseSchema, CreateCourseRequestSchema, CreateCourseResponseSchema, CourseSchema
+from config import settings
+from fixtures.factories import make_courses, get_courses_by_id
+from fixtures.pool import EntityBundle
 from fixtures.users import UserFixture
 from tools.allure.epics import AllureEpic  # Импортируем enum AllureEpic
 from tools.allure.features import AllureFeature  # Импортируем enum AllureFeature
 from tools.allure.stories import AllureStory  # Импортируем enum AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
+from tools.assertions.bulk import assert_entities_match
 from tools.assertions.courses import assert_update_course_response, assert_get_courses_response, \
     assert_create_course_response
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.latency import assert_latency_below
+from tools.assertions.schema import validate_json_schema, validate_json_schema_batch
+from tools.routes import APIRoutes
 
 
 @pytest.mark.courses
@@ -33,65 +37,88 @@ class TestCourses:
     @allure.title("Create course")
     @allure.severity(Severity.BLOCKER)  # Добавили severity
     @allure.sub_suite(AllureStory.CREATE_ENTITY)  # allure.sub_suite == allure.story
-    def test_create_course(self, courses_client: CoursesClient, function_file: FileFixture, function_user: UserFixture):
+    @pytest.mark.lease(depth="file")
+    def test_create_course(self, leased_entities: EntityBundle):
         """
         Тест проверяет создание курса через API.
         """
+        courses_client: CoursesClient = leased_entities.courses_client
         # Формируем данные для создания курса
         request = CreateCourseRequestSchema(
-            preview_file_id=function_file.response.file.id,
-            created_by_user_id=function_user.response.user.id
+            preview_file_id=leased_entities.file.response.file.id,
+            created_by_user_id=leased_entities.user.response.user.id
         )
         # Отправляем запрос на создание курса
         response = courses_client.create_course_api(request)
         # Преобразуем JSON-ответ в объект схемы
-        response_data = CreateCourseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateCourseResponseSchema)
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что данные в ответе соответствуют запросу
         assert_create_course_response(request, response_data)
         # Валидируем JSON-схему ответа
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateCourseResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
     @allure.title("Get courses")
     @allure.severity(Severity.BLOCKER)  # Добавили severity
     @allure.sub_suite(AllureStory.GET_ENTITIES)  # allure.sub_suite == allure.story
-    def test_get_courses(
-            self,
-            courses_client: CoursesClient,
-            function_user: UserFixture,
-            function_course: CourseFixture
-    ):
+    def test_get_courses(self, shared_entities: EntityBundle):
+        courses_client: CoursesClient = shared_entities.courses_client
         # Формируем параметры запроса, передавая user_id
-        query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
+        query = GetCoursesQuerySchema(user_id=shared_entities.user.response.user.id)
         # Отправляем GET-запрос на получение списка курсов
         response = courses_client.get_courses_api(query)
         # Десериализуем JSON-ответ в Pydantic-модель
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetCoursesResponseSchema)
 
         # Проверяем, что код ответа 200 OK
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что список курсов соответствует ранее созданным курсам
-        assert_get_courses_response(response_data, [function_course.response])
+        assert_get_courses_response(response_data, [shared_entities.course.response])
 
         # Проверяем соответствие JSON-ответа схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetCoursesResponseSchema)
+        # Проверяем, что список отдаётся не медленнее SLA
+        assert_latency_below(f"GET {APIRoutes.COURSES}", settings.latency.p95_ms)
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.title("Get many courses")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    def test_get_many_courses(self, courses_client: CoursesClient, function_user: UserFixture):
+        # Создаём список курсов параллельно, а не по одному
+        courses = make_courses(settings.test_data.list_size, function_user)
+        query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
+        response = courses_client.get_courses_api(query)
+        response_data = response.parse(GetCoursesResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        # Курсы создавались параллельно, поэтому порядок в списке не гарантирован
+        assert_get_courses_response(response_data, [course.response for course in courses], ordered=False)
+        # Каждый курс списка проверяем одним валидатором схемы элемента
+        validate_json_schema_batch(response.json()["courses"], CourseSchema)
+        # Каждый курс списка совпадает с тем, что возвращает получение курса по id (запросы идут конкурентно)
+        courses_by_id = get_courses_by_id([course.id for course in response_data.courses], function_user)
+        assert_entities_match(courses_by_id, response_data.courses, "courses")
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
     @allure.title("Update course")
     @allure.severity(Severity.CRITICAL)  # Добавили severity
     @allure.sub_suite(AllureStory.UPDATE_ENTITY)  # allure.sub_suite == allure.story
-    def test_update_course(self, courses_client: CoursesClient, function_course: CourseFixture):
+    @pytest.mark.lease(depth="course")
+    def test_update_course(self, leased_entities: EntityBundle):
+        courses_client: CoursesClient = leased_entities.courses_client
         # Формируем данные для обновления
         request = UpdateCourseRequestSchema()
         # Отправляем запрос на обновление курса
-        response = courses_client.update_course_api(function_course.response.course.id, request)
+        response = courses_client.update_course_api(leased_entities.course.response.course.id, request)
         # Преобразуем JSON-ответ в объект схемы
-        response_data = UpdateCourseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(UpdateCourseResponseSchema)
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
@@ -99,7 +126,7 @@ class TestCourses:
         assert_update_course_response(request, response_data)
 
         # Валидируем JSON-схему ответа
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UpdateCourseResponseSchema)
 
 
 
@@ -8,17 +8,23 @@ from clients.errors_schema import InternalErrorResponseSchema
 from clients.exercises.exercises_client import ExercisesClient
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema, \
     GetExerciseResponseSchema, UpdateExerciseResponseSchema, UpdateExerciseRequestSchema, GetExercisesQuerySchema, \
-    GetExercisesResponseSchema
+    GetExercisesResponseSchema, ExerciseSchema
+from config import settings
 from fixtures.courses import CourseFixture
-from fixtures.exercises import ExerciseFixture
+from fixtures.factories import make_exercises, get_exercises_by_id
+from fixtures.pool import EntityBundle
+from fixtures.users import UserFixture
 from tools.allure.epics import AllureEpic  # Импортируем enum AllureEpic
 from tools.allure.features import AllureFeature  # Импортируем enum AllureFeature
 from tools.allure.stories import AllureStory  # Импортируем enum AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
+from tools.assertions.bulk import assert_entities_match
 from tools.assertions.exercises import assert_create_exercise_response, assert_exercise, \
     assert_update_exercise_response, assert_exercise_not_found_response, assert_get_exercises_response
-from tools.assertions.schema import validate_json_schema
+from tools.assertions.latency import assert_latency_below
+from tools.assertions.schema import validate_json_schema, validate_json_schema_batch
+from tools.routes import APIRoutes
 
 
 
@@ -35,24 +41,25 @@ class TestExercises:
     @allure.title("Create exercise")
     @allure.severity(Severity.BLOCKER)  # Добавили severity
     @allure.sub_suite(AllureStory.CREATE_ENTITY)  # allure.sub_suite == allure.story
-    def test_create_exercise(self, exercises_client: ExercisesClient, function_course: CourseFixture):
+    @pytest.mark.lease(depth="course")
+    def test_create_exercise(self, leased_entities: EntityBundle):
         """
         Тест проверяет создание задания через API.
 
-        :param exercises_client: Экземпляр ExercisesClient для выполнения API-запросов
-        :param function_course: Фикстура, предоставляющая данные курса
+        :param leased_entities: Арендованный набор сущностей, предоставляющий курс и его клиент
         :raises AssertionError: Если код ответа, тело ответа или JSON-схема не соответствуют ожидаемым
         """
+        exercises_client: ExercisesClient = leased_entities.exercises_client
         # Формируем данные для создания задания, используя схему CreateExerciseRequestSchema
         request = CreateExerciseRequestSchema(
-            course_id=function_course.response.course.id
+            course_id=leased_entities.course.response.course.id
         )
 
         # Отправляем запрос на создание задания
         response = exercises_client.create_exercise_api(request)
 
         # Преобразуем JSON-ответ в объект схемы CreateExerciseResponseSchema
-        response_data = CreateExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateExerciseResponseSchema)
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
@@ -65,41 +72,42 @@ class TestExercises:
     @allure.title("Get exercise")
     @allure.severity(Severity.BLOCKER)  # Добавили severity
     @allure.sub_suite(AllureStory.GET_ENTITY)  # allure.sub_suite == allure.story
-    def test_get_exercise(self, exercises_client: ExercisesClient, function_exercise: ExerciseFixture):
+    def test_get_exercise(self, shared_entities: EntityBundle):
         """
         Тест проверяет получение задания через API.
 
-        :param exercises_client: Экземпляр ExercisesClient для выполнения API-запросов
-        :param function_exercise: Фикстура, предоставляющая данные задания
+        :param shared_entities: Общий набор сущностей, предоставляющий задание и его клиент
         :raises AssertionError: Если код ответа, тело ответа или JSON-схема не соответствуют ожидаемым
         """
+        exercises_client: ExercisesClient = shared_entities.exercises_client
         # Отправляем GET-запрос на получение задания
-        response = exercises_client.get_exercise_api(function_exercise.response.exercise.id)
+        response = exercises_client.get_exercise_api(shared_entities.exercise.response.exercise.id)
 
         # Десериализуем JSON-ответ в Pydantic-модель
-        response_data = GetExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetExerciseResponseSchema)
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверяем, что данные задания соответствуют ожидаемым
-        assert_exercise(response_data.exercise, function_exercise.response.exercise)
+        assert_exercise(response_data.exercise, shared_entities.exercise.response.exercise)
 
         # Проверяем соответствие JSON-ответа схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetExerciseResponseSchema)
 
     @allure.tag(AllureTag.UPDATE_ENTITY)
     @allure.story(AllureStory.UPDATE_ENTITY)
     @allure.title("Update exercise")
     @allure.severity(Severity.CRITICAL)  # Добавили severity
     @allure.sub_suite(AllureStory.UPDATE_ENTITY)  # allure.sub_suite == allure.story
-    def test_update_exercise(self, exercises_client: ExercisesClient, function_exercise: ExerciseFixture):
+    def test_update_exercise(self, leased_entities: EntityBundle):
+        exercises_client: ExercisesClient = leased_entities.exercises_client
         # Формируем данные для обновления
         request = UpdateExerciseRequestSchema()
         # Отправляем запрос на обновление курса
-        response = exercises_client.update_exercise_api(function_exercise.response.exercise.id, request)
+        response = exercises_client.update_exercise_api(leased_entities.exercise.response.exercise.id, request)
         # Преобразуем JSON-ответ в объект схемы
-        response_data = UpdateExerciseResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(UpdateExerciseResponseSchema)
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
@@ -107,26 +115,27 @@ class TestExercises:
         assert_update_exercise_response(request, response_data)
 
         # Валидируем JSON-схему ответа
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), UpdateExerciseResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.title("Delete exercise")
     @allure.severity(Severity.CRITICAL)  # Добавили severity
     @allure.sub_suite(AllureStory.DELETE_ENTITY)  # allure.sub_suite == allure.story
-    def test_delete_exercise(self, exercises_client: ExercisesClient, function_exercise: ExerciseFixture):
+    def test_delete_exercise(self, leased_entities: EntityBundle):
         """
         Тест проверяет удаление задания и последующую попытку его получения.
         """
+        exercises_client: ExercisesClient = leased_entities.exercises_client
         # 1. Удаляем файл
-        delete_response = exercises_client.delete_exercise_api(function_exercise.response.exercise.id)
+        delete_response = exercises_client.delete_exercise_api(leased_entities.exercise.response.exercise.id)
         # 2. Проверяем, что файл успешно удален (статус 200 OK)
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
         # 3. Пытаемся получить удаленное задание
         # отправляем GET-запрос на получение задания
-        get_response = exercises_client.get_exercise_api(function_exercise.response.exercise.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_response = exercises_client.get_exercise_api(leased_entities.exercise.response.exercise.id)
+        get_response_data = get_response.parse(InternalErrorResponseSchema)
 
         # 4. Проверяем, что сервер вернул 404 Not Found
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
@@ -134,24 +143,46 @@ class TestExercises:
         assert_exercise_not_found_response(get_response_data)
 
         # 6. Проверяем, что ответ соответствует схеме
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
     @allure.title("Get exercises")
     @allure.severity(Severity.BLOCKER)  # Добавили severity
     @allure.sub_suite(AllureStory.GET_ENTITIES)  # allure.sub_suite == allure.story
-    def test_get_exercises(
+    def test_get_exercises(self, shared_entities: EntityBundle):
+        exercises_client: ExercisesClient = shared_entities.exercises_client
+        query = GetExercisesQuerySchema(course_id=shared_entities.course.response.course.id)
+        response = exercises_client.get_exercises_api(query)
+        response_data = response.parse(GetExercisesResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_get_exercises_response(response_data, [shared_entities.exercise.response])
+
+        validate_json_schema(response.json(), GetExercisesResponseSchema)
+        assert_latency_below(f"GET {APIRoutes.EXERCISES}", settings.latency.p95_ms)
+
+    @allure.tag(AllureTag.GET_ENTITIES)
+    @allure.story(AllureStory.GET_ENTITIES)
+    @allure.title("Get many exercises")
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.GET_ENTITIES)
+    def test_get_many_exercises(
             self,
             exercises_client: ExercisesClient,
-            function_course: CourseFixture,
-            function_exercise: ExerciseFixture
+            function_user: UserFixture,
+            function_course: CourseFixture
     ):
+        exercises = make_exercises(settings.test_data.list_size, function_course, function_user)
         query = GetExercisesQuerySchema(course_id=function_course.response.course.id)
         response = exercises_client.get_exercises_api(query)
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetExercisesResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_exercises_response(response_data, [function_exercise.response])
-
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        # Задания создавались параллельно, поэтому порядок в списке не гарантирован
+        assert_get_exercises_response(response_data, [exercise.response for exercise in exercises], ordered=False)
+        # Каждое задание списка проверяем одним валидатором схемы элемента
+        validate_json_schema_batch(response.json()["exercises"], ExerciseSchema)
+        # Каждое задание списка совпадает с тем, что возвращает получение задания по id (запросы идут конкурентно)
+        exercises_by_id = get_exercises_by_id([exercise.id for exercise in response_data.exercises], function_user)
+        assert_entities_match(exercises_by_id, response_data.exercises, "exercises")
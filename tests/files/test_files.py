@@ -6,9 +6,10 @@ from allure_commons.types import Severity
 
 from clients.errors_schema import ValidationErrorResponseSchema, InternalErrorResponseSchema
 from clients.files.files_client import FilesClient
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema, \
+    CreateGeneratedFileRequestSchema
 from config import settings
-from fixtures.files import FileFixture
+from fixtures.pool import EntityBundle
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
 from tools.allure.stories import AllureStory
@@ -16,7 +17,7 @@ from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.files import assert_create_file_response, assert_create_file_with_empty_filename_response, \
     assert_create_file_with_empty_directory_response, assert_file_not_found_response, \
-    assert_get_file_with_incorrect_file_id_response, assert_get_file_response
+    assert_get_file_with_incorrect_file_id_response, assert_get_file_response, assert_downloaded_file
 from tools.assertions.schema import validate_json_schema
 
 
@@ -33,93 +34,116 @@ class TestFiles:
     @allure.title("Create file")
     @allure.severity(Severity.BLOCKER)
     @allure.sub_suite(AllureStory.CREATE_ENTITY)
-    def test_create_file(self, files_client: FilesClient):
+    @pytest.mark.lease(depth="user")
+    def test_create_file(self, leased_entities: EntityBundle):
+        files_client: FilesClient = leased_entities.files_client
         request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
         response = files_client.create_file_api(request)
-        response_data = CreateFileResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_file_response(request, response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateFileResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
     @allure.title("Get file")
     @allure.severity(Severity.BLOCKER)
     @allure.sub_suite(AllureStory.GET_ENTITY)
-    def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
-        response = files_client.get_file_api(function_file.response.file.id)
-        response_data = GetFileResponseSchema.model_validate_json(response.text)
+    def test_get_file(self, shared_entities: EntityBundle):
+        files_client: FilesClient = shared_entities.files_client
+        response = files_client.get_file_api(shared_entities.file.response.file.id)
+        response_data = response.parse(GetFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_file_response(response_data, function_file.response)
+        assert_get_file_response(response_data, shared_entities.file.response)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), GetFileResponseSchema)
+
+    @allure.tag(AllureTag.GET_ENTITY)
+    @allure.story(AllureStory.GET_ENTITY)
+    @allure.title("Download file")
+    @allure.severity(Severity.CRITICAL)
+    @allure.sub_suite(AllureStory.GET_ENTITY)
+    @pytest.mark.lease(depth="user")
+    def test_download_file(self, leased_entities: EntityBundle):
+        files_client: FilesClient = leased_entities.files_client
+        request = CreateGeneratedFileRequestSchema(upload_size=settings.test_data.generated_file_size)
+        response = files_client.create_file(request)
+
+        download = files_client.download_file(response.file.url)
+
+        assert_downloaded_file(request, download)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.story(AllureStory.DELETE_ENTITY)
     @allure.title("Delete file")
     @allure.severity(Severity.NORMAL)
     @allure.sub_suite(AllureStory.DELETE_ENTITY)
-    def test_delete_file(self, files_client: FilesClient, function_file: FileFixture):
-        delete_response = files_client.delete_file_api(function_file.response.file.id)
+    @pytest.mark.lease(depth="file")
+    def test_delete_file(self, leased_entities: EntityBundle):
+        files_client: FilesClient = leased_entities.files_client
+        delete_response = files_client.delete_file_api(leased_entities.file.response.file.id)
         assert_status_code(delete_response.status_code, HTTPStatus.OK)
 
-        get_response = files_client.get_file_api(function_file.response.file.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_response = files_client.get_file_api(leased_entities.file.response.file.id)
+        get_response_data = get_response.parse(InternalErrorResponseSchema)
 
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         assert_file_not_found_response(get_response_data)
 
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_response.json(), InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.title("Create file with empty filename")
     @allure.severity(Severity.NORMAL)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
-    def test_create_file_with_empty_filename(self, files_client: FilesClient):
+    def test_create_file_with_empty_filename(self, shared_entities: EntityBundle):
+        files_client: FilesClient = shared_entities.files_client
         request = CreateFileRequestSchema(
             filename="",
             upload_file=settings.test_data.image_png_file
         )
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_file_with_empty_filename_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.title("Create file with empty directory")
     @allure.severity(Severity.NORMAL)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
-    def test_create_file_with_empty_directory(self, files_client: FilesClient):
+    def test_create_file_with_empty_directory(self, shared_entities: EntityBundle):
+        files_client: FilesClient = shared_entities.files_client
         request = CreateFileRequestSchema(
             directory="",
             upload_file=settings.test_data.image_png_file
         )
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_create_file_with_empty_directory_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
     @allure.title("Get file with incorrect file id")
     @allure.severity(Severity.NORMAL)
     @allure.sub_suite(AllureStory.VALIDATE_ENTITY)
-    def test_get_file_with_incorrect_file_id(self, files_client: FilesClient):
+    def test_get_file_with_incorrect_file_id(self, shared_entities: EntityBundle):
+        files_client: FilesClient = shared_entities.files_client
         response = files_client.get_file_api("incorrect-file-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(ValidationErrorResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         assert_get_file_with_incorrect_file_id_response(response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        validate_json_schema(response.json(), ValidationErrorResponseSchema)
\ No newline at end of file
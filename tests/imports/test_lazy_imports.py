@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import allure
+import pytest
+
+# Импорт всех модулей пакета clients в чистом интерпретаторе и размер кеша настроек после него
+IMPORT_CLIENTS_CODE = """
+import importlib, pkgutil
+import clients
+from config import get_settings
+
+for module in pkgutil.walk_packages(clients.__path__, "clients."):
+    importlib.import_module(module.name)
+
+print(get_settings.cache_info().currsize)
+"""
+
+
+@pytest.mark.regression
+@allure.title("Import API clients without loading settings")
+def test_import_clients_does_not_load_settings():
+    # Текущий процесс pytest уже загрузил настройки, поэтому проверяем импорт в отдельном интерпретаторе
+    result = subprocess.run([sys.executable, "-c", IMPORT_CLIENTS_CODE], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "0", "Importing clients.* must not create settings"
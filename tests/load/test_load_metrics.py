@@ -0,0 +1,150 @@
+import pickle
+
+import allure
+import httpx
+import pytest
+
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.load.metrics import LoadMetrics, RouteReport
+from tools.load.runner import LoadConfig, LoadReport, build_load_report
+from tools.stats import percentile
+
+
+def build_response(method: str, url: str, status_code: int) -> httpx.Response:
+    return httpx.Response(status_code, request=httpx.Request(method, url))
+
+
+def build_metrics(route: str, latencies_ms: list[float], errors: int = 0, failed_scenarios: int = 0) -> LoadMetrics:
+    """
+    Создаёт накопитель с заданными длительностями ответов маршрута GET; первые errors ответов — ошибки 500.
+    """
+    metrics = LoadMetrics()
+    for index, latency_ms in enumerate(latencies_ms):
+        status_code = 500 if index < errors else 200
+        metrics.record_response(route, build_response("GET", f"http://test{route}", status_code), latency_ms / 1000)
+
+    for _ in range(failed_scenarios):
+        metrics.record_failed_scenario()
+
+    return metrics
+
+
+@pytest.mark.load
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.LOAD_SCENARIOS)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.LOAD_SCENARIOS)
+class TestLoadMetrics:
+    @pytest.mark.parametrize(
+        "percent, expected",
+        [(0, 1.0), (1, 1.0), (50, 50.0), (95, 95.0), (99, 99.0), (99.5, 100.0), (100, 100.0)]
+    )
+    @allure.title("Calculate nearest rank percentile")
+    def test_percentile(self, percent: float, expected: float):
+        samples = [float(value) for value in range(1, 101)]
+
+        assert percentile(samples, percent) == expected
+
+    @allure.title("Calculate percentile of empty and single sample")
+    def test_percentile_of_few_samples(self):
+        assert percentile([], 95) == 0.0
+        assert percentile([7.0], 50) == 7.0
+        assert percentile([7.0], 99) == 7.0
+
+    @allure.title("Build route reports from recorded responses")
+    def test_build_reports(self):
+        metrics = build_metrics("/api/v1/courses", [40.0, 10.0, 30.0, 20.0], errors=1)
+        metrics.record_response("/api/v1/users", build_response("POST", "http://test/api/v1/users", 200), 0.005)
+
+        reports = metrics.build_reports(duration=2.0)
+
+        assert reports == [
+            RouteReport(
+                route="GET /api/v1/courses",
+                requests=4,
+                errors=1,
+                throughput=2.0,
+                p50_ms=20.0,
+                p95_ms=40.0,
+                p99_ms=40.0
+            ),
+            RouteReport(
+                route="POST /api/v1/users",
+                requests=1,
+                errors=0,
+                throughput=0.5,
+                p50_ms=5.0,
+                p95_ms=5.0,
+                p99_ms=5.0
+            ),
+        ]
+
+    @allure.title("Merge metrics of workers passed between processes")
+    def test_merge_pickled_metrics(self):
+        first = build_metrics("/api/v1/courses", [10.0, 30.0], errors=1, failed_scenarios=1)
+        second = build_metrics("/api/v1/courses", [20.0, 40.0], errors=2, failed_scenarios=2)
+        # Метрики воркеров ProcessPoolExecutor возвращает через pickle
+        first, second = pickle.loads(pickle.dumps(first)), pickle.loads(pickle.dumps(second))
+
+        merged = LoadMetrics()
+        merged.merge(first)
+        merged.merge(second)
+
+        assert sorted(merged.latencies["GET /api/v1/courses"]) == [10.0, 20.0, 30.0, 40.0]
+        assert merged.errors == {"GET /api/v1/courses": 3}
+        assert merged.failed_scenarios == 3
+
+    @allure.title("Aggregate worker results into load report")
+    def test_build_load_report(self):
+        config = LoadConfig(scenario="create_course", duration=1, processes=2)
+        results = [
+            (build_metrics("/api/v1/courses", [float(value) for value in range(1, 51)], failed_scenarios=1), 50),
+            (build_metrics("/api/v1/courses", [float(value) for value in range(51, 101)], errors=5), 45),
+        ]
+
+        report = build_load_report(config, results, duration=4.0)
+
+        assert report == LoadReport(
+            scenario="create_course",
+            duration=4.0,
+            iterations=95,
+            failed_iterations=1,
+            routes=[
+                RouteReport(
+                    route="GET /api/v1/courses",
+                    requests=100,
+                    errors=5,
+                    throughput=25.0,
+                    p50_ms=50.0,
+                    p95_ms=95.0,
+                    p99_ms=99.0
+                )
+            ]
+        )
+
+    @allure.title("Format load report table")
+    def test_format_table(self):
+        report = LoadReport(
+            scenario="get_exercises",
+            duration=2.0,
+            iterations=10,
+            failed_iterations=1,
+            routes=[
+                RouteReport(
+                    route="GET /api/v1/exercises",
+                    requests=20,
+                    errors=2,
+                    throughput=10.0,
+                    p50_ms=1.5,
+                    p95_ms=3.0,
+                    p99_ms=4.5
+                )
+            ]
+        )
+
+        assert report.format_table().splitlines() == [
+            "Scenario: get_exercises, duration: 2.0s, iterations: 10, failed: 1",
+            f"{'Route':<45} {'Requests':>9} {'Errors':>7} {'RPS':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+            f"{'GET /api/v1/exercises':<45} {20:>9} {2:>7} {'10.0':>8} {'1.5':>9} {'3.0':>9} {'4.5':>9}",
+        ]
@@ -0,0 +1,39 @@
+import allure
+import pytest
+
+from clients.api_coverage import tracker
+from config import settings
+from tools.allure.epics import AllureEpic
+from tools.allure.features import AllureFeature
+from tools.load.runner import LoadConfig, run_load
+from tools.load.scenarios import SCENARIOS
+
+
+@pytest.mark.load
+@allure.epic(AllureEpic.LMS)
+@allure.feature(AllureFeature.LOAD_SCENARIOS)
+@allure.parent_suite(AllureEpic.LMS)
+@allure.suite(AllureFeature.LOAD_SCENARIOS)
+class TestLoadScenarios:
+    @pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+    @allure.title("Run load scenario")
+    def test_load_scenario(self, scenario: str):
+        # Нагрузка на реальный сервер и воспроизведение из кассеты здесь не нужны: сценарии проверяются на фейковом
+        if settings.http_client.mode != "fake":
+            pytest.skip("Load scenarios are checked against the fake server (HTTP_CLIENT.MODE=fake)")
+
+        report = run_load(LoadConfig(scenario=scenario, duration=0.3, concurrency=2))
+
+        assert report.iterations > 0
+        assert report.failed_iterations == 0, f"{report.failed_iterations} of {report.iterations} iterations failed"
+
+    @allure.title("Keep load traffic out of endpoint coverage")
+    def test_load_does_not_track_coverage(self):
+        if settings.http_client.mode != "fake":
+            pytest.skip("Load scenarios are checked against the fake server (HTTP_CLIENT.MODE=fake)")
+
+        counters = tracker.counters.copy()
+        run_load(LoadConfig(scenario="create_user", duration=0.1, concurrency=1))
+
+        assert tracker.counters == counters
+        assert tracker.coverage_enabled
@@ -0,0 +1,121 @@
+import base64
+import json
+import time
+from pathlib import Path
+
+import allure
+import httpx
+import pytest
+
+from clients.authentication.authentication_session import get_token_expiry
+from clients.event_loop import run_coroutine
+from tools.http.cassette import Cassette, CassetteMissError, RecordingTransport, ReplayTransport
+
+
+def build_jwt(issued_at: int, lifetime: int) -> str:
+    payload = json.dumps({"iat": issued_at, "exp": issued_at + lifetime}).encode("utf-8")
+    return f"header.{base64.urlsafe_b64encode(payload).rstrip(b'=').decode('ascii')}.signature"
+
+
+# Записанный в прошлом токен: при воспроизведении он был бы давно истёкшим
+RECORDED_TOKEN = build_jwt(issued_at=1_000_000_000, lifetime=1800)
+
+
+class RecordedServer:
+    """
+    Сервер, на котором записывается кассета: отвечает номером запроса к пути и эхом тела.
+    """
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls[request.url.path] = self.calls.get(request.url.path, 0) + 1
+        if request.url.path == "/api/v1/authentication/login":
+            return httpx.Response(200, json={"token": {"accessToken": RECORDED_TOKEN}})
+
+        return httpx.Response(200, json={"call": self.calls[request.url.path], "body": request.read().decode("utf-8")})
+
+
+def record_requests(client: httpx.Client) -> list[httpx.Response]:
+    return [
+        client.post("/api/v1/courses", json={"title": "Course", "maxScore": 100}),
+        client.post("/api/v1/courses", json={"title": "Course", "maxScore": 100}),
+        client.get("/api/v1/courses/5f0c", params={"userId": "5f0c"}),
+        client.post("/api/v1/files", files={"upload_file": ("file.txt", b"content", "text/plain")}),
+        client.post("/api/v1/authentication/login", json={"email": "user@example.com"}),
+    ]
+
+
+@pytest.fixture
+def cassette_path(tmp_path: Path) -> Path:
+    path = tmp_path / "api.jsonl.gz"
+
+    cassette = Cassette(path)
+    transport = RecordingTransport(httpx.MockTransport(RecordedServer().handle_request), cassette)
+    with httpx.Client(base_url="http://test", transport=transport) as client:
+        record_requests(client)
+    cassette.close()
+
+    return path
+
+
+@pytest.fixture
+def replay_client(cassette_path: Path) -> httpx.Client:
+    cassette = Cassette(cassette_path)
+    cassette.load()
+
+    with httpx.Client(base_url="http://test", transport=ReplayTransport(cassette)) as client:
+        yield client
+
+
+@pytest.mark.regression
+@allure.title("Replay recorded exchanges in recording order")
+def test_replay_recorded_exchanges(replay_client: httpx.Client):
+    first, second, course, file, _ = record_requests(replay_client)
+
+    # Одинаковые запросы получают ответы в порядке записи
+    assert (first.json()["call"], second.json()["call"]) == (1, 2)
+    assert course.json()["call"] == 1
+    # Случайный boundary multipart тела не мешает сопоставлению
+    assert "content" in file.json()["body"]
+
+
+@pytest.mark.regression
+@allure.title("Replay exchange with the same body shape and different data")
+def test_replay_matches_body_shape(replay_client: httpx.Client):
+    response = replay_client.post("/api/v1/courses", json={"title": "Another course", "maxScore": 5})
+
+    assert json.loads(response.json()["body"]) == {"title": "Course", "maxScore": 100}
+    with pytest.raises(CassetteMissError):
+        replay_client.post("/api/v1/courses", json={"description": "Course"})
+
+
+@pytest.mark.regression
+@allure.title("Fail on request missing from cassette")
+def test_replay_unknown_request(replay_client: httpx.Client):
+    with pytest.raises(CassetteMissError, match="No recorded response for DELETE"):
+        replay_client.delete("/api/v1/courses/5f0c")
+
+
+@pytest.mark.regression
+@allure.title("Extend expiry of recorded JWT on replay")
+def test_replay_refreshes_jwt_expiry(replay_client: httpx.Client):
+    response = replay_client.post("/api/v1/authentication/login", json={"email": "user@example.com"})
+
+    expires_at = get_token_expiry(response.json()["token"]["accessToken"])
+    assert expires_at is not None and abs(expires_at - (time.time() + 1800)) < 5
+
+
+@pytest.mark.regression
+@allure.title("Replay recorded exchanges through async client")
+def test_replay_async_client(cassette_path: Path):
+    cassette = Cassette(cassette_path)
+    cassette.load()
+
+    async def get_course() -> httpx.Response:
+        async with httpx.AsyncClient(base_url="http://test", transport=ReplayTransport(cassette)) as client:
+            # Маршрут сопоставляется по шаблону, поэтому другие идентификаторы и значения query не мешают
+            return await client.get("/api/v1/courses/a1b2", params={"userId": "a1b2"})
+
+    assert run_coroutine(get_course()).json()["call"] == 1
@@ -0,0 +1,78 @@
+import allure
+import httpx
+import pytest
+
+from clients.users.users_schema import CreateUserRequestSchema
+from tools.fake_server.server import FakeServer
+
+
+@pytest.fixture
+def fake_client() -> httpx.Client:
+    # Отдельный экземпляр сервера, чтобы проверки не зависели от данных остальных тестов
+    server = FakeServer(base_url="http://fake")
+    with httpx.Client(base_url="http://fake", transport=httpx.MockTransport(server.handle_request)) as client:
+        yield client
+
+
+@pytest.fixture
+def user_tokens(fake_client: httpx.Client) -> dict[str, str]:
+    request = CreateUserRequestSchema()
+    fake_client.post("/api/v1/users", json=request.model_dump(by_alias=True)).raise_for_status()
+
+    login = {"email": request.email, "password": request.password}
+    response = fake_client.post("/api/v1/authentication/login", json=login)
+    response.raise_for_status()
+    return response.json()["token"]
+
+
+@pytest.mark.regression
+@allure.title("Fake server authorizes requests with issued access token")
+def test_fake_server_access_token(fake_client: httpx.Client, user_tokens: dict[str, str]):
+    me = fake_client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {user_tokens['accessToken']}"})
+    without_token = fake_client.get("/api/v1/users/me")
+    refresh_as_access = fake_client.get(
+        "/api/v1/users/me", headers={"Authorization": f"Bearer {user_tokens['refreshToken']}"}
+    )
+
+    assert me.status_code == 200
+    assert (without_token.status_code, without_token.json()) == (403, {"detail": "Not authenticated"})
+    assert (refresh_as_access.status_code, refresh_as_access.json()) == (401, {"detail": "Invalid or expired token"})
+
+
+@pytest.mark.regression
+@allure.title("Fake server refreshes tokens only with refresh token")
+def test_fake_server_refresh_token(fake_client: httpx.Client, user_tokens: dict[str, str]):
+    refreshed = fake_client.post("/api/v1/authentication/refresh", json={"refreshToken": user_tokens["refreshToken"]})
+    rejected = fake_client.post("/api/v1/authentication/refresh", json={"refreshToken": user_tokens["accessToken"]})
+
+    assert refreshed.status_code == 200
+    assert refreshed.json()["token"]["accessToken"] != user_tokens["accessToken"]
+    assert (rejected.status_code, rejected.json()) == (401, {"detail": "Invalid refresh token"})
+
+
+@pytest.mark.regression
+@allure.title("Fake server returns validation errors in FastAPI format")
+def test_fake_server_validation_error(fake_client: httpx.Client, user_tokens: dict[str, str]):
+    headers = {"Authorization": f"Bearer {user_tokens['accessToken']}"}
+
+    response = fake_client.get("/api/v1/courses/not-a-uuid", headers=headers)
+
+    assert response.status_code == 422
+    [detail] = response.json()["detail"]
+    assert detail["loc"] == ["path", "course_id"]
+    assert detail["type"] == "uuid_parsing"
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize(
+    "method, path, status_code, detail",
+    [
+        ("GET", "/api/v1/unknown", 404, "Not Found"),
+        ("PUT", "/api/v1/users", 405, "Method Not Allowed"),
+    ]
+)
+@allure.title("Fake server answers unknown routes like FastAPI")
+def test_fake_server_unknown_route(fake_client: httpx.Client, method: str, path: str, status_code: int, detail: str):
+    response = fake_client.request(method, path)
+
+    assert (response.status_code, response.json()) == (status_code, {"detail": detail})
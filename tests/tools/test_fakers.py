@@ -0,0 +1,61 @@
+import re
+
+import allure
+import pytest
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from tools.fakers import BatchFake
+
+# Маленьких словарей достаточно для проверки, а строятся они заметно быстрее
+VOCABULARY_SIZE = 50
+UUID4_PATTERN = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}")
+
+
+def build_batch(seed: int) -> BatchFake:
+    return BatchFake(locale="ru_RU", vocabulary_size=VOCABULARY_SIZE, seed=seed)
+
+
+@pytest.mark.regression
+@allure.title("Generate the same batches from the same seed")
+def test_batch_same_seed_is_reproducible():
+    first, second = build_batch(seed=1), build_batch(seed=1)
+
+    assert first.course_requests(5) == second.course_requests(5)
+    assert first.exercise_requests(5, course_id="5f0c") == second.exercise_requests(5, course_id="5f0c")
+    assert first.user_requests(5) == second.user_requests(5)
+
+
+@pytest.mark.regression
+@allure.title("Generate different batches from different seeds")
+def test_batch_different_seeds_differ():
+    first, second = build_batch(seed=1), build_batch(seed=2)
+
+    assert first.uuids(5) != second.uuids(5)
+    assert first.titles(5) != second.titles(5)
+    # Словари строятся с фиксированным seed, различаются только выборки из них
+    assert first.vocabulary == second.vocabulary
+
+
+@pytest.mark.regression
+@allure.title("Generate valid course and exercise request batches")
+def test_batch_requests_are_valid():
+    batch = build_batch(seed=1)
+
+    courses = batch.course_requests(10, created_by_user_id="5f0c")
+    exercises = batch.exercise_requests(10)
+
+    assert all(isinstance(course, CreateCourseRequestSchema) for course in courses)
+    assert all(course.created_by_user_id == "5f0c" for course in courses)
+    assert all(1 <= course.min_score <= 30 and 50 <= course.max_score <= 100 for course in courses)
+    assert all(isinstance(exercise, CreateExerciseRequestSchema) for exercise in exercises)
+    assert all(UUID4_PATTERN.fullmatch(exercise.course_id) for exercise in exercises)
+
+
+@pytest.mark.regression
+@allure.title("Generate unique titles and emails within batch")
+def test_batch_values_are_unique():
+    batch = build_batch(seed=1)
+
+    assert len(set(batch.titles(100))) == 100
+    assert len(set(batch.emails(100, domain="example.com"))) == 100
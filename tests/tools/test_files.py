@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+import allure
+import pytest
+
+from tools.files import GeneratedFile, get_file_digest
+
+# Размер не кратен блоку, чтобы последний блок читался не целиком
+FILE_SIZE = GeneratedFile.BLOCK_SIZE * 2 + 123
+
+
+@pytest.mark.regression
+@allure.title("Read generated file in chunks across block boundaries")
+def test_generated_file_chunked_read_matches_full_read():
+    content = GeneratedFile(FILE_SIZE, seed=1).read()
+
+    file, chunks = GeneratedFile(FILE_SIZE, seed=1), []
+    while chunk := file.read(1000):
+        chunks.append(chunk)
+
+    assert len(content) == FILE_SIZE
+    assert b"".join(chunks) == content
+    assert file.read() == b""
+
+
+@pytest.mark.regression
+@allure.title("Generate the same content from the same seed")
+def test_generated_file_is_deterministic():
+    assert GeneratedFile(FILE_SIZE, seed=1).read() == GeneratedFile(FILE_SIZE, seed=1).read()
+    assert GeneratedFile(FILE_SIZE, seed=1).read() != GeneratedFile(FILE_SIZE, seed=2).read()
+    # Файл меньшего размера — префикс большего с тем же seed
+    assert GeneratedFile(FILE_SIZE, seed=1).read().startswith(GeneratedFile(100, seed=1).read())
+
+
+@pytest.mark.regression
+@allure.title("Seek and re-read generated file")
+def test_generated_file_seek():
+    file = GeneratedFile(FILE_SIZE, seed=1)
+    content = file.read()
+
+    assert file.seek(0, os.SEEK_END) == FILE_SIZE
+    assert file.seek(-10, os.SEEK_CUR) == FILE_SIZE - 10
+    assert file.read() == content[-10:]
+
+    offset = GeneratedFile.BLOCK_SIZE - 5
+    assert file.seek(offset) == offset
+    assert file.read(10) == content[offset:offset + 10]
+    assert file.tell() == offset + 10
+    assert file.seek(-100, os.SEEK_SET) == 0
+
+
+@pytest.mark.regression
+@allure.title("Digest generated file read in chunks")
+def test_generated_file_digest():
+    content = GeneratedFile(FILE_SIZE, seed=1).read()
+
+    assert get_file_digest(GeneratedFile(FILE_SIZE, seed=1), chunk_size=4096) == (
+        FILE_SIZE, hashlib.sha256(content).hexdigest()
+    )
@@ -0,0 +1,49 @@
+import allure
+import pytest
+
+from clients.courses import courses_client  # noqa: F401 Декораторы клиента регистрируют шаблоны в route_registry
+from tools.routes import APIRoutes, RouteRegistry, route_registry
+
+
+@pytest.fixture
+def registry() -> RouteRegistry:
+    return RouteRegistry(templates=[
+        "/api/v1/users",
+        "/api/v1/users/me",
+        "/api/v1/users/{user_id}",
+        "/api/v1/courses/{course_id}/exercises",
+        "/api/v1/courses/archived/files",
+    ])
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize(
+    "path, template",
+    [
+        ("/api/v1/users", "/api/v1/users"),
+        ("/api/v1/users/", "/api/v1/users"),
+        ("/api/v1/users/5f0c", "/api/v1/users/{user_id}"),
+        ("/api/v1/users/me", "/api/v1/users/me"),  # Статический сегмент важнее параметра
+        ("/api/v1/courses/5f0c/exercises", "/api/v1/courses/{course_id}/exercises"),
+        # Статическая ветка archived не ведёт к exercises, поэтому сопоставление возвращается к параметру
+        ("/api/v1/courses/archived/exercises", "/api/v1/courses/{course_id}/exercises"),
+        ("/api/v1/courses/archived/files", "/api/v1/courses/archived/files"),
+    ]
+)
+@allure.title("Match path to route template")
+def test_match_route_template(registry: RouteRegistry, path: str, template: str):
+    assert registry.match(path) == template
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("path", ["/api/v1", "/api/v1/users/5f0c/courses", "/api/v1/courses/5f0c", "/static/file.png"])
+@allure.title("Do not match path without route template")
+def test_match_unknown_path(registry: RouteRegistry, path: str):
+    assert registry.match(path) is None
+
+
+@pytest.mark.regression
+@allure.title("Match route templates registered by API clients")
+def test_route_registry_contains_client_routes():
+    assert route_registry.match(str(APIRoutes.COURSES)) == str(APIRoutes.COURSES)
+    assert route_registry.match(f"{APIRoutes.COURSES}/5f0c") == f"{APIRoutes.COURSES}/{{course_id}}"
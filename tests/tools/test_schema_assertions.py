@@ -0,0 +1,26 @@
+import allure
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from clients.users.users_schema import UserSchema
+from tools.assertions.schema import validate_json_schema, validate_json_schema_batch
+
+
+def build_user(email: str) -> dict:
+    return UserSchema(id="user-id", email="user@example.com").model_dump(by_alias=True) | {"email": email}
+
+
+@pytest.mark.regression
+@allure.title("Validate string formats in JSON schema")
+def test_validate_json_schema_checks_formats():
+    validate_json_schema(build_user("user@example.com"), UserSchema)
+
+    with pytest.raises(ValidationError, match="is not a 'email'"):
+        validate_json_schema(build_user("not-an-email"), UserSchema)
+
+
+@pytest.mark.regression
+@allure.title("Validate string formats in JSON schema of every object in batch")
+def test_validate_json_schema_batch_checks_formats():
+    with pytest.raises(ValidationError, match="is not a 'email'"):
+        validate_json_schema_batch([build_user("user@example.com"), build_user("not-an-email")], UserSchema)
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import allure
+import pytest
+
+# TestTraceStatsSchema берём через модуль, иначе pytest пытается собрать его как класс тестов
+from tools.trace import report
+from tools.trace.report import RouteTraceStatsSchema, build_trace_stats, format_trace_report, read_trace_records
+from tools.trace.sink import TraceRecordSchema
+
+TEST = "tests/courses/test_courses.py::TestCourses::test_get_courses"
+
+
+def build_record(
+        route: str,
+        ttfb_ms: float,
+        status_code: int = 200,
+        test: str | None = TEST,
+        phase: str | None = "call"
+) -> TraceRecordSchema:
+    return TraceRecordSchema(
+        timestamp=0.0,
+        worker="gw0",
+        test=test,
+        phase=phase,
+        method="GET",
+        route=route,
+        status_code=status_code,
+        request_size=0,
+        response_size=None,
+        ttfb_ms=ttfb_ms
+    )
+
+
+@pytest.mark.regression
+@allure.title("Build route latency and error stats from trace records")
+def test_build_trace_stats_routes():
+    records = [build_record("/api/v1/courses", float(value)) for value in range(1, 21)]
+    records += [build_record("/api/v1/users/me", 100.0), build_record("/api/v1/users/me", 5.0, status_code=401)]
+
+    routes, _ = build_trace_stats(iter(records))
+
+    # Маршруты отсортированы по убыванию p95
+    assert routes == [
+        RouteTraceStatsSchema(route="GET /api/v1/users/me", requests=2, errors=1, p50_ms=5.0, p95_ms=100.0,
+                              max_ms=100.0),
+        RouteTraceStatsSchema(route="GET /api/v1/courses", requests=20, errors=0, p50_ms=10.0, p95_ms=19.0,
+                              max_ms=20.0),
+    ]
+    assert routes[0].error_rate == 0.5
+
+
+@pytest.mark.regression
+@allure.title("Count requests of each test by phase")
+def test_build_trace_stats_tests():
+    records = [
+        build_record("/api/v1/courses", 1.0, phase="setup"),
+        build_record("/api/v1/courses", 1.0, phase="setup"),
+        build_record("/api/v1/courses", 1.0, phase="call"),
+        build_record("/api/v1/courses", 1.0, phase="teardown"),
+        # Запись без фазы считается выполненной в теле теста
+        build_record("/api/v1/courses", 1.0, phase=None),
+        build_record("/api/v1/courses", 1.0, test=None, phase=None),
+    ]
+
+    _, tests = build_trace_stats(iter(records))
+
+    assert tests == [
+        report.TestTraceStatsSchema(test=TEST, setup=2, call=2, teardown=1),
+        report.TestTraceStatsSchema(test="<outside of tests>", call=1),
+    ]
+
+
+@pytest.mark.regression
+@allure.title("Read trace records of all workers")
+def test_read_trace_records(tmp_path: Path):
+    first, second = build_record("/api/v1/courses", 1.0), build_record("/api/v1/files", 2.0)
+    (tmp_path / "gw0-100.jsonl").write_text(f"{first.model_dump_json()}\n\n", encoding="utf-8")
+    (tmp_path / "gw1-101.jsonl").write_text(f"{second.model_dump_json()}\n", encoding="utf-8")
+    (tmp_path / "report.txt").write_text("not a trace", encoding="utf-8")
+
+    assert list(read_trace_records(tmp_path)) == [first, second]
+
+
+@pytest.mark.regression
+@allure.title("Format trace report limited to top rows")
+def test_format_trace_report():
+    routes = [
+        RouteTraceStatsSchema(route="GET /api/v1/courses", requests=4, errors=1, p50_ms=1.5, p95_ms=3.0, max_ms=4.5),
+        RouteTraceStatsSchema(route="GET /api/v1/files", requests=1, errors=0, p50_ms=1.0, p95_ms=1.0, max_ms=1.0),
+    ]
+    tests = [report.TestTraceStatsSchema(test=TEST, setup=2, call=1)]
+
+    assert format_trace_report(routes, tests, top=1).splitlines() == [
+        "Slowest endpoints (by p95 time to first byte):",
+        f"{'Route':<55} {'Requests':>9} {'Errors':>7} {'Error %':>8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+        f"{'GET /api/v1/courses':<55} {4:>9} {1:>7} {'25.0':>8} {'1.5':>9} {'3.0':>9} {'4.5':>9}",
+        "",
+        "Tests by HTTP requests (setup includes fixtures):",
+        f"{'Test':<90} {'Total':>7} {'Setup':>7} {'Call':>7} {'Teardown':>9}",
+        f"{TEST:<90} {3:>7} {2:>7} {1:>7} {0:>9}",
+    ]
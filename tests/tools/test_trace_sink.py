@@ -0,0 +1,52 @@
+import threading
+from pathlib import Path
+
+import allure
+import pytest
+
+from clients.event_loop import run_coroutine
+from tools.http.timings import RequestTimingsSchema
+from tools.trace import sink
+from tools.trace.sink import TraceRecordSchema, TraceSink, current_test, trace_test_phase, write_trace_record
+
+
+async def get_current_test() -> tuple[str, str] | None:
+    return current_test.get()
+
+
+@pytest.mark.regression
+@allure.title("Attribute requests to current test phase through context")
+def test_current_test_follows_context(request: pytest.FixtureRequest):
+    results: list[tuple[str, str] | None] = []
+    thread = threading.Thread(target=lambda: results.append(current_test.get()))
+    thread.start()
+    thread.join()
+
+    assert current_test.get() == (request.node.nodeid, "call")
+    assert run_coroutine(get_current_test()) == (request.node.nodeid, "call")
+    # Посторонний поток (например, нагрузочный) не наследует контекст теста
+    assert results == [None]
+
+
+@pytest.mark.regression
+@allure.title("Write request phase timings to trace record")
+def test_write_trace_record_with_timings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    trace_sink = TraceSink(path=tmp_path / "trace.jsonl", buffer_size=1024)
+    monkeypatch.setattr(sink, "get_trace_sink", lambda: trace_sink)
+
+    with trace_test_phase("tests/test_example.py::test_example", "setup"):
+        write_trace_record(
+            method="GET",
+            route="/api/v1/users/me",
+            status_code=200,
+            request_size=None,
+            response_size=2,
+            started_at=0.0,
+            timings=RequestTimingsSchema(connect_ms=1.0, tls_ms=2.0, send_ms=3.0, ttfb_ms=4.0, total_ms=5.0)
+        )
+    trace_sink.close()
+
+    record = TraceRecordSchema.model_validate_json(trace_sink.path.read_text())
+    assert (record.test, record.phase) == ("tests/test_example.py::test_example", "setup")
+    assert (record.connect_ms, record.tls_ms, record.send_ms, record.ttfb_ms) == (1.0, 2.0, 3.0, 4.0)
+    assert current_test.get() != ("tests/test_example.py::test_example", "setup")
@@ -7,7 +7,7 @@ from allure_commons.types import Severity # Импортируем enum Severity
 from clients.users.private_users_client import PrivateUsersClient
 from clients.users.public_users_client import PublicUsersClient
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema
-from fixtures.users import UserFixture
+from fixtures.pool import EntityBundle
 from tools.allure.epics import AllureEpic  # Импортируем enum AllureEpic
 from tools.allure.features import AllureFeature  # Импортируем enum AllureFeature
 from tools.allure.stories import AllureStory  # Импортируем enum AllureStory
@@ -35,27 +35,24 @@ class TestUsers:
     def test_create_user(self, email: str, public_users_client: PublicUsersClient):
         request = CreateUserRequestSchema(email=fake.email(domain=email))
         response = public_users_client.create_user_api(request)
-        response_data = CreateUserResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(CreateUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
         assert_create_user_response(request, response_data)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(response.json(), CreateUserResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.story(AllureStory.GET_ENTITY)
     @allure.title("Get user me")  # Добавляем человекочитаемый заголовок
     @allure.severity(Severity.CRITICAL)  # Добавили severity
     @allure.sub_suite(AllureStory.GET_ENTITY)  # allure.sub_suite == allure.story
-    def test_ger_user_me(
-            self,
-            function_user: UserFixture,
-            private_users_client: PrivateUsersClient
-    ):
+    def test_ger_user_me(self, shared_entities: EntityBundle):
+        private_users_client: PrivateUsersClient = shared_entities.private_users_client
         response = private_users_client.get_user_me_api()
-        response_data = GetUserResponseSchema.model_validate_json(response.text)
+        response_data = response.parse(GetUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_user_response(response_data, function_user.response)
+        assert_get_user_response(response_data, shared_entities.user.response)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        validate_json_schema(response.json(), GetUserResponseSchema)
\ No newline at end of file
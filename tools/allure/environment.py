@@ -1,4 +1,5 @@
 from config import settings
+from tools.fakers import fake
 import platform
 import sys
 
@@ -15,6 +16,7 @@ def create_allure_environment_file():
     items = [
         f'os_info={os_info}',
         f'python_version={python_version}',
+        f'test_data_seed={fake.run_seed}',  # Seed для воспроизведения данных прогона через TEST_DATA.SEED
         *[f'{key}={value}' for key, value in settings.model_dump().items()]
     ]
 
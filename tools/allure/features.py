@@ -6,4 +6,5 @@ class AllureFeature(str, Enum):
     FILES = "Files"
     COURSES = "Courses"
     EXERCISES = "Exercises"
-    AUTHENTICATION = "Authentication"
\ No newline at end of file
+    AUTHENTICATION = "Authentication"
+    LOAD_SCENARIOS = "Load scenarios"
\ No newline at end of file
@@ -0,0 +1,122 @@
+import json
+import os
+import queue
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from allure_commons import hookimpl
+from attr import asdict
+
+from tools.logger import get_logger
+
+logger = get_logger("ALLURE_RESULTS_WRITER")
+
+# Задача записи: имя файла и содержимое — байты вложения или результат теста в виде словаря
+# (сериализуется в JSON уже в фоновом потоке)
+WriteTask = tuple[str, bytes | dict[str, Any]]
+
+STOP = object()  # Сигнал фоновому потоку завершить работу
+
+
+class AllureResultsWriter:
+    """
+    Асинхронная замена AllureFileLogger: файлы результатов, контейнеров и вложений Allure
+    пишутся в фоновом потоке, а не в потоке теста.
+
+    Поток теста только снимает копию результата (attr.asdict) и кладёт задачу в очередь.
+    Фоновый поток забирает задачи пачками до batch_size и записывает их одну за другой.
+    Очередь ограничена queue_size задачами: если диск не успевает, тест ждёт в put, поэтому
+    память не растёт бесконечно (backpressure).
+    """
+
+    def __init__(self, report_dir: Path, queue_size: int, batch_size: int):
+        self.report_dir = report_dir
+        self.batch_size = batch_size
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        self.queue: queue.Queue[WriteTask | object] = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self.run, name="allure-results-writer", daemon=True)
+        self.closed = False
+        self.thread.start()
+
+    def write(self, file_name: str, payload: bytes | dict[str, Any]):
+        path = self.report_dir / file_name
+
+        if isinstance(payload, dict):
+            indent = 4 if os.environ.get("ALLURE_INDENT_OUTPUT") else None
+            payload = json.dumps(payload, indent=indent, ensure_ascii=False).encode("utf-8")
+
+        path.write_bytes(payload)
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for task in batch:
+                try:
+                    if task is not STOP:
+                        self.write(*task)
+                except Exception as error:
+                    # Поток должен пережить любую ошибку, иначе flush и put в полную очередь зависнут навсегда
+                    logger.error("Unable to write allure result %s: %s", task[0], error)
+                finally:
+                    self.queue.task_done()
+
+            if STOP in batch:
+                return
+
+    def submit(self, file_name: str, payload: bytes | dict[str, Any]):
+        # После закрытия (например, отчёт пришёл из хука завершения pytest) или если фоновый поток
+        # не работает, пишем синхронно
+        if self.closed or not self.thread.is_alive():
+            self.write(file_name, payload)
+            return
+
+        self.queue.put((file_name, payload))
+
+    def report_item(self, item):
+        file_name = item.file_pattern.format(prefix=uuid.uuid4())
+        self.submit(file_name, asdict(item, filter=lambda _, value: value or value is False))
+
+    @hookimpl
+    def report_result(self, result):
+        self.report_item(result)
+
+    @hookimpl
+    def report_container(self, container):
+        self.report_item(container)
+
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        # Читаем файл сразу: тест может удалить или перезаписать его до того, как очередь дойдёт до задачи
+        self.submit(file_name, Path(source).read_bytes())
+
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self.submit(file_name, body.encode("utf-8") if isinstance(body, str) else body)
+
+    def flush(self):
+        """
+        Ждёт, пока все поставленные в очередь файлы будут записаны на диск.
+        """
+        if self.thread.is_alive():
+            self.queue.join()
+
+    def close(self):
+        """
+        Записывает оставшиеся файлы и останавливает фоновый поток.
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+        if self.thread.is_alive():
+            self.queue.put(STOP)
+            self.thread.join()
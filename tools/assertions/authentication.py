@@ -1,12 +1,12 @@
-import allure  # Импортируем allure
 from clients.authentication.authentication_schema import LoginResponseSchema
 from tools.assertions.base import assert_equal, assert_is_true
+from tools.assertions.steps import group_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 # Создаем логгер с именем "AUTHENTICATION_ASSERTIONS"
 logger = get_logger("AUTHENTICATION_ASSERTIONS")
 
-@allure.step("Check login response")  # Добавили allure шаг
+@group_step("Check login response")
 def assert_login_response(response: LoginResponseSchema):
     """
     Проверяет корректность ответа при успешной авторизации.
@@ -1,13 +1,12 @@
 from typing import Any, Sized
 
-import allure  # Импортируем allure
-
+from tools.assertions.steps import check, check_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("BASE_ASSERTIONS")  # Создаем логгер с именем "BASE_ASSERTIONS"
 
 
-@allure.step("Check that response status code equals to {expected}")  # Добавили allure шаг
+@check_step("Check that response status code equals to {expected}")
 def assert_status_code(actual: int, expected: int):
     """
     Проверяет, что фактический статус-код ответа соответствует ожидаемому.
@@ -15,7 +14,7 @@ def assert_status_code(actual: int, expected: int):
     :param expected: Ожидаемый статус-код.
     :raises AssertionError: Если статус-коды не совпадают.
     """
-    logger.info(f"Check that response status code equals to {expected}")  # Логируем проверку
+    logger.info("Check that response status code equals to %s", expected)  # Логируем проверку
     assert actual == expected, (
         f'Incorrect response status code. '
         f'Expected status code: {expected}. '
@@ -23,7 +22,7 @@ def assert_status_code(actual: int, expected: int):
     )
 
 
-@allure.step("Check that {name} equals to {expected}")  # Добавили allure шаг
+@check_step("Check that {name} equals to {expected}")
 def assert_equal(actual: Any, expected: Any, name: str):
     """
     Проверяет, что фактическое значение равно ожидаемому.
@@ -32,14 +31,14 @@ def assert_equal(actual: Any, expected: Any, name: str):
     :param expected: Ожидаемое значение.
     :raises AssertionError: Если фактическое значение не равно ожидаемому.
     """
-    logger.info(f'Check that "{name}" equals to {expected}')  # Логируем проверку
+    logger.info('Check that "%s" equals to %s', name, expected)  # Логируем проверку
     assert actual == expected, (
         f'Incorrect value: "{name}". '
         f'Expected value: {expected}. '
         f'Actual value: {actual}'
     )
 
-@allure.step("Check that {name} is true")  # Добавили allure шаг
+@check_step("Check that {name} is true")
 def assert_is_true(actual: Any, name: str):
     """
     Проверяет, что фактическое значение является истинным.
@@ -47,7 +46,7 @@ def assert_is_true(actual: Any, name: str):
     :param actual: Фактическое значение.
     :raises AssertionError: Если фактическое значение ложно.
     """
-    logger.info(f'Check that "{name}" is true')  # Логируем проверку
+    logger.info('Check that "%s" is true', name)  # Логируем проверку
     assert actual, (
         f'Incorrect value: "{name}". '
         f'Expected true value but got: {actual}'
@@ -62,8 +61,8 @@ def assert_length(actual: Sized, expected: Sized, name: str):
     :param expected: Ожидаемый объект.
     :raises AssertionError: Если длины не совпадают.
     """
-    with allure.step(f"Check that length of {name} equals to {len(expected)}"):
-        logger.info(f'Check that length of "{name}" equals to {len(expected)}')  # Логируем проверку
+    with check(lambda: f"Check that length of {name} equals to {len(expected)}"):
+        logger.info('Check that length of "%s" equals to %s', name, len(expected))  # Логируем проверку
 
         assert len(actual) == len(expected), (
         f'Incorrect object length: "{name}". '
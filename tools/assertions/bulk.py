@@ -0,0 +1,89 @@
+from typing import Any, Sequence
+
+import allure  # Импортируем allure
+from pydantic import BaseModel
+
+from tools.assertions.steps import check_step
+from tools.logger import get_logger  # Импортируем функцию для создания логгера
+
+logger = get_logger("BULK_ASSERTIONS")  # Создаем логгер с именем "BULK_ASSERTIONS"
+
+
+def get_differences(actual: Any, expected: Any, path: str) -> list[str]:
+    """
+    Рекурсивно сравнивает значения и описывает отличающиеся поля.
+
+    :param actual: Фактическое значение.
+    :param expected: Ожидаемое значение.
+    :param path: Путь к значению, например "courses[3].preview_file.url".
+    :return: Описания отличий, пустой список, если значения равны.
+    """
+    if isinstance(actual, dict) and isinstance(expected, dict):
+        differences = []
+        for key in expected.keys() | actual.keys():
+            differences.extend(get_differences(actual.get(key), expected.get(key), f"{path}.{key}"))
+        return differences
+
+    if actual != expected:
+        return [f"{path}: expected {expected!r}, actual {actual!r}"]
+
+    return []
+
+
+@check_step("Check that {name} match expected items")
+def assert_entities_match(
+        actual: Sequence[BaseModel],
+        expected: Sequence[BaseModel],
+        name: str,
+        ordered: bool = True,
+        max_reported: int = 20
+):
+    """
+    Сравнивает списки сущностей за один проход по индексу ожидаемых сущностей по id.
+
+    В отличие от поэлементных проверок, здесь одна проверка и одна строка лога на весь список,
+    поэтому проверка списков из тысяч элементов занимает миллисекунды. Сущности сравниваются
+    целиком через model_dump, пофилдовый разбор выполняется только для несовпавших.
+
+    :param actual: Фактический список сущностей с полем id.
+    :param expected: Ожидаемый список сущностей с полем id.
+    :param name: Название списка для сообщений, например "courses".
+    :param ordered: Должен ли порядок фактического списка совпадать с ожидаемым.
+    :param max_reported: Сколько отличий включать в сообщение об ошибке.
+    :raises AssertionError: Если найдены лишние, отсутствующие, отличающиеся или переставленные сущности.
+    """
+    logger.info('Check that "%s" match %s expected items', name, len(expected))  # Логируем проверку
+
+    expected_by_id = {entity.id: (index, entity) for index, entity in enumerate(expected)}
+    differences: list[str] = []
+    if len(expected_by_id) != len(expected):
+        differences.append(f"{name}: expected items contain duplicate ids")
+
+    for index, entity in enumerate(actual):
+        expected_index, expected_entity = expected_by_id.pop(entity.id, (None, None))
+        if expected_entity is None:
+            differences.append(f"{name}[{index}]: unexpected item with id {entity.id!r}")
+            continue
+
+        actual_data, expected_data = entity.model_dump(), expected_entity.model_dump()
+        if actual_data != expected_data:
+            differences.extend(get_differences(actual_data, expected_data, f"{name}[{index}]"))
+        if ordered and index != expected_index:
+            differences.append(f"{name}[{index}]: item with id {entity.id!r} expected at position {expected_index}")
+
+    for expected_index, entity in expected_by_id.values():
+        differences.append(f"{name}: missing item with id {entity.id!r} expected at position {expected_index}")
+
+    if differences:
+        summary = "\n".join(differences)
+        allure.attach(summary, name=f"{name} differences", attachment_type=allure.attachment_type.TEXT)
+
+        reported = "\n".join(differences[:max_reported])
+        if len(differences) > max_reported:
+            reported += f"\n... and {len(differences) - max_reported} more"
+
+        raise AssertionError(
+            f'Incorrect items: "{name}". '
+            f'Expected {len(expected)} items, actual {len(actual)} items, {len(differences)} differences:\n'
+            f'{reported}'
+        )
@@ -1,16 +1,16 @@
-import allure  # Импортируем allure
-
 from clients.courses.courses_schema import CourseSchema, UpdateCourseRequestSchema, UpdateCourseResponseSchema, \
     GetCoursesResponseSchema, CreateCourseResponseSchema, CreateCourseRequestSchema
-from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.base import assert_equal
+from tools.assertions.bulk import assert_entities_match
 from tools.assertions.files import assert_file
 from tools.assertions.users import assert_user
+from tools.assertions.steps import group_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("COURSES_ASSERTIONS")  # Создаем логгер с именем "COURSES_ASSERTIONS"
 
 
-@allure.step("Check create course response")  # Добавили allure шаг
+@group_step("Check create course response")
 def assert_create_course_response(
         request: CreateCourseRequestSchema,
         response: CreateCourseResponseSchema
@@ -31,7 +31,7 @@ def assert_create_course_response(
     assert_equal(response.course.preview_file.id, request.preview_file_id, "preview_file_id")
     assert_equal(response.course.created_by_user.id, request.created_by_user_id, "created_by_user_id")
 
-@allure.step("Check update course response")  # Добавили allure шаг
+@group_step("Check update course response")
 def assert_update_course_response(
         request: UpdateCourseRequestSchema,
         response: UpdateCourseResponseSchema
@@ -52,7 +52,7 @@ def assert_update_course_response(
     assert_equal(response.course.estimated_time, request.estimated_time, "estimated_time")
 
 
-@allure.step("Check course")  # Добавили allure шаг
+@group_step("Check course")
 def assert_course(actual: CourseSchema, expected: CourseSchema):
     """
     Проверяет, что фактические данные курса соответствуют ожидаемым.
@@ -75,20 +75,24 @@ def assert_course(actual: CourseSchema, expected: CourseSchema):
     assert_user(actual.created_by_user, expected.created_by_user)
 
 
-@allure.step("Check get courses response")  # Добавили allure шаг
+@group_step("Check get courses response")
 def assert_get_courses_response(
         get_courses_response: GetCoursesResponseSchema,
-        create_course_responses: list[CreateCourseResponseSchema]
+        create_course_responses: list[CreateCourseResponseSchema],
+        ordered: bool = True
 ):
     """
     Проверяет, что ответ на получение списка курсов соответствует ответам на их создание.
     :param get_courses_response: Ответ API при запросе списка курсов.
     :param create_course_responses: Список API ответов при создании курсов.
+    :param ordered: Должен ли порядок в ответе совпадать с порядком create_course_responses.
     :raises AssertionError: Если данные курсов не совпадают.
     """
     logger.info("Check get courses response")
 
-    assert_length(get_courses_response.courses, create_course_responses, "courses")
-
-    for index, create_course_response in enumerate(create_course_responses):
-        assert_course(get_courses_response.courses[index], create_course_response.course)
\ No newline at end of file
+    assert_entities_match(
+        get_courses_response.courses,
+        [create_course_response.course for create_course_response in create_course_responses],
+        "courses",
+        ordered=ordered
+    )
\ No newline at end of file
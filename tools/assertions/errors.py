@@ -1,12 +1,12 @@
-import allure  # Импортируем allure
 from clients.errors_schema import ValidationErrorSchema, ValidationErrorResponseSchema, InternalErrorResponseSchema
 from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.steps import group_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("ERRORS_ASSERTIONS")  # Создаем логгер с именем "ERRORS_ASSERTIONS"
 
 
-@allure.step("Check validation error")  # Добавили allure шаг
+@group_step("Check validation error")
 def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationErrorSchema):
     """
     Проверяет, что объект ошибки валидации соответствует ожидаемому значению.
@@ -23,7 +23,7 @@ def assert_validation_error(actual: ValidationErrorSchema, expected: ValidationE
     assert_equal(actual.location, expected.location, "location")
 
 
-@allure.step("Check validation error response")  # Добавили allure шаг
+@group_step("Check validation error response")
 def assert_validation_error_response(
         actual: ValidationErrorResponseSchema,
         expected: ValidationErrorResponseSchema
@@ -42,7 +42,7 @@ def assert_validation_error_response(
     for index, detail in enumerate(expected.details):
         assert_validation_error(actual.details[index], detail)
 
-@allure.step("Check internal error response")  # Добавили allure шаг
+@group_step("Check internal error response")
 def assert_internal_error_response(
         actual: InternalErrorResponseSchema,
         expected: InternalErrorResponseSchema
@@ -1,16 +1,16 @@
-import allure  # Импортируем allure
-
 from clients.errors_schema import InternalErrorResponseSchema
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema, \
     GetExerciseResponseSchema, ExerciseSchema, UpdateExerciseRequestSchema, UpdateExerciseResponseSchema, \
     GetExercisesResponseSchema
-from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.base import assert_equal
+from tools.assertions.bulk import assert_entities_match
 from tools.assertions.errors import assert_internal_error_response
+from tools.assertions.steps import group_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("EXERCISE_ASSERTIONS")  # Создаем логгер с именем "COURSES_ASSERTIONS"
 
-@allure.step("Check create exercise response")  # Добавили allure шаг
+@group_step("Check create exercise response")
 def assert_create_exercise_response(request: CreateExerciseRequestSchema, response: CreateExerciseResponseSchema):
     """
     Проверяет соответствие ответа на создание задания данным запроса.
@@ -28,7 +28,7 @@ def assert_create_exercise_response(request: CreateExerciseRequestSchema, respon
     assert_equal(response.exercise.order_index, request.order_index, "order_index")
     assert_equal(response.exercise.estimated_time, request.estimated_time, "estimated_time")
 
-@allure.step("Check exercise")  # Добавили allure шаг
+@group_step("Check exercise")
 def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     """
     Проверяет, что фактические данные задания соответствуют ожидаемым.
@@ -48,7 +48,7 @@ def assert_exercise(actual: ExerciseSchema, expected: ExerciseSchema):
     assert_equal(actual.description, expected.description, "description")
     assert_equal(actual.estimated_time, expected.estimated_time, "estimated_time")
 
-@allure.step("Check get exercise response")  # Добавили allure шаг
+@group_step("Check get exercise response")
 def assert_get_exercise_response(actual: GetExerciseResponseSchema, expected: ExerciseSchema):
     """
     Проверяет, что ответ на получение задания соответствует ожидаемым данным.
@@ -61,7 +61,7 @@ def assert_get_exercise_response(actual: GetExerciseResponseSchema, expected: Ex
 
     assert_exercise(actual.exercise, expected)
 
-@allure.step("Check update exercise response")  # Добавили allure шаг
+@group_step("Check update exercise response")
 def assert_update_exercise_response(actual: UpdateExerciseRequestSchema, expected: UpdateExerciseResponseSchema):
     """
         Проверяет, что ответ на обновление данных задания соответствует ожидаемым данным.
@@ -79,7 +79,7 @@ def assert_update_exercise_response(actual: UpdateExerciseRequestSchema, expecte
     assert_equal(actual.description, expected.exercise.description, "description")
     assert_equal(actual.estimated_time, expected.exercise.estimated_time, "estimated_time")
 
-@allure.step("Check exercise not found response")  # Добавили allure шаг
+@group_step("Check exercise not found response")
 def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     """
     Функция для проверки ошибки, если файл не найден на сервере.
@@ -94,21 +94,25 @@ def assert_exercise_not_found_response(actual: InternalErrorResponseSchema):
     # Используем ранее созданную функцию для проверки внутренней ошибки
     assert_internal_error_response(actual, expected)
 
-@allure.step("Check get exercises response")  # Добавили allure шаг
+@group_step("Check get exercises response")
 def assert_get_exercises_response(
         get_exercises_response: GetExercisesResponseSchema,
-        create_exercise_responses: list[CreateExerciseResponseSchema]
+        create_exercise_responses: list[CreateExerciseResponseSchema],
+        ordered: bool = True
 ):
     """
     Проверяет, что ответ на получение списка заданий соответствует ответам на их создание.
 
     :param get_exercises_response: Ответ API при запросе списка заданий.
     :param create_exercise_responses: Список API ответов при создании заданий.
+    :param ordered: Должен ли порядок в ответе совпадать с порядком create_exercise_responses.
     :raises AssertionError: Если данные заданий не совпадают.
     """
     logger.info("Check get exercises response")
 
-    assert_length(get_exercises_response.exercises, create_exercise_responses, "exercises")
-
-    for index, create_exercise_response in enumerate(create_exercise_responses):
-        assert_exercise(get_exercises_response.exercises[index], create_exercise_response.exercise)
+    assert_entities_match(
+        get_exercises_response.exercises,
+        [create_exercise_response.exercise for create_exercise_response in create_exercise_responses],
+        "exercises",
+        ordered=ordered
+    )
@@ -1,16 +1,20 @@
 import allure  # Импортируем allure
 
-from clients.files.files_schema import CreateFileResponseSchema, CreateFileRequestSchema, FileSchema, GetFileResponseSchema
+from clients.files.files_client import UploadRequestSchema, open_upload_file
+from clients.files.files_schema import CreateFileResponseSchema, CreateFileRequestSchema, FileSchema, \
+    GetFileResponseSchema, DownloadFileResultSchema
 from tools.assertions.base import assert_equal
 from tools.assertions.errors import assert_validation_error_response, assert_internal_error_response
 from clients.errors_schema import ValidationErrorResponseSchema, ValidationErrorSchema, InternalErrorResponseSchema
 from config import settings  # Импортируем настройки
+from tools.files import get_file_digest
+from tools.assertions.steps import group_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("FILES_ASSERTIONS")  # Создаем логгер с именем "FILES_ASSERTIONS"
 
 
-@allure.step("Check create file response")  # Добавили allure шаг
+@group_step("Check create file response")
 def assert_create_file_response(request: CreateFileRequestSchema, response: CreateFileResponseSchema):
     """
     Проверяет, что ответ на создание файла соответствует запросу.
@@ -26,7 +30,26 @@ def assert_create_file_response(request: CreateFileRequestSchema, response: Crea
     assert_equal(response.file.filename, request.filename, "filename")
     assert_equal(response.file.directory, request.directory, "directory")
 
-@allure.step("Check file")  # Добавили allure шаг
+@group_step("Check downloaded file content")
+def assert_downloaded_file(request: UploadRequestSchema, download: DownloadFileResultSchema):
+    """
+    Проверяет, что скачанное содержимое совпадает с загруженным. Источник хешируется потоково,
+    так же как скачанный файл, поэтому проверка не зависит от размера файла.
+    :param request: Исходный запрос на создание файла.
+    :param download: Результат скачивания файла.
+    :raises AssertionError: Если размер или хеш содержимого не совпадают.
+    """
+    logger.info("Check downloaded file content, download speed: %.1f MB/s", download.mb_per_second)
+    # Скорость скачивания видна в параметрах теста, но не влияет на его историю в отчете
+    allure.dynamic.parameter("Download speed, MB/s", f"{download.mb_per_second:.1f}", excluded=True)
+
+    with open_upload_file(request) as upload_file:
+        expected_size, expected_sha256 = get_file_digest(upload_file)
+
+    assert_equal(download.size, expected_size, "size")
+    assert_equal(download.sha256, expected_sha256, "sha256")
+
+@group_step("Check file")
 def assert_file(actual: FileSchema, expected: FileSchema):
     """
     Проверяет, что фактические данные файла соответствуют ожидаемым.
@@ -41,7 +64,7 @@ def assert_file(actual: FileSchema, expected: FileSchema):
     assert_equal(actual.filename, expected.filename, "filename")
     assert_equal(actual.directory, expected.directory, "directory")
 
-@allure.step("Check get file response")  # Добавили allure шаг
+@group_step("Check get file response")
 def assert_get_file_response(
         get_file_response: GetFileResponseSchema,
         create_file_response: CreateFileResponseSchema
@@ -56,7 +79,7 @@ def assert_get_file_response(
 
     assert_file(get_file_response.file, create_file_response.file)
 
-@allure.step("Check create file with empty filename response")  # Добавили allure шаг
+@group_step("Check create file with empty filename response")
 def assert_create_file_with_empty_filename_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на создание файла с пустым именем файла соответствует ожидаемой валидационной ошибке.
@@ -78,7 +101,7 @@ def assert_create_file_with_empty_filename_response(actual: ValidationErrorRespo
     )
     assert_validation_error_response(actual, expected)
 
-@allure.step("Check create file with empty directory response")  # Добавили allure шаг
+@group_step("Check create file with empty directory response")
 def assert_create_file_with_empty_directory_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на создание файла с пустым значением директории соответствует ожидаемой валидационной ошибке.
@@ -101,7 +124,7 @@ def assert_create_file_with_empty_directory_response(actual: ValidationErrorResp
     )
     assert_validation_error_response(actual, expected)
 
-@allure.step("Check file not found response")  # Добавили allure шаг
+@group_step("Check file not found response")
 def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     """
     Функция для проверки ошибки, если файл не найден на сервере.
@@ -115,7 +138,7 @@ def assert_file_not_found_response(actual: InternalErrorResponseSchema):
     # Используем ранее созданную функцию для проверки внутренней ошибки
     assert_internal_error_response(actual, expected)
 
-@allure.step("Check get file with incorrect file id response")  # Добавили allure шаг
+@group_step("Check get file with incorrect file id response")
 def assert_get_file_with_incorrect_file_id_response(actual: ValidationErrorResponseSchema):
     """
     Проверяет, что ответ на запрос файла с некорректным file_id соответствует ожидаемой валидационной ошибке.
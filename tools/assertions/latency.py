@@ -0,0 +1,31 @@
+import allure  # Импортируем allure
+
+from tools.http.latency import latency_registry
+from tools.stats import percentile
+from tools.logger import get_logger  # Импортируем функцию для создания логгера
+
+logger = get_logger("LATENCY_ASSERTIONS")  # Создаем логгер с именем "LATENCY_ASSERTIONS"
+
+
+@allure.step("Check that p95 latency of {route} is below {p95_ms} ms")  # Добавили allure шаг
+def assert_latency_below(route: str, p95_ms: float):
+    """
+    Проверяет, что 95-й перцентиль длительности запросов маршрута меньше порога.
+
+    Учитываются все запросы маршрута, выполненные в текущем процессе к моменту проверки.
+
+    :param route: Маршрут вида "<METHOD> <шаблон>", например f"GET {APIRoutes.EXERCISES}".
+    :param p95_ms: Допустимый 95-й перцентиль в миллисекундах.
+    :raises AssertionError: Если запросов по маршруту не было или перцентиль не меньше порога.
+    """
+    logger.info("Check that p95 latency of %s is below %s ms", route, p95_ms)  # Логируем проверку
+
+    samples = latency_registry.get_total_samples(route)
+    assert samples, f'No requests were recorded for route "{route}"'
+
+    actual = percentile(samples, 95)
+    assert actual < p95_ms, (
+        f'Latency of route "{route}" is too high. '
+        f'Expected p95: below {p95_ms} ms. '
+        f'Actual p95: {actual:.1f} ms over {len(samples)} requests'
+    )
\ No newline at end of file
@@ -1,25 +1,82 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, TYPE_CHECKING
 
 import allure  # Импортируем allure
-from jsonschema import validate
-from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
 
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
+if TYPE_CHECKING:
+    from jsonschema.validators import Draft202012Validator
+
 logger = get_logger("SCHEMA_ASSERTIONS")  # Создаем логгер с именем "SCHEMA_ASSERTIONS"
 
 
+def build_schema_validator(schema: dict) -> "Draft202012Validator":
+    """
+    Проверяет схему на соответствие мета-схеме и создаёт для неё валидатор.
+
+    :param schema: JSON-schema.
+    :return: Готовый к использованию валидатор.
+    :raises jsonschema.exceptions.SchemaError: Если схема некорректна.
+    """
+    # jsonschema импортируется при первой проверке, а не при сборе тестов
+    from jsonschema.validators import Draft202012Validator
+
+    Draft202012Validator.check_schema(schema)
+    # Кроме типов проверяем и форматы строк, например "email" у полей EmailStr
+    return Draft202012Validator(schema, format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+
+@lru_cache(maxsize=None)
+def get_schema_validator(model: type[BaseModel]) -> "Draft202012Validator":
+    """
+    Возвращает валидатор JSON-схемы pydantic модели. Схема генерируется и проверяется
+    один раз на процесс, дальше используется уже созданный валидатор.
+
+    :param model: Класс pydantic модели.
+    :return: Валидатор схемы модели.
+    """
+    return build_schema_validator(model.model_json_schema())
+
+
+def resolve_schema_validator(schema: type[BaseModel] | dict) -> "Draft202012Validator":
+    if isinstance(schema, dict):
+        return build_schema_validator(schema)  # Произвольные словари не кешируем: они изменяемые
+
+    return get_schema_validator(schema)
+
+
+def assert_matches_schema(validator: "Draft202012Validator", instance: Any):
+    from jsonschema.exceptions import best_match
+
+    # Как и jsonschema.validate, выбираем самую релевантную ошибку из найденных
+    if error := best_match(validator.iter_errors(instance)):
+        raise error
+
+
 @allure.step("Validate JSON schema")  # Добавили allure шаг
-def validate_json_schema(instance: Any, schema: dict) -> None:
+def validate_json_schema(instance: Any, schema: type[BaseModel] | dict) -> None:
     """
     Проверяет, соответствует ли JSON-объект (instance) заданной JSON-схеме (schema).
     :param instance: JSON-данные, которые нужно проверить.
-    :param schema: Ожидаемая JSON-schema.
+    :param schema: Класс pydantic модели (валидатор кешируется) или JSON-schema в виде словаря.
     :raises jsonschema.exceptions.ValidationError: Если instance не соответствует schema.
     """
     logger.info("Validating JSON schema")
-    validate(
-        schema=schema,
-        instance=instance,
-        format_checker=Draft202012Validator.FORMAT_CHECKER,
-    )
\ No newline at end of file
+    assert_matches_schema(resolve_schema_validator(schema), instance)
+
+
+def validate_json_schema_batch(instances: list[Any], schema: type[BaseModel] | dict) -> None:
+    """
+    Проверяет список JSON-объектов одним валидатором.
+    :param instances: Список JSON-данных, которые нужно проверить.
+    :param schema: Класс pydantic модели (валидатор кешируется) или JSON-schema в виде словаря.
+    :raises jsonschema.exceptions.ValidationError: Если хотя бы один объект не соответствует schema.
+    """
+    with allure.step(f"Validate JSON schema of {len(instances)} objects"):
+        logger.info("Validating JSON schema of %s objects", len(instances))
+        validator = resolve_schema_validator(schema)
+
+        for instance in instances:
+            assert_matches_schema(validator, instance)
\ No newline at end of file
@@ -0,0 +1,140 @@
+import contextlib
+import csv
+import functools
+import inspect
+import io
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+import allure  # Импортируем allure
+
+from config import settings
+
+
+class AssertionGroup:
+    """
+    Проверки одной сущности (например, "Check course"), собранные для таблицы в режиме grouped.
+    """
+
+    def __init__(self, get_title: Callable[[], str]):
+        self.get_title = get_title
+        self.checks: list[tuple[str, str]] = []  # (название проверки, passed/failed)
+
+    @functools.cached_property
+    def title(self) -> str:
+        return self.get_title()
+
+    def to_csv(self) -> str:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(("check", "result"))
+        writer.writerows(self.checks)
+        return buffer.getvalue()
+
+
+# Стек открытых групп проверок текущего теста
+assertion_groups: ContextVar[tuple[AssertionGroup, ...]] = ContextVar("assertion_groups", default=())
+
+
+def get_step_title(title: str, signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    arguments = signature.bind(*args, **kwargs)
+    arguments.apply_defaults()
+    return title.format(**arguments.arguments)
+
+
+@contextlib.contextmanager
+def check(get_title: Callable[[], str]) -> Iterator[None]:
+    """
+    Оборачивает одну проверку с учётом ASSERTIONS.VERBOSITY.
+
+    full — отдельный allure шаг на проверку; grouped — строка в таблице открытой группы
+    (вне группы — отдельный шаг); fast — шаг создаётся только для упавшей проверки,
+    и в его названии указан путь из групп, внутри которых она выполнялась.
+
+    :param get_title: Функция, возвращающая название проверки. Вызывается, только если название нужно.
+    """
+    verbosity = settings.assertions.verbosity
+    groups = assertion_groups.get()
+
+    if verbosity == "full" or (verbosity == "grouped" and not groups):
+        with allure.step(get_title()):
+            yield
+        return
+
+    try:
+        yield
+    except Exception:
+        if verbosity == "grouped":
+            groups[-1].checks.append((get_title(), "failed"))
+            raise
+
+        with allure.step(" / ".join([*(group.title for group in groups), get_title()])):
+            raise
+
+    if verbosity == "grouped":
+        groups[-1].checks.append((get_title(), "passed"))
+
+
+def check_step(title: str):
+    """
+    Декоратор отдельной проверки (assert_equal, assert_status_code и т.д.).
+
+    :param title: Шаблон названия шага с подстановкой аргументов функции, как в allure.step.
+    """
+
+    def decorator(function):
+        signature = inspect.signature(function)
+        allure_step = allure.step(title)(function)  # Полный режим — шаг с оформлением allure, как раньше
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            verbosity = settings.assertions.verbosity
+            if verbosity == "full" or (verbosity == "grouped" and not assertion_groups.get()):
+                return allure_step(*args, **kwargs)
+
+            with check(lambda: get_step_title(title, signature, args, kwargs)):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def group_step(title: str):
+    """
+    Декоратор проверки сущности целиком (assert_course, assert_file и т.д.).
+
+    В режиме full — обычный allure шаг, в grouped — шаг с CSV таблицей вложенных проверок,
+    в fast — шаг не создаётся, название группы попадает в путь упавшей проверки.
+
+    :param title: Шаблон названия шага с подстановкой аргументов функции, как в allure.step.
+    """
+
+    def decorator(function):
+        signature = inspect.signature(function)
+        allure_step = allure.step(title)(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            verbosity = settings.assertions.verbosity
+            if verbosity == "full":
+                return allure_step(*args, **kwargs)
+
+            group = AssertionGroup(lambda: get_step_title(title, signature, args, kwargs))
+            token = assertion_groups.set((*assertion_groups.get(), group))
+            try:
+                if verbosity == "fast":
+                    return function(*args, **kwargs)
+
+                with allure.step(group.title):
+                    try:
+                        return function(*args, **kwargs)
+                    finally:
+                        if group.checks:
+                            allure.attach(group.to_csv(), name="checks", attachment_type=allure.attachment_type.CSV)
+            finally:
+                assertion_groups.reset(token)
+
+        return wrapper
+
+    return decorator
@@ -1,12 +1,12 @@
-import allure  # Импортируем allure
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema, UserSchema
 from tools.assertions.base import assert_equal
+from tools.assertions.steps import group_step
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("USERS_ASSERTIONS")  # Создаем логгер с именем "USERS_ASSERTIONS"
 
 
-@allure.step("Check create user response")  # Добавили allure шаг
+@group_step("Check create user response")
 def assert_create_user_response(request: CreateUserRequestSchema, response: CreateUserResponseSchema):
     """
     Проверяет, что ответ на создание пользователя соответствует запросу.
@@ -21,7 +21,7 @@ def assert_create_user_response(request: CreateUserRequestSchema, response: Crea
     assert_equal(response.user.first_name, request.first_name, "first_name")
     assert_equal(response.user.middle_name, request.middle_name, "middle_name")
 
-@allure.step("Check user")  # Добавили allure шаг
+@group_step("Check user")
 def assert_user(actual: UserSchema, expected: UserSchema):
     """
     Проверяет корректность данных пользователя, сравнивая два объекта UserSchema.
@@ -38,7 +38,7 @@ def assert_user(actual: UserSchema, expected: UserSchema):
     assert_equal(actual.middle_name, expected.middle_name, "middle_name")
 
 
-@allure.step("Check get user response")  # Добавили allure шаг
+@group_step("Check get user response")
 def assert_get_user_response(get_user_response: GetUserResponseSchema, create_user_response: CreateUserResponseSchema):
     """
     Проверяет, что данные пользователя из ответа на запрос совпадают с данными при создании.
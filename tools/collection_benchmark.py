@@ -0,0 +1,54 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Импорт модулей фикстур из conftest.pytest_plugins — то, что каждый xdist воркер делает при старте
+IMPORT_PLUGINS_CODE = "import importlib, conftest; [importlib.import_module(name) for name in conftest.pytest_plugins]"
+
+
+def measure(command: list[str], runs: int) -> list[float]:
+    """
+    Запускает команду runs раз и измеряет длительность каждого запуска.
+
+    :param command: Команда для subprocess.
+    :param runs: Количество запусков.
+    :return: Длительности в секундах.
+    :raises subprocess.CalledProcessError: Если команда завершилась с ошибкой.
+    """
+    durations = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        durations.append(time.perf_counter() - started_at)
+
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.collection_benchmark",
+        description="Замер времени импорта фикстур, сбора тестов и старта xdist воркеров."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Количество запусков каждой команды")
+    parser.add_argument("--workers", type=int, default=2, help="Количество xdist воркеров, 0 — не замерять xdist")
+    arguments = parser.parse_args()
+
+    commands = {
+        "import plugins": [sys.executable, "-c", IMPORT_PLUGINS_CODE],
+        "collect-only": [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"],
+    }
+    if arguments.workers:
+        commands[f"collect-only -n {arguments.workers}"] = [
+            *commands["collect-only"], "-n", str(arguments.workers)
+        ]
+
+    print(f"{'command':<24} {'min, s':>8} {'median, s':>10} {'max, s':>8}")
+    for name, command in commands.items():
+        durations = measure(command, arguments.runs)
+        print(f"{name:<24} {min(durations):>8.3f} {statistics.median(durations):>10.3f} {max(durations):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+
+class CreateUserBodySchema(BaseModel):
+    """
+    Тело запроса создания пользователя, как его валидирует сервер.
+    """
+    email: EmailStr
+    password: str
+    last_name: str = Field(alias="lastName", max_length=50)
+    first_name: str = Field(alias="firstName", max_length=50)
+    middle_name: str = Field(alias="middleName", max_length=50)
+
+
+class UpdateUserBodySchema(BaseModel):
+    """
+    Тело запроса обновления пользователя.
+    """
+    email: EmailStr | None = None
+    last_name: str | None = Field(alias="lastName", default=None, max_length=50)
+    first_name: str | None = Field(alias="firstName", default=None, max_length=50)
+    middle_name: str | None = Field(alias="middleName", default=None, max_length=50)
+
+
+class LoginBodySchema(BaseModel):
+    """
+    Тело запроса аутентификации.
+    """
+    email: EmailStr
+    password: str
+
+
+class RefreshBodySchema(BaseModel):
+    """
+    Тело запроса обновления токенов.
+    """
+    refresh_token: str = Field(alias="refreshToken")
+
+
+class CreateFileFormSchema(BaseModel):
+    """
+    Поля multipart формы создания файла.
+    """
+    filename: str = Field(min_length=1, max_length=250)
+    directory: str = Field(min_length=1, max_length=250)
+
+
+class CreateCourseBodySchema(BaseModel):
+    """
+    Тело запроса создания курса.
+    """
+    title: str = Field(max_length=250)
+    max_score: int = Field(alias="maxScore")
+    min_score: int = Field(alias="minScore")
+    description: str
+    estimated_time: str = Field(alias="estimatedTime", max_length=50)
+    preview_file_id: str = Field(alias="previewFileId")
+    created_by_user_id: str = Field(alias="createdByUserId")
+
+
+class UpdateCourseBodySchema(BaseModel):
+    """
+    Тело запроса обновления курса.
+    """
+    title: str | None = Field(default=None, max_length=250)
+    max_score: int | None = Field(alias="maxScore", default=None)
+    min_score: int | None = Field(alias="minScore", default=None)
+    description: str | None = None
+    estimated_time: str | None = Field(alias="estimatedTime", default=None, max_length=50)
+
+
+class CreateExerciseBodySchema(BaseModel):
+    """
+    Тело запроса создания задания.
+    """
+    title: str = Field(max_length=250)
+    course_id: str = Field(alias="courseId")
+    max_score: int = Field(alias="maxScore")
+    min_score: int = Field(alias="minScore")
+    order_index: int = Field(alias="orderIndex")
+    description: str
+    estimated_time: str = Field(alias="estimatedTime", max_length=50)
+
+
+class UpdateExerciseBodySchema(BaseModel):
+    """
+    Тело запроса обновления задания.
+    """
+    title: str | None = Field(default=None, max_length=250)
+    max_score: int | None = Field(alias="maxScore", default=None)
+    min_score: int | None = Field(alias="minScore", default=None)
+    order_index: int | None = Field(alias="orderIndex", default=None)
+    description: str | None = None
+    estimated_time: str | None = Field(alias="estimatedTime", default=None, max_length=50)
+
+
+class CoursesQuerySchema(BaseModel):
+    """
+    Query параметры получения списка курсов.
+    """
+    model_config = ConfigDict(extra="ignore")
+
+    user_id: str = Field(alias="userId")
+
+
+class ExercisesQuerySchema(BaseModel):
+    """
+    Query параметры получения списка заданий.
+    """
+    model_config = ConfigDict(extra="ignore")
+
+    course_id: str = Field(alias="courseId")
\ No newline at end of file
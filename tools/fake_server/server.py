@@ -0,0 +1,459 @@
+import base64
+import hashlib
+import hmac
+import json
+import mimetypes
+import re
+import time
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+
+import httpx
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from clients.courses.courses_schema import CourseSchema
+from clients.exercises.exercises_schema import ExerciseSchema
+from clients.files.files_schema import FileSchema
+from clients.users.users_schema import UserSchema
+from config import settings
+from tools.fake_server.schema import (
+    CreateUserBodySchema,
+    UpdateUserBodySchema,
+    LoginBodySchema,
+    RefreshBodySchema,
+    CreateFileFormSchema,
+    CreateCourseBodySchema,
+    UpdateCourseBodySchema,
+    CreateExerciseBodySchema,
+    UpdateExerciseBodySchema,
+    CoursesQuerySchema,
+    ExercisesQuerySchema
+)
+from tools.fake_server.storage import FakeStorage
+from tools.routes import APIRoutes
+
+# Время жизни токенов как у тестового сервера в .github/workflows/tests.yml
+ACCESS_TOKEN_LIFETIME = 1800
+REFRESH_TOKEN_LIFETIME = 5184000
+
+Model = TypeVar("Model", bound=BaseModel)
+Entity = TypeVar("Entity")
+
+Handler = Callable[[httpx.Request, dict[str, str]], httpx.Response]
+
+
+class FakeHTTPError(Exception):
+    """
+    Ошибка обработки запроса, которая превращается в ответ {"detail": ...} с указанным статус-кодом.
+    """
+
+    def __init__(self, status_code: int, detail: str | list[dict]):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def to_jsonable(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+
+
+def format_validation_error(error: ValidationError, *location: str) -> FakeHTTPError:
+    """
+    Преобразует ошибку pydantic в ответ 422 в формате FastAPI.
+
+    :param error: Ошибка валидации.
+    :param location: Часть запроса (path, query или body) и, при необходимости, имя параметра.
+    :return: Ошибка с деталями валидации.
+    """
+    details = []
+    for item in error.errors(include_url=False):
+        detail = {"type": item["type"], "loc": [*location, *item["loc"]], "msg": item["msg"], "input": item["input"]}
+        if "ctx" in item:
+            detail["ctx"] = {key: to_jsonable(value) for key, value in item["ctx"].items()}
+        details.append(detail)
+
+    return FakeHTTPError(422, details)
+
+
+def json_response(data: Any, status_code: int = 200) -> httpx.Response:
+    return httpx.Response(status_code, json=data)
+
+
+def dump(model: BaseModel) -> dict:
+    return model.model_dump(mode="json", by_alias=True)
+
+
+def parse_multipart(request: httpx.Request) -> dict[str, bytes]:
+    """
+    Разбирает тело multipart/form-data.
+
+    :param request: Запрос с прочитанным телом.
+    :return: Содержимое частей формы по именам полей.
+    """
+    boundary = request.headers.get("content-type", "").partition("boundary=")[2].strip('"')
+    if not boundary:
+        return {}
+
+    parts: dict[str, bytes] = {}
+    for part in request.content.split(b"--" + boundary.encode("ascii"))[1:-1]:
+        headers, _, content = part.removeprefix(b"\r\n").partition(b"\r\n\r\n")
+        if name := re.search(rb'name="([^"]*)"', headers):
+            parts[name.group(1).decode("utf-8")] = content.removesuffix(b"\r\n")
+
+    return parts
+
+
+class FakeServer:
+    """
+    Фейковая реализация LMS API, работающая в процессе тестов через httpx.MockTransport.
+
+    Повторяет контракты эндпоинтов users, authentication, files, courses и exercises: те же
+    маршруты, схемы ответов, тексты ошибок и ошибки валидации 422 в формате FastAPI. Токены
+    имеют формат JWT с полями exp и iat, поэтому сессии авторизации работают как с настоящим сервером.
+    """
+
+    def __init__(self, base_url: str, secret: str = "fake-server-secret"):
+        self.base_url = base_url
+        self.secret = secret.encode("utf-8")
+        self.storage = FakeStorage()
+        self.routes: list[tuple[str, re.Pattern, Handler]] = []
+
+        self.add_route("POST", f"{APIRoutes.AUTHENTICATION}/login", self.login)
+        self.add_route("POST", f"{APIRoutes.AUTHENTICATION}/refresh", self.refresh)
+
+        self.add_route("POST", APIRoutes.USERS, self.create_user)
+        self.add_route("GET", f"{APIRoutes.USERS}/me", self.get_user_me)
+        self.add_route("GET", f"{APIRoutes.USERS}/{{user_id}}", self.get_user)
+        self.add_route("PATCH", f"{APIRoutes.USERS}/{{user_id}}", self.update_user)
+        self.add_route("DELETE", f"{APIRoutes.USERS}/{{user_id}}", self.delete_user)
+
+        self.add_route("POST", APIRoutes.FILES, self.create_file)
+        self.add_route("GET", f"{APIRoutes.FILES}/{{file_id}}", self.get_file)
+        self.add_route("DELETE", f"{APIRoutes.FILES}/{{file_id}}", self.delete_file)
+        self.add_route("GET", "/static/{path:path}", self.get_static_file)
+
+        self.add_route("GET", APIRoutes.COURSES, self.get_courses)
+        self.add_route("POST", APIRoutes.COURSES, self.create_course)
+        self.add_route("GET", f"{APIRoutes.COURSES}/{{course_id}}", self.get_course)
+        self.add_route("PATCH", f"{APIRoutes.COURSES}/{{course_id}}", self.update_course)
+        self.add_route("DELETE", f"{APIRoutes.COURSES}/{{course_id}}", self.delete_course)
+
+        self.add_route("GET", APIRoutes.EXERCISES, self.get_exercises)
+        self.add_route("POST", APIRoutes.EXERCISES, self.create_exercise)
+        self.add_route("GET", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.get_exercise)
+        self.add_route("PATCH", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.update_exercise)
+        self.add_route("DELETE", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.delete_exercise)
+
+    def add_route(self, method: str, template: str, handler: Handler):
+        # "{name}" соответствует одному сегменту пути, "{name:path}" — остатку пути
+        pattern = re.sub(r"\{(\w+):path}", r"(?P<\1>.+)", template)
+        pattern = re.sub(r"\{(\w+)}", r"(?P<\1>[^/]+)", pattern)
+        self.routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Обработчик для httpx.MockTransport.
+
+        :param request: Запрос клиента.
+        :return: Ответ фейкового сервера.
+        """
+        path_matched = False
+        try:
+            for method, pattern, handler in self.routes:
+                if match := pattern.match(request.url.path):
+                    path_matched = True
+                    if method == request.method:
+                        return handler(request, match.groupdict())
+
+            if path_matched:
+                return json_response({"detail": "Method Not Allowed"}, 405)
+
+            return json_response({"detail": "Not Found"}, 404)
+        except FakeHTTPError as error:
+            return json_response({"detail": error.detail}, error.status_code)
+
+    # Токены
+
+    def encode_token(self, user_id: str, token_type: str, lifetime: int) -> str:
+        def encode(data: dict) -> bytes:
+            return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).rstrip(b"=")
+
+        issued_at = int(time.time())
+        payload = {"sub": user_id, "type": token_type, "iat": issued_at, "exp": issued_at + lifetime, "jti": uuid.uuid4().hex}
+        message = encode({"alg": "HS256", "typ": "JWT"}) + b"." + encode(payload)
+        signature = base64.urlsafe_b64encode(hmac.new(self.secret, message, hashlib.sha256).digest()).rstrip(b"=")
+        return (message + b"." + signature).decode("ascii")
+
+    def decode_token(self, token: str, token_type: str) -> str | None:
+        try:
+            message, _, signature = token.encode("ascii").rpartition(b".")
+            expected = base64.urlsafe_b64encode(hmac.new(self.secret, message, hashlib.sha256).digest()).rstrip(b"=")
+            if not hmac.compare_digest(signature, expected):
+                return None
+
+            payload_part = message.split(b".")[1]
+            payload = json.loads(base64.urlsafe_b64decode(payload_part + b"=" * (-len(payload_part) % 4)))
+        except (ValueError, IndexError):
+            return None
+
+        if payload.get("type") != token_type or payload.get("exp", 0) <= time.time():
+            return None
+
+        return payload.get("sub")
+
+    def issue_tokens(self, user_id: str) -> httpx.Response:
+        return json_response({
+            "token": {
+                "tokenType": "bearer",
+                "accessToken": self.encode_token(user_id, "access", ACCESS_TOKEN_LIFETIME),
+                "refreshToken": self.encode_token(user_id, "refresh", REFRESH_TOKEN_LIFETIME),
+            }
+        })
+
+    def authenticate(self, request: httpx.Request) -> UserSchema:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            raise FakeHTTPError(403, "Not authenticated")
+
+        user_id = self.decode_token(token, "access")
+        if user_id is None or (user := self.storage.users.get(user_id)) is None:
+            raise FakeHTTPError(401, "Invalid or expired token")
+
+        return user
+
+    # Разбор запроса
+
+    @staticmethod
+    def parse_uuid(value: str, name: str) -> str:
+        try:
+            return str(TypeAdapter(uuid.UUID).validate_python(value))
+        except ValidationError as error:
+            raise format_validation_error(error, "path", name) from None
+
+    @staticmethod
+    def parse_body(request: httpx.Request, schema: type[Model]) -> Model:
+        try:
+            body = json.loads(request.content or b"null")
+        except ValueError:
+            raise FakeHTTPError(422, [{"type": "json_invalid", "loc": ["body"], "msg": "JSON decode error", "input": {}}])
+
+        try:
+            return schema.model_validate(body)
+        except ValidationError as error:
+            raise format_validation_error(error, "body") from None
+
+    @staticmethod
+    def parse_query(request: httpx.Request, schema: type[Model]) -> Model:
+        try:
+            return schema.model_validate(dict(request.url.params))
+        except ValidationError as error:
+            raise format_validation_error(error, "query") from None
+
+    @staticmethod
+    def get_or_404(entities: dict[str, Entity], entity_id: str, detail: str) -> Entity:
+        if (entity := entities.get(entity_id)) is None:
+            raise FakeHTTPError(404, detail)
+
+        return entity
+
+    # Authentication
+
+    def login(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        body = self.parse_body(request, LoginBodySchema)
+        user = self.storage.get_user_by_credentials(body.email, body.password)
+        if user is None:
+            raise FakeHTTPError(401, "Wrong email or password")
+
+        return self.issue_tokens(user.id)
+
+    def refresh(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        body = self.parse_body(request, RefreshBodySchema)
+        user_id = self.decode_token(body.refresh_token, "refresh")
+        if user_id is None or user_id not in self.storage.users:
+            raise FakeHTTPError(401, "Invalid refresh token")
+
+        return self.issue_tokens(user_id)
+
+    # Users
+
+    def create_user(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        body = self.parse_body(request, CreateUserBodySchema)
+        if body.email in self.storage.user_ids_by_email:
+            raise FakeHTTPError(400, "User with this email already exists")
+
+        user = UserSchema(
+            id=str(uuid.uuid4()),
+            email=body.email,
+            last_name=body.last_name,
+            first_name=body.first_name,
+            middle_name=body.middle_name
+        )
+        self.storage.add_user(user, body.password)
+        return json_response({"user": dump(user)})
+
+    def get_user_me(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        return json_response({"user": dump(self.authenticate(request))})
+
+    def get_user(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        user_id = self.parse_uuid(path_params["user_id"], "user_id")
+        return json_response({"user": dump(self.get_or_404(self.storage.users, user_id, "User not found"))})
+
+    def update_user(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        user_id = self.parse_uuid(path_params["user_id"], "user_id")
+        user = self.get_or_404(self.storage.users, user_id, "User not found")
+        body = self.parse_body(request, UpdateUserBodySchema)
+
+        updated = user.model_copy(update=body.model_dump(exclude_none=True))
+        self.storage.update_user(updated, previous_email=user.email)
+        return json_response({"user": dump(updated)})
+
+    def delete_user(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        user_id = self.parse_uuid(path_params["user_id"], "user_id")
+        self.get_or_404(self.storage.users, user_id, "User not found")
+        self.storage.delete_user(user_id)
+        return httpx.Response(200)
+
+    # Files
+
+    def create_file(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        parts = parse_multipart(request)
+        # Файл без имени клиент отправляет как обычное поле, поэтому файл отличаем по имени поля
+        content = parts.pop("upload_file", None)
+        try:
+            form = CreateFileFormSchema.model_validate(
+                {name: value.decode("utf-8", errors="replace") for name, value in parts.items()}
+            )
+        except ValidationError as error:
+            raise format_validation_error(error, "body") from None
+
+        if content is None:
+            raise FakeHTTPError(422, [
+                {"type": "missing", "loc": ["body", "upload_file"], "msg": "Field required", "input": None}
+            ])
+
+        file = FileSchema(
+            id=str(uuid.uuid4()),
+            url=f"{self.base_url}static/{form.directory}/{form.filename}",
+            filename=form.filename,
+            directory=form.directory
+        )
+        self.storage.add_file(file, content)
+        return json_response({"file": dump(file)})
+
+    def get_file(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        file_id = self.parse_uuid(path_params["file_id"], "file_id")
+        return json_response({"file": dump(self.get_or_404(self.storage.files, file_id, "File not found"))})
+
+    def delete_file(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        file_id = self.parse_uuid(path_params["file_id"], "file_id")
+        self.get_or_404(self.storage.files, file_id, "File not found")
+        self.storage.delete_file(file_id)
+        return httpx.Response(200)
+
+    def get_static_file(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        content = self.get_or_404(self.storage.static_files, path_params["path"], "Not Found")
+        content_type = mimetypes.guess_type(path_params["path"])[0] or "application/octet-stream"
+        return httpx.Response(200, headers={"content-type": content_type}, content=content)
+
+    # Courses
+
+    def get_courses(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        query = self.parse_query(request, CoursesQuerySchema)
+        return json_response({"courses": [dump(course) for course in self.storage.get_user_courses(query.user_id)]})
+
+    def create_course(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        body = self.parse_body(request, CreateCourseBodySchema)
+
+        course = CourseSchema(
+            id=str(uuid.uuid4()),
+            title=body.title,
+            max_score=body.max_score,
+            min_score=body.min_score,
+            description=body.description,
+            preview_file=self.get_or_404(self.storage.files, body.preview_file_id, "File not found"),
+            estimated_time=body.estimated_time,
+            created_by_user=self.get_or_404(self.storage.users, body.created_by_user_id, "User not found")
+        )
+        self.storage.add_course(course)
+        return json_response({"course": dump(course)})
+
+    def get_course(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        course_id = self.parse_uuid(path_params["course_id"], "course_id")
+        return json_response({"course": dump(self.get_or_404(self.storage.courses, course_id, "Course not found"))})
+
+    def update_course(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        course_id = self.parse_uuid(path_params["course_id"], "course_id")
+        course = self.get_or_404(self.storage.courses, course_id, "Course not found")
+        body = self.parse_body(request, UpdateCourseBodySchema)
+
+        updated = course.model_copy(update=body.model_dump(exclude_none=True))
+        self.storage.add_course(updated)
+        return json_response({"course": dump(updated)})
+
+    def delete_course(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        course_id = self.parse_uuid(path_params["course_id"], "course_id")
+        self.get_or_404(self.storage.courses, course_id, "Course not found")
+        self.storage.delete_course(course_id)
+        return httpx.Response(200)
+
+    # Exercises
+
+    def get_exercises(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        query = self.parse_query(request, ExercisesQuerySchema)
+        exercises = self.storage.get_course_exercises(query.course_id)
+        return json_response({"exercises": [dump(exercise) for exercise in exercises]})
+
+    def create_exercise(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        body = self.parse_body(request, CreateExerciseBodySchema)
+        self.get_or_404(self.storage.courses, body.course_id, "Course not found")
+
+        exercise = ExerciseSchema(id=str(uuid.uuid4()), **body.model_dump())
+        self.storage.add_exercise(exercise)
+        return json_response({"exercise": dump(exercise)})
+
+    def get_exercise(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        exercise_id = self.parse_uuid(path_params["exercise_id"], "exercise_id")
+        exercise = self.get_or_404(self.storage.exercises, exercise_id, "Exercise not found")
+        return json_response({"exercise": dump(exercise)})
+
+    def update_exercise(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        exercise_id = self.parse_uuid(path_params["exercise_id"], "exercise_id")
+        exercise = self.get_or_404(self.storage.exercises, exercise_id, "Exercise not found")
+        body = self.parse_body(request, UpdateExerciseBodySchema)
+
+        updated = exercise.model_copy(update=body.model_dump(exclude_none=True))
+        self.storage.add_exercise(updated)
+        return json_response({"exercise": dump(updated)})
+
+    def delete_exercise(self, request: httpx.Request, path_params: dict[str, str]) -> httpx.Response:
+        self.authenticate(request)
+        exercise_id = self.parse_uuid(path_params["exercise_id"], "exercise_id")
+        self.get_or_404(self.storage.exercises, exercise_id, "Exercise not found")
+        self.storage.delete_exercise(exercise_id)
+        return httpx.Response(200)
+
+
+@lru_cache(maxsize=None)
+def get_fake_server() -> FakeServer:
+    """
+    Функция возвращает фейковый сервер, общий для всех клиентов процесса.
+
+    :return: Экземпляр FakeServer.
+    """
+    return FakeServer(base_url=settings.http_client.client_url)
\ No newline at end of file
@@ -0,0 +1,97 @@
+import threading
+
+from clients.courses.courses_schema import CourseSchema
+from clients.exercises.exercises_schema import ExerciseSchema
+from clients.files.files_schema import FileSchema
+from clients.users.users_schema import UserSchema
+
+
+class FakeStorage:
+    """
+    Хранилище фейкового сервера в памяти процесса.
+
+    Сущности хранятся в словарях по идентификатору, а для запросов списков и логина
+    поддерживаются вторичные индексы, поэтому ни одна операция не перебирает все записи.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+
+        self.users: dict[str, UserSchema] = {}
+        self.user_ids_by_email: dict[str, str] = {}
+        self.passwords: dict[str, str] = {}  # user_id -> пароль
+
+        self.files: dict[str, FileSchema] = {}
+        self.static_files: dict[str, bytes] = {}  # "<directory>/<filename>" -> содержимое
+
+        self.courses: dict[str, CourseSchema] = {}
+        self.course_ids_by_user: dict[str, dict[str, None]] = {}  # Упорядоченное множество id курсов пользователя
+
+        self.exercises: dict[str, ExerciseSchema] = {}
+        self.exercise_ids_by_course: dict[str, dict[str, None]] = {}
+
+    def add_user(self, user: UserSchema, password: str):
+        with self.lock:
+            self.users[user.id] = user
+            self.user_ids_by_email[user.email] = user.id
+            self.passwords[user.id] = password
+
+    def update_user(self, user: UserSchema, previous_email: str):
+        with self.lock:
+            self.user_ids_by_email.pop(previous_email, None)
+            self.users[user.id] = user
+            self.user_ids_by_email[user.email] = user.id
+
+    def delete_user(self, user_id: str):
+        with self.lock:
+            if user := self.users.pop(user_id, None):
+                self.user_ids_by_email.pop(user.email, None)
+                self.passwords.pop(user_id, None)
+
+    def get_user_by_credentials(self, email: str, password: str) -> UserSchema | None:
+        with self.lock:
+            user_id = self.user_ids_by_email.get(email)
+            if user_id is None or self.passwords.get(user_id) != password:
+                return None
+
+            return self.users[user_id]
+
+    def add_file(self, file: FileSchema, content: bytes):
+        with self.lock:
+            self.files[file.id] = file
+            self.static_files[f"{file.directory}/{file.filename}"] = content
+
+    def delete_file(self, file_id: str):
+        with self.lock:
+            if file := self.files.pop(file_id, None):
+                self.static_files.pop(f"{file.directory}/{file.filename}", None)
+
+    def add_course(self, course: CourseSchema):
+        with self.lock:
+            self.courses[course.id] = course
+            self.course_ids_by_user.setdefault(course.created_by_user.id, {})[course.id] = None
+
+    def delete_course(self, course_id: str):
+        with self.lock:
+            if course := self.courses.pop(course_id, None):
+                self.course_ids_by_user.get(course.created_by_user.id, {}).pop(course_id, None)
+                for exercise_id in list(self.exercise_ids_by_course.pop(course_id, {})):
+                    self.exercises.pop(exercise_id, None)
+
+    def get_user_courses(self, user_id: str) -> list[CourseSchema]:
+        with self.lock:
+            return [self.courses[course_id] for course_id in self.course_ids_by_user.get(user_id, {})]
+
+    def add_exercise(self, exercise: ExerciseSchema):
+        with self.lock:
+            self.exercises[exercise.id] = exercise
+            self.exercise_ids_by_course.setdefault(exercise.course_id, {})[exercise.id] = None
+
+    def delete_exercise(self, exercise_id: str):
+        with self.lock:
+            if exercise := self.exercises.pop(exercise_id, None):
+                self.exercise_ids_by_course.get(exercise.course_id, {}).pop(exercise_id, None)
+
+    def get_course_exercises(self, course_id: str) -> list[ExerciseSchema]:
+        with self.lock:
+            return [self.exercises[exercise_id] for exercise_id in self.exercise_ids_by_course.get(course_id, {})]
\ No newline at end of file
@@ -1,4 +1,79 @@
-from faker import Faker
+import functools
+import itertools
+import os
+import random
+import string
+import threading
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from config import settings
+from tools.logger import get_logger
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+logger = get_logger("FAKERS")
+
+
+def create_faker(locale: str) -> "Faker":
+    # Импорт faker и загрузка локали занимают заметную часть сбора тестов, поэтому откладываются до первой генерации
+    from faker import Faker
+
+    return Faker(locale)
+
+
+class UniqueSequence:
+    """
+    Последовательность суффиксов вида <seed>-<воркер>-<номер>.
+
+    Seed прогона и номер воркера входят в каждый суффикс, поэтому значения разных воркеров
+    одного прогона не пересекаются по построению, а без повторного seed — и между прогонами.
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+
+    def next(self) -> str:
+        with self.lock:
+            return f"{self.prefix}-{next(self.counter)}"
+
+    def take(self, count: int) -> list[str]:
+        with self.lock:
+            return [f"{self.prefix}-{number}" for number in itertools.islice(self.counter, count)]
+
+
+def get_worker_index() -> int:
+    """
+    Функция возвращает номер xdist воркера (gw3 -> 3) или 0 без xdist.
+    """
+    return int(os.environ.get("PYTEST_XDIST_WORKER", "gw0").removeprefix("gw"))
+
+
+def get_run_seed() -> int:
+    """
+    Функция возвращает seed тестовых данных прогона.
+
+    В режимах record и replay это HTTP_CLIENT.CASSETTE_SEED, иначе TEST_DATA.SEED. Если seed
+    не задан, под xdist он выводится из PYTEST_XDIST_TESTRUNUID (общий для всех воркеров прогона),
+    а без xdist выбирается случайно.
+
+    :return: Seed прогона.
+    """
+    if settings.http_client.mode in ("record", "replay"):
+        return settings.http_client.cassette_seed
+
+    if settings.test_data.seed is not None:
+        return settings.test_data.seed
+
+    if run_uid := os.environ.get("PYTEST_XDIST_TESTRUNUID"):
+        return zlib.crc32(run_uid.encode("utf-8"))
+
+    return random.SystemRandom().randrange(2 ** 32)
 
 
 class Fake:
@@ -6,11 +81,61 @@ class Fake:
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
     """
 
-    def __init__(self, faker: Faker):
+    # Атрибуты, которые создаются при первом обращении (см. __getattr__)
+    lazy_attributes = ("run_seed", "faker", "unique", "batch")
+
+    def __init__(self, locale: str):
         """
-        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param locale: Локаль Faker, который будет использоваться для генерации данных.
         """
-        self.faker = faker
+        self.locale = locale
+        self.worker = get_worker_index()
+        self.lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Вызывается только для ещё не созданных атрибутов. Блокировка нужна, потому что
+        # фабрики сущностей генерируют данные из нескольких потоков
+        if name not in self.lazy_attributes:
+            raise AttributeError(name)
+
+        with self.lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = getattr(self, f"create_{name}")()
+
+            return self.__dict__[name]
+
+    def create_run_seed(self) -> int:
+        run_seed = get_run_seed()
+        # Данные всегда генерируются из seed прогона, чтобы упавший прогон можно было воспроизвести
+        logger.info("Test data seed: %s, replay with TEST_DATA.SEED=%s", run_seed, run_seed)
+        return run_seed
+
+    def create_faker(self) -> "Faker":
+        faker = create_faker(self.locale)
+        faker.seed_instance(f"{self.run_seed}:{self.worker}")
+        return faker
+
+    def create_unique(self) -> UniqueSequence:
+        return UniqueSequence(prefix=f"{self.run_seed:x}-{self.worker}")
+
+    def create_batch(self) -> "BatchFake":
+        batch = BatchFake(locale=self.locale)
+        batch.seed(f"{self.run_seed}:{self.worker}:batch", self.unique)
+        return batch
+
+    def seed(self, run_seed: int, worker: int = 0):
+        """
+        Делает данные воспроизводимыми: у каждого воркера свой поток значений, выведенный из seed прогона.
+
+        :param run_seed: Seed прогона.
+        :param worker: Номер xdist воркера.
+        """
+        with self.lock:
+            for name in self.lazy_attributes:
+                self.__dict__.pop(name, None)
+
+            self.run_seed = run_seed
+            self.worker = worker
 
     def text(self) -> str:
         """
@@ -30,13 +155,31 @@ class Fake:
 
     def email(self, domain: str | None = None) -> str:
         """
-        Генерирует случайный email.
+        Генерирует email, уникальный в пределах прогона.
 
         :param domain: Домен электронной почты (например, "example.com").
         Если не указан, будет использован случайный домен.
         :return: Случайный email.
         """
-        return self.faker.email(domain=domain)
+        user_name, _, domain = self.faker.email(domain=domain).partition("@")
+        return f"{user_name}.{self.unique.next()}@{domain}"
+
+    def title(self) -> str:
+        """
+        Генерирует уникальный в пределах прогона заголовок: предложение с уникальным суффиксом.
+
+        :return: Заголовок.
+        """
+        return f"{self.faker.sentence().rstrip('.')} {self.unique.next()}"
+
+    def filename(self, extension: str) -> str:
+        """
+        Генерирует уникальное в пределах прогона имя файла.
+
+        :param extension: Расширение файла без точки.
+        :return: Имя файла.
+        """
+        return f"{self.unique.next()}.{extension}"
 
     # Остальной код без изменений
 
@@ -115,5 +258,196 @@ class Fake:
         return self.integer(1, 30)
 
 
-# Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker("ru_RU"))
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def get_list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+class BatchFake:
+    """
+    Пакетная генерация тестовых данных.
+
+    Faker медленно генерирует text(), sentence() и email() по одному значению. Здесь словари
+    (слова, имена, логины, домены, тексты) один раз строятся через Faker с фиксированным seed,
+    а значения собираются из них случайными выборками random.choices блоками по n штук.
+    При одинаковом seed результат воспроизводим.
+    """
+
+    def __init__(self, locale: str, vocabulary_size: int = 2000, seed: int | None = None):
+        """
+        :param locale: Локаль Faker для построения словарей.
+        :param vocabulary_size: Размер каждого словаря.
+        :param seed: Seed генератора. Если не задан, значения различаются между запусками.
+        """
+        self.locale = locale
+        self.vocabulary_size = vocabulary_size
+        self.random = random.Random(seed)
+        self.unique = UniqueSequence(prefix=f"{self.random.getrandbits(32):x}")
+
+    def seed(self, seed: int | str, unique: UniqueSequence):
+        """
+        :param seed: Seed генератора выборок.
+        :param unique: Последовательность уникальных суффиксов, общая с Fake.
+        """
+        self.random.seed(seed)
+        self.unique = unique
+
+    @functools.cached_property
+    def vocabulary(self) -> dict[str, list[str]]:
+        faker = create_faker(self.locale)
+        faker.seed_instance(0)  # Словари одинаковы в любом прогоне, случайность — только в выборках
+
+        size = self.vocabulary_size
+        return {
+            "words": faker.words(nb=size),
+            "first_names": [faker.first_name() for _ in range(size)],
+            "last_names": [faker.last_name() for _ in range(size)],
+            "middle_names": [faker.middle_name() for _ in range(size)],
+            "user_names": [faker.user_name() for _ in range(size)],
+            "domains": sorted({faker.free_email_domain() for _ in range(size)}),
+            "texts": [faker.text() for _ in range(size // 10)],
+        }
+
+    def choices(self, name: str, count: int) -> list[str]:
+        return self.random.choices(self.vocabulary[name], k=count)
+
+    def integers(self, count: int, start: int = 1, end: int = 100) -> list[int]:
+        """
+        Генерирует count случайных целых чисел в диапазоне [start, end].
+        """
+        return self.random.choices(range(start, end + 1), k=count)
+
+    def uuids(self, count: int) -> list[str]:
+        """
+        Генерирует count UUID4 из одного блока случайных байт.
+        """
+        digits = self.random.randbytes(16 * count).hex()
+        uuids = []
+        for offset in range(0, 32 * count, 32):
+            value = digits[offset:offset + 32]
+            variant = "89ab"[int(value[16], 16) & 3]
+            uuids.append(f"{value[:8]}-{value[8:12]}-4{value[13:16]}-{variant}{value[17:20]}-{value[20:]}")
+
+        return uuids
+
+    def emails(self, count: int, domain: str | None = None) -> list[str]:
+        """
+        Генерирует count email адресов вида <логин>.<уникальный суффикс>@<домен>.
+
+        :param count: Количество адресов.
+        :param domain: Домен электронной почты. Если не указан, выбирается случайный.
+        :return: Список адресов.
+        """
+        domains = [domain] * count if domain else self.choices("domains", count)
+        return [
+            f"{user_name}.{suffix}@{domain}"
+            for user_name, suffix, domain in zip(self.choices("user_names", count), self.unique.take(count), domains)
+        ]
+
+    def passwords(self, count: int, length: int = 10) -> list[str]:
+        alphabet = string.ascii_letters + string.digits + "!@#$%^&*()_+"
+        characters = "".join(self.random.choices(alphabet, k=length * count))
+        return [characters[offset:offset + length] for offset in range(0, length * count, length)]
+
+    def sentences(self, count: int) -> list[str]:
+        lengths = self.integers(count, 3, 8)
+        words = self.choices("words", sum(lengths))
+
+        sentences, offset = [], 0
+        for length in lengths:
+            sentences.append(" ".join(words[offset:offset + length]).capitalize() + ".")
+            offset += length
+
+        return sentences
+
+    def titles(self, count: int) -> list[str]:
+        return [
+            f"{sentence.rstrip('.')} {suffix}"
+            for sentence, suffix in zip(self.sentences(count), self.unique.take(count))
+        ]
+
+    def texts(self, count: int) -> list[str]:
+        return self.choices("texts", count)
+
+    def estimated_times(self, count: int) -> list[str]:
+        return [f"{weeks} weeks" for weeks in self.integers(count, 1, 10)]
+
+    def repeat_or_uuids(self, value: str | None, count: int) -> list[str]:
+        return [value] * count if value else self.uuids(count)
+
+    @staticmethod
+    def build_requests(schema: type[BaseModel], columns: dict[str, list], validate: bool = True) -> list:
+        rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        if not validate:
+            return [schema.model_construct(**row) for row in rows]
+
+        # Список валидируется одним вызовом pydantic-core, это быстрее поштучного создания моделей
+        return get_list_adapter(schema).validate_python(rows)
+
+    def user_requests(self, count: int) -> list:
+        """
+        Генерирует count запросов создания пользователя.
+
+        :return: Список CreateUserRequestSchema.
+        """
+        # Импорт здесь, потому что модули схем сами импортируют tools.fakers
+        from clients.users.users_schema import CreateUserRequestSchema
+
+        # Проверка EmailStr через email_validator в разы дольше самой генерации, а адреса корректны по построению
+        return self.build_requests(CreateUserRequestSchema, {
+            "email": self.emails(count),
+            "password": self.passwords(count),
+            "lastName": self.choices("last_names", count),
+            "firstName": self.choices("first_names", count),
+            "middleName": self.choices("middle_names", count),
+        }, validate=False)
+
+    def course_requests(
+            self,
+            count: int,
+            preview_file_id: str | None = None,
+            created_by_user_id: str | None = None
+    ) -> list:
+        """
+        Генерирует count запросов создания курса.
+
+        :param count: Количество запросов.
+        :param preview_file_id: Идентификатор файла превью. Если не указан, генерируется для каждого запроса.
+        :param created_by_user_id: Идентификатор автора. Если не указан, генерируется для каждого запроса.
+        :return: Список CreateCourseRequestSchema.
+        """
+        from clients.courses.courses_schema import CreateCourseRequestSchema
+
+        return self.build_requests(CreateCourseRequestSchema, {
+            "title": self.titles(count),
+            "maxScore": self.integers(count, 50, 100),
+            "minScore": self.integers(count, 1, 30),
+            "description": self.texts(count),
+            "estimatedTime": self.estimated_times(count),
+            "previewFileId": self.repeat_or_uuids(preview_file_id, count),
+            "createdByUserId": self.repeat_or_uuids(created_by_user_id, count),
+        })
+
+    def exercise_requests(self, count: int, course_id: str | None = None) -> list:
+        """
+        Генерирует count запросов создания задания.
+
+        :param count: Количество запросов.
+        :param course_id: Идентификатор курса. Если не указан, генерируется для каждого запроса.
+        :return: Список CreateExerciseRequestSchema.
+        """
+        from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+
+        return self.build_requests(CreateExerciseRequestSchema, {
+            "title": self.titles(count),
+            "courseId": self.repeat_or_uuids(course_id, count),
+            "maxScore": self.integers(count, 50, 100),
+            "minScore": self.integers(count, 1, 30),
+            "orderIndex": self.integers(count),
+            "description": self.texts(count),
+            "estimatedTime": self.estimated_times(count),
+        })
+
+
+# Создаем экземпляр класса Fake. Faker и seed создаются при первой генерации данных
+fake = Fake(locale="ru_RU")
\ No newline at end of file
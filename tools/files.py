@@ -0,0 +1,75 @@
+import hashlib
+import io
+import os
+import random
+from typing import BinaryIO
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class GeneratedFile(io.RawIOBase):
+    """
+    Файлоподобный объект заданного размера, содержимое которого генерируется на лету.
+
+    Данные псевдослучайные, но детерминированные: одинаковые size и seed всегда дают одинаковые
+    байты, поэтому загруженный файл можно сверить с источником, не храня его. В памяти находится
+    только текущий блок, а поддержка seek позволяет httpx узнать размер и повторить отправку тела.
+    """
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, size: int, seed: int = 0):
+        super().__init__()
+        self.size = size
+        self.seed = seed
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+
+        self.position = max(offset, 0)
+        return self.position
+
+    def get_block(self, index: int) -> bytes:
+        return random.Random(f"{self.seed}:{index}").randbytes(self.BLOCK_SIZE)
+
+    def readinto(self, buffer) -> int:
+        written = 0
+        view = memoryview(buffer)
+
+        while written < len(view) and self.position < self.size:
+            index, offset = divmod(self.position, self.BLOCK_SIZE)
+            length = min(self.BLOCK_SIZE - offset, len(view) - written, self.size - self.position)
+            view[written:written + length] = self.get_block(index)[offset:offset + length]
+            written += length
+            self.position += length
+
+        return written
+
+
+def get_file_digest(file: BinaryIO, chunk_size: int = CHUNK_SIZE) -> tuple[int, str]:
+    """
+    Считает размер и SHA-256 содержимого, читая его частями.
+
+    :param file: Открытый на чтение бинарный файлоподобный объект.
+    :param chunk_size: Размер читаемой за раз части в байтах.
+    :return: Размер в байтах и hex-представление SHA-256.
+    """
+    size, digest = 0, hashlib.sha256()
+    while chunk := file.read(chunk_size):
+        size += len(chunk)
+        digest.update(chunk)
+
+    return size, digest.hexdigest()
\ No newline at end of file
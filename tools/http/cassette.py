@@ -0,0 +1,298 @@
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+from clients.api_coverage import get_route_template
+from config import settings
+
+JWT_PATTERN = re.compile(r"^[\w-]+\.([\w-]+)\.[\w-]+$")
+
+
+class CassetteMissError(httpx.TransportError):
+    """
+    В кассете нет записанного ответа для запроса.
+    """
+
+
+class CassetteEntrySchema(BaseModel):
+    """
+    Описание структуры одной записи кассеты: запрос (в виде ключей сопоставления) и ответ.
+    """
+    method: str
+    route: str  # Шаблон маршрута из track_coverage_httpx или реестра маршрутов либо путь URL
+    query: list[str]  # Имена query параметров
+    body_hash: str  # Хеш нормализованного тела запроса: точное совпадение
+    body_shape: str  # Структура тела без значений: совпадение, если данные отличаются
+    status_code: int
+    headers: dict[str, str]
+    content: str  # Тело ответа в base64
+
+
+def get_body_shape(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: get_body_shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, list):
+        return [get_body_shape(item) for item in value[:1]]
+
+    return type(value).__name__
+
+
+def get_request_keys(request: httpx.Request) -> tuple[str, str]:
+    """
+    Строит ключи сопоставления тела запроса.
+
+    JSON тело нормализуется сортировкой ключей. В multipart теле случайный boundary вырезается,
+    а само тело читается из потока частями, не загружаясь в память целиком.
+
+    :param request: Запрос httpx.
+    :return: Хеш нормализованного тела и описание его структуры.
+    """
+    content_type = request.headers.get("content-type", "")
+    digest = hashlib.sha256()
+
+    if "json" in content_type:
+        body = json.loads(request.read() or b"null")
+        digest.update(json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        return digest.hexdigest(), json.dumps(get_body_shape(body), sort_keys=True)
+
+    boundary = content_type.partition("boundary=")[2].encode("ascii")
+    for chunk in request.stream:
+        digest.update(chunk.replace(boundary, b"") if boundary else chunk)
+
+    return digest.hexdigest(), content_type.partition(";")[0]
+
+
+def refresh_jwt_expiry(token: str) -> str:
+    """
+    Продлевает claim "exp" записанного JWT так, как будто токен выпущен сейчас. Подпись не
+    пересчитывается: клиент её не проверяет, а сервера при воспроизведении нет.
+
+    :param token: Строка, похожая на JWT.
+    :return: Токен с актуальным exp или исходная строка, если это не JWT.
+    """
+    match = JWT_PATTERN.match(token)
+    if not match:
+        return token
+
+    try:
+        payload_part = match.group(1)
+        payload = json.loads(base64.urlsafe_b64decode(payload_part + "=" * (-len(payload_part) % 4)))
+        lifetime = payload["exp"] - payload.get("iat", payload["exp"] - 3600)
+    except (ValueError, KeyError, TypeError):
+        return token
+
+    payload["exp"] = int(time.time() + lifetime)
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).rstrip(b"=").decode("ascii")
+    return token.replace(payload_part, encoded, 1)
+
+
+def refresh_tokens(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: refresh_tokens(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [refresh_tokens(item) for item in value]
+    if isinstance(value, str):
+        return refresh_jwt_expiry(value)
+
+    return value
+
+
+class Cassette:
+    """
+    Набор записанных обменов в файле формата gzip JSONL (одна запись CassetteEntrySchema на строку).
+
+    При воспроизведении запись ищется сначала по точному совпадению (метод, шаблон маршрута,
+    query параметры, нормализованное тело), затем по структуре тела. Среди подходящих записей
+    берётся самая ранняя неиспользованная, поэтому повторяющиеся запросы получают ответы
+    в порядке записи. Идентификаторы в URL не мешают сопоставлению, так как маршрут берётся
+    из шаблона, а не из URL.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file: gzip.GzipFile | None = None
+        self.exact: dict[tuple, deque[CassetteEntrySchema]] = defaultdict(deque)
+        self.similar: dict[tuple, deque[CassetteEntrySchema]] = defaultdict(deque)
+        self.used: set[int] = set()
+
+    def load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                entry = CassetteEntrySchema.model_validate_json(line)
+                self.exact[(entry.method, entry.route, tuple(entry.query), entry.body_hash)].append(entry)
+                self.similar[(entry.method, entry.route, tuple(entry.query), entry.body_shape)].append(entry)
+
+    @staticmethod
+    def get_request_route(request: httpx.Request) -> tuple[str, str, tuple[str, ...]]:
+        return request.method, get_route_template(request), tuple(sorted(request.url.params.keys()))
+
+    def record(self, request: httpx.Request, response: httpx.Response):
+        method, route, query = self.get_request_route(request)
+        body_hash, body_shape = get_request_keys(request)
+        entry = CassetteEntrySchema(
+            method=method,
+            route=route,
+            query=list(query),
+            body_hash=body_hash,
+            body_shape=body_shape,
+            status_code=response.status_code,
+            headers={key: value for key, value in response.headers.items() if key.lower() == "content-type"},
+            content=base64.b64encode(response.content).decode("ascii"),
+        )
+
+        with self.lock:
+            if self.file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.file = gzip.open(self.path, "wt", encoding="utf-8")
+
+            self.file.write(entry.model_dump_json() + "\n")
+
+    def pop(self, candidates: deque[CassetteEntrySchema]) -> CassetteEntrySchema | None:
+        while candidates:
+            entry = candidates.popleft()
+            if id(entry) not in self.used:
+                self.used.add(id(entry))
+                return entry
+
+        return None
+
+    def replay(self, request: httpx.Request) -> httpx.Response:
+        method, route, query = self.get_request_route(request)
+        body_hash, body_shape = get_request_keys(request)
+
+        with self.lock:
+            entry = (
+                    self.pop(self.exact[(method, route, query, body_hash)])
+                    or self.pop(self.similar[(method, route, query, body_shape)])
+            )
+
+        if entry is None:
+            raise CassetteMissError(
+                f"No recorded response for {method} {route} in cassette {self.path}",
+                request=request
+            )
+
+        content = base64.b64decode(entry.content)
+        if "json" in entry.headers.get("content-type", ""):
+            # Записанные токены к моменту воспроизведения истекли бы, и клиент пытался бы их обновить
+            content = json.dumps(refresh_tokens(json.loads(content))).encode("utf-8")
+
+        return httpx.Response(entry.status_code, headers=entry.headers, content=content, request=request)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """
+    Транспорт, который выполняет запрос через реальный транспорт и записывает обмен в кассету.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, cassette: Cassette):
+        self.transport = transport
+        self.cassette = cassette
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.transport.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+
+        response = httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=content,
+            extensions=response.extensions,
+            request=request
+        )
+        self.cassette.record(request, response)
+        return response
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Асинхронный аналог RecordingTransport.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cassette: Cassette):
+        self.transport = transport
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()  # Кассета сопоставляет тела синхронно, поэтому читаем тело заранее
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+
+        response = httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=content,
+            extensions=response.extensions,
+            request=request
+        )
+        self.cassette.record(request, response)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Транспорт, который отвечает записанными в кассете ответами, не обращаясь к серверу.
+    """
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.cassette.replay(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        return self.cassette.replay(request)
+
+
+@lru_cache(maxsize=None)
+def get_cassette() -> Cassette:
+    """
+    Функция возвращает кассету HTTP_CLIENT.CASSETTE_FILE, общую для всех клиентов процесса.
+
+    В режиме replay кассета загружается целиком, в режиме record перезаписывается и закрывается
+    при завершении процесса. Запись поддерживается только без pytest-xdist: воркеры писали бы в один файл.
+
+    :return: Экземпляр Cassette.
+    """
+    cassette = Cassette(settings.http_client.cassette_file)
+
+    if settings.http_client.mode == "replay":
+        cassette.load()
+    elif os.environ.get("PYTEST_XDIST_WORKER"):
+        raise RuntimeError("HTTP_CLIENT.MODE=record is not supported with pytest-xdist, run tests in a single process")
+
+    atexit.register(cassette.close)
+    return cassette
\ No newline at end of file
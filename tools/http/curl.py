@@ -1,11 +1,39 @@
+import codecs
+
 from httpx import Request, RequestNotRead
 
 
-def make_curl_from_request(request: Request) -> str:
+def make_curl_body(body: bytes, max_body_size: int | None = None) -> str:
+    """
+    Преобразует тело запроса в текст для cURL команды.
+
+    Тело обрезается до max_body_size байт до декодирования, поэтому большие тела не копируются
+    целиком. Двоичные данные (например, файлы из multipart) заменяются пометкой с размером.
+
+    :param body: Тело запроса.
+    :param max_body_size: Максимальное количество байт тела, попадающих в команду. None — без ограничения.
+    :return: Текстовое представление тела.
+    """
+    truncated = body if max_body_size is None else body[:max_body_size]
+
+    try:
+        # Инкрементальный декодер не падает на символе, разрезанном границей обрезки
+        text = codecs.getincrementaldecoder("utf-8")().decode(truncated, final=len(truncated) == len(body))
+    except UnicodeDecodeError:
+        return f"<binary body: {len(body)} bytes>"
+
+    if len(truncated) < len(body):
+        text += f"... <truncated, {len(body)} bytes total>"
+
+    return text
+
+
+def make_curl_from_request(request: Request, max_body_size: int | None = None) -> str:
     """
     Генерирует команду cURL из HTTP-запроса httpx.
 
     :param request: HTTP-запрос, из которого будет сформирована команда cURL.
+    :param max_body_size: Максимальное количество байт тела запроса в команде. None — без ограничения.
     :return: Строка с командой cURL, содержащая метод запроса, URL, заголовки и тело (если есть).
     """
     # Создаем список с основной командой cURL, включая метод и URL
@@ -18,9 +46,9 @@ def make_curl_from_request(request: Request) -> str:
     # Добавляем тело запроса, если оно есть (например, для POST, PUT)
     try:
         if body := request.content:
-            result.append(f"-d '{body.decode('utf-8')}'")
+            result.append(f"-d '{make_curl_body(body, max_body_size)}'")
     except RequestNotRead:
         pass
 
     # Объединяем части с переносами строк, исключая завершающий `\`
-    return " \\\n  ".join(result)
\ No newline at end of file
+    return " \\\n  ".join(result)
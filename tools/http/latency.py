@@ -0,0 +1,114 @@
+import threading
+
+from pydantic import BaseModel
+
+from tools.http.timings import RequestTimingsSchema
+from tools.stats import percentile
+
+
+class RouteLatencySchema(BaseModel):
+    """
+    Сводка длительностей запросов одного маршрута в миллисекундах.
+    """
+    route: str
+    requests: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    connect_p95_ms: float | None
+    ttfb_p95_ms: float | None
+
+
+class LatencyRegistry:
+    """
+    Потокобезопасный реестр длительностей запросов текущего процесса, сгруппированных по маршруту.
+
+    Ключ маршрута имеет вид "<METHOD> <шаблон>", например "GET /api/v1/exercises/{exercise_id}".
+    При запуске через pytest-xdist у каждого воркера свой реестр.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings: dict[str, list[RequestTimingsSchema]] = {}
+
+    def record_response(self, endpoint: str, response, elapsed: float):
+        """
+        Слушатель для tracker.add_listener: сохраняет длительности фаз ответа по шаблону маршрута.
+
+        :param endpoint: Шаблон маршрута из декоратора track_coverage_httpx.
+        :param response: Ответ декорированного метода (APIResponse).
+        :param elapsed: Длительность вызова в секундах, если APIClient не замерил фазы запроса.
+        """
+        timings = getattr(response, "timings", None) or RequestTimingsSchema(total_ms=elapsed * 1000)
+        route = f"{response.request.method} {endpoint}"
+
+        with self.lock:
+            self.timings.setdefault(route, []).append(timings)
+
+    def get_total_samples(self, route: str) -> list[float]:
+        """
+        :param route: Маршрут вида "<METHOD> <шаблон>".
+        :return: Отсортированные общие длительности запросов маршрута в миллисекундах.
+        """
+        with self.lock:
+            return sorted(timings.total_ms for timings in self.timings.get(route, []))
+
+    def build_summary(self) -> list[RouteLatencySchema]:
+        """
+        Строит сводку по всем маршрутам.
+
+        :return: Список сводок, отсортированный по маршруту.
+        """
+        with self.lock:
+            items = sorted((route, list(timings)) for route, timings in self.timings.items())
+
+        summary: list[RouteLatencySchema] = []
+        for route, timings in items:
+            total = sorted(item.total_ms for item in timings)
+            connect = sorted(item.connect_ms for item in timings if item.connect_ms is not None)
+            ttfb = sorted(item.ttfb_ms for item in timings if item.ttfb_ms is not None)
+            summary.append(
+                RouteLatencySchema(
+                    route=route,
+                    requests=len(total),
+                    p50_ms=percentile(total, 50),
+                    p95_ms=percentile(total, 95),
+                    p99_ms=percentile(total, 99),
+                    max_ms=total[-1],
+                    connect_p95_ms=percentile(connect, 95) if connect else None,
+                    ttfb_p95_ms=percentile(ttfb, 95) if ttfb else None,
+                )
+            )
+
+        return summary
+
+    def format_table(self) -> str:
+        """
+        Форматирует сводку в виде текстовой таблицы.
+
+        :return: Таблица с перцентилями длительностей по каждому маршруту.
+        """
+        def format_ms(value: float | None) -> str:
+            return "-" if value is None else f"{value:.1f}"
+
+        lines = [
+            f"{'Route':<55} {'Requests':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} "
+            f"{'connect p95':>12} {'TTFB p95':>9}"
+        ]
+        for route in self.build_summary():
+            lines.append(
+                f"{route.route:<55} {route.requests:>9} {route.p50_ms:>9.1f} {route.p95_ms:>9.1f} "
+                f"{route.p99_ms:>9.1f} {route.max_ms:>9.1f} "
+                f"{format_ms(route.connect_p95_ms):>12} {format_ms(route.ttfb_p95_ms):>9}"
+            )
+
+        return "\n".join(lines)
+
+    def clear(self):
+        with self.lock:
+            self.timings.clear()
+
+
+# Реестр длительностей запросов текущего процесса
+latency_registry = LatencyRegistry()
\ No newline at end of file
@@ -0,0 +1,67 @@
+import time
+
+from pydantic import BaseModel
+
+
+class RequestTimingsSchema(BaseModel):
+    """
+    Длительности фаз одного HTTP-запроса в миллисекундах.
+
+    Фазы соединения заполняются, только если запрос открыл новое соединение: при
+    переиспользовании соединения из пула connect_ms и tls_ms равны None.
+    """
+    connect_ms: float | None = None  # Включает DNS: httpcore не выделяет резолвинг в отдельное событие
+    tls_ms: float | None = None
+    send_ms: float | None = None  # Отправка заголовков и тела запроса
+    ttfb_ms: float | None = None  # От начала отправки заголовков запроса до получения заголовков ответа
+    total_ms: float
+
+
+class RequestTimer:
+    """
+    Собирает моменты событий httpcore через расширение httpx "trace".
+
+    Экземпляр создаётся на каждый запрос и передаётся в его extensions (см. RequestTimer.extensions):
+    timer.trace для httpx.Client и timer.atrace для httpx.AsyncClient.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.events: dict[str, float] = {}
+
+    def trace(self, name: str, info: dict):
+        # Имя события имеет вид "<слой>.<событие>.<started|complete>", например "http11.send_request_headers.started".
+        # Слой (connection, http11, http2) отбрасываем, чтобы одинаково обрабатывать HTTP/1.1 и HTTP/2
+        self.events[name.split(".", 1)[-1]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: dict):
+        self.trace(name, info)
+
+    def extensions(self, asynchronous: bool = False) -> dict:
+        """
+        Расширения запроса: "trace" для httpcore и сам таймер для хука трассировки, которому нужны фазы запроса.
+
+        :param asynchronous: Запрос выполняет httpx.AsyncClient.
+        :return: Словарь для аргумента extensions.
+        """
+        return {"trace": self.atrace if asynchronous else self.trace, "timer": self}
+
+    def get_phase_ms(self, started: str, complete: str) -> float | None:
+        if started in self.events and complete in self.events:
+            return (self.events[complete] - self.events[started]) * 1000
+
+        return None
+
+    def finish(self) -> RequestTimingsSchema:
+        """
+        Фиксирует окончание запроса и считает длительности фаз.
+
+        :return: Длительности фаз запроса.
+        """
+        return RequestTimingsSchema(
+            connect_ms=self.get_phase_ms("connect_tcp.started", "connect_tcp.complete"),
+            tls_ms=self.get_phase_ms("start_tls.started", "start_tls.complete"),
+            send_ms=self.get_phase_ms("send_request_headers.started", "send_request_body.complete"),
+            ttfb_ms=self.get_phase_ms("send_request_headers.started", "receive_response_headers.complete"),
+            total_ms=(time.perf_counter() - self.started_at) * 1000
+        )
\ No newline at end of file
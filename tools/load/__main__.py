@@ -0,0 +1,31 @@
+import argparse
+
+from tools.load.runner import LoadConfig, run_load
+from tools.load.scenarios import SCENARIOS
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.load",
+        description="Нагрузочный прогон сценариев, собранных из типизированных методов API клиентов."
+    )
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--duration", type=float, default=30, help="Длительность нагрузки в секундах")
+    parser.add_argument("--concurrency", type=int, default=1, help="Виртуальных пользователей на процесс")
+    parser.add_argument("--processes", type=int, default=1, help="Количество рабочих процессов")
+    parser.add_argument("--rps", type=float, default=None, help="Целевое число итераций сценария в секунду")
+    arguments = parser.parse_args()
+
+    config = LoadConfig(
+        scenario=arguments.scenario,
+        duration=arguments.duration,
+        concurrency=arguments.concurrency,
+        processes=arguments.processes,
+        rps=arguments.rps,
+    )
+    report = run_load(config)
+    print(report.format_table())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import threading
+
+import httpx
+from pydantic import BaseModel
+
+from tools.stats import percentile
+
+
+class RouteReport(BaseModel):
+    """
+    Итоговая статистика по одному маршруту.
+    """
+    route: str
+    requests: int
+    errors: int
+    throughput: float  # Запросов в секунду
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class LoadMetrics:
+    """
+    Потокобезопасный накопитель длительностей запросов, сгруппированных по маршруту.
+
+    Ключ маршрута имеет вид "<METHOD> <шаблон>", например "GET /api/v1/exercises".
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+        self.failed_scenarios = 0
+
+    def record_response(self, endpoint: str, response: httpx.Response, elapsed: float):
+        """
+        Слушатель для tracker.add_listener: записывает длительность ответа по шаблону маршрута.
+
+        :param endpoint: Шаблон маршрута из декоратора track_coverage_httpx.
+        :param response: Полученный ответ.
+        :param elapsed: Длительность запроса в секундах.
+        """
+        route = f"{response.request.method} {endpoint}"
+        elapsed_ms = elapsed * 1000
+
+        with self.lock:
+            self.latencies.setdefault(route, []).append(elapsed_ms)
+            if response.is_error:
+                self.errors[route] = self.errors.get(route, 0) + 1
+
+    def record_failed_scenario(self):
+        with self.lock:
+            self.failed_scenarios += 1
+
+    def merge(self, other: "LoadMetrics"):
+        """
+        Добавляет к текущим метрикам данные другого накопителя (например, из другого процесса).
+
+        :param other: Накопитель, данные которого нужно добавить.
+        """
+        with self.lock:
+            for route, latencies in other.latencies.items():
+                self.latencies.setdefault(route, []).extend(latencies)
+            for route, errors in other.errors.items():
+                self.errors[route] = self.errors.get(route, 0) + errors
+            self.failed_scenarios += other.failed_scenarios
+
+    def build_reports(self, duration: float) -> list[RouteReport]:
+        """
+        Строит статистику по всем маршрутам.
+
+        :param duration: Фактическая длительность нагрузки в секундах.
+        :return: Список отчётов, отсортированный по маршруту.
+        """
+        reports: list[RouteReport] = []
+        for route, latencies in sorted(self.latencies.items()):
+            samples = sorted(latencies)
+            reports.append(
+                RouteReport(
+                    route=route,
+                    requests=len(samples),
+                    errors=self.errors.get(route, 0),
+                    throughput=len(samples) / duration if duration else 0.0,
+                    p50_ms=percentile(samples, 50),
+                    p95_ms=percentile(samples, 95),
+                    p99_ms=percentile(samples, 99),
+                )
+            )
+
+        return reports
+
+    def __getstate__(self):
+        # threading.Lock нельзя сериализовать, поэтому передаём между процессами только данные
+        return {
+            "latencies": self.latencies,
+            "errors": self.errors,
+            "failed_scenarios": self.failed_scenarios
+        }
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.latencies = state["latencies"]
+        self.errors = state["errors"]
+        self.failed_scenarios = state["failed_scenarios"]
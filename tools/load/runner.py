@@ -0,0 +1,189 @@
+import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import BaseModel, Field, model_validator
+
+from clients.api_coverage import tracker
+from tools.load.metrics import LoadMetrics, RouteReport
+from tools.load.scenarios import SCENARIOS, LoadSession
+from tools.logger import get_logger
+
+logger = get_logger("LOAD_RUNNER")
+
+
+class LoadConfig(BaseModel):
+    """
+    Параметры запуска нагрузки.
+
+    Если задан rps, виртуальные пользователи запускают итерации сценария с общим темпом rps
+    (делится поровну между процессами). Без rps каждый виртуальный пользователь выполняет
+    итерации подряд, то есть нагрузка определяется только concurrency.
+    """
+    scenario: str
+    duration: float = Field(gt=0)  # Длительность нагрузки в секундах
+    concurrency: int = Field(default=1, gt=0)  # Виртуальных пользователей на процесс
+    processes: int = Field(default=1, gt=0)
+    rps: float | None = Field(default=None, gt=0)  # Целевое число итераций сценария в секунду
+
+    @model_validator(mode="after")
+    def validate_scenario(self):
+        if self.scenario not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{self.scenario}'. Available: {', '.join(SCENARIOS)}")
+        return self
+
+
+class LoadReport(BaseModel):
+    """
+    Итоговый отчёт о нагрузке.
+    """
+    scenario: str
+    duration: float
+    iterations: int
+    failed_iterations: int
+    routes: list[RouteReport]
+
+    def format_table(self) -> str:
+        """
+        Форматирует отчёт в виде текстовой таблицы.
+
+        :return: Таблица с throughput и перцентилями по каждому маршруту.
+        """
+        lines = [
+            f"Scenario: {self.scenario}, duration: {self.duration:.1f}s, "
+            f"iterations: {self.iterations}, failed: {self.failed_iterations}",
+            f"{'Route':<45} {'Requests':>9} {'Errors':>7} {'RPS':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+        ]
+        for route in self.routes:
+            lines.append(
+                f"{route.route:<45} {route.requests:>9} {route.errors:>7} {route.throughput:>8.1f} "
+                f"{route.p50_ms:>9.1f} {route.p95_ms:>9.1f} {route.p99_ms:>9.1f}"
+            )
+
+        return "\n".join(lines)
+
+
+class Pacer:
+    """
+    Выдаёт потокам моменты запуска итераций так, чтобы суммарный темп не превышал rate в секунду.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self.lock = threading.Lock()
+        self.next_start = time.perf_counter()
+
+    def wait(self, deadline: float) -> bool:
+        """
+        Блокирует поток до его слота.
+
+        :param deadline: Момент окончания нагрузки по time.perf_counter().
+        :return: False, если слот выпадает после окончания нагрузки.
+        """
+        with self.lock:
+            start = max(self.next_start, time.perf_counter())
+            self.next_start = start + self.interval
+
+        if start >= deadline:
+            return False
+
+        time.sleep(max(start - time.perf_counter(), 0))
+        return True
+
+
+def run_virtual_user(config: LoadConfig, metrics: LoadMetrics, pacer: Pacer | None, deadline: float) -> int:
+    scenario = SCENARIOS[config.scenario]
+    session = LoadSession()
+    iterations = 0
+
+    while time.perf_counter() < deadline:
+        if pacer and not pacer.wait(deadline):
+            break
+
+        try:
+            scenario(session)
+        except Exception as error:
+            metrics.record_failed_scenario()
+            logger.debug("Scenario %s failed: %s", config.scenario, error)
+
+        iterations += 1
+
+    return iterations
+
+
+def run_worker(config: LoadConfig) -> tuple[LoadMetrics, int]:
+    """
+    Выполняет нагрузку в текущем процессе силами config.concurrency потоков.
+
+    :param config: Параметры нагрузки.
+    :return: Накопленные метрики и число выполненных итераций.
+    """
+    # Построчное логирование каждого запроса на нагрузке только тормозит генератор
+    disabled_level = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    # Нагрузочный трафик не должен попадать в покрытие эндпоинтов автотестами
+    coverage_enabled = tracker.coverage_enabled
+    tracker.coverage_enabled = False
+
+    metrics = LoadMetrics()
+    tracker.add_listener(metrics.record_response)
+
+    pacer = Pacer(config.rps / config.processes) if config.rps else None
+    deadline = time.perf_counter() + config.duration
+    iterations: list[int] = []
+
+    def target():
+        iterations.append(run_virtual_user(config, metrics, pacer, deadline))
+
+    threads = [threading.Thread(target=target, daemon=True) for _ in range(config.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    tracker.remove_listener(metrics.record_response)
+    # Воркер может выполняться в процессе тестов, где логи и покрытие нужны
+    tracker.coverage_enabled = coverage_enabled
+    logging.disable(disabled_level)
+    return metrics, sum(iterations)
+
+
+def run_load(config: LoadConfig) -> LoadReport:
+    """
+    Запускает нагрузку в config.processes процессах и объединяет их метрики.
+
+    :param config: Параметры нагрузки.
+    :return: Отчёт с throughput и перцентилями длительности по маршрутам.
+    """
+    started_at = time.perf_counter()
+
+    if config.processes == 1:
+        results = [run_worker(config)]
+    else:
+        with ProcessPoolExecutor(max_workers=config.processes) as executor:
+            results = list(executor.map(run_worker, [config] * config.processes))
+
+    return build_load_report(config, results, time.perf_counter() - started_at)
+
+
+def build_load_report(config: LoadConfig, results: list[tuple[LoadMetrics, int]], duration: float) -> LoadReport:
+    """
+    Объединяет метрики воркеров в один отчёт.
+
+    :param config: Параметры нагрузки.
+    :param results: Метрики и число итераций каждого воркера (см. run_worker).
+    :param duration: Фактическая длительность нагрузки в секундах.
+    :return: Отчёт с throughput и перцентилями длительности по маршрутам всех воркеров.
+    """
+    metrics = LoadMetrics()
+    for worker_metrics, _ in results:
+        metrics.merge(worker_metrics)
+
+    return LoadReport(
+        scenario=config.scenario,
+        duration=duration,
+        iterations=sum(iterations for _, iterations in results),
+        failed_iterations=metrics.failed_scenarios,
+        routes=metrics.build_reports(duration),
+    )
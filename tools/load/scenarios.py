@@ -0,0 +1,127 @@
+from functools import cached_property
+from typing import Callable
+
+from clients.authentication.authentication_client import AuthenticationClient, get_authentication_client
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.courses.courses_client import CoursesClient, get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema, CreateCourseResponseSchema
+from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, GetExercisesQuerySchema
+from clients.files.files_client import FilesClient, get_files_client
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.users.public_users_client import PublicUsersClient, get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from config import settings
+
+
+class LoadSession:
+    """
+    Состояние одного виртуального пользователя нагрузки.
+
+    Все сущности (пользователь, файл, курс) создаются лениво при первом обращении
+    и переиспользуются между итерациями сценария, поэтому итерация нагружает только
+    целевой эндпоинт сценария.
+    """
+
+    @cached_property
+    def public_users_client(self) -> PublicUsersClient:
+        return get_public_users_client()
+
+    @cached_property
+    def authentication_client(self) -> AuthenticationClient:
+        return get_authentication_client()
+
+    @cached_property
+    def user_request(self) -> CreateUserRequestSchema:
+        return CreateUserRequestSchema()
+
+    @cached_property
+    def user(self) -> CreateUserResponseSchema:
+        return self.public_users_client.create_user(self.user_request)
+
+    @cached_property
+    def authentication_user(self) -> AuthenticationUserSchema:
+        self.user  # Пользователь должен существовать до авторизации
+        return AuthenticationUserSchema(email=self.user_request.email, password=self.user_request.password)
+
+    @cached_property
+    def files_client(self) -> FilesClient:
+        return get_files_client(self.authentication_user)
+
+    @cached_property
+    def courses_client(self) -> CoursesClient:
+        return get_courses_client(self.authentication_user)
+
+    @cached_property
+    def exercises_client(self) -> ExercisesClient:
+        return get_exercises_client(self.authentication_user)
+
+    @cached_property
+    def file(self) -> CreateFileResponseSchema:
+        return self.files_client.create_file(
+            CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        )
+
+    @cached_property
+    def course(self) -> CreateCourseResponseSchema:
+        return self.courses_client.create_course(
+            CreateCourseRequestSchema(
+                preview_file_id=self.file.file.id,
+                created_by_user_id=self.user.user.id
+            )
+        )
+
+
+def create_user_scenario(session: LoadSession):
+    session.public_users_client.create_user(CreateUserRequestSchema())
+
+
+def login_scenario(session: LoadSession):
+    authentication_user = session.authentication_user  # Создаёт пользователя при первой итерации
+    session.authentication_client.login(
+        LoginRequestSchema(email=authentication_user.email, password=authentication_user.password)
+    )
+
+
+def create_file_scenario(session: LoadSession):
+    session.files_client.create_file(CreateFileRequestSchema(upload_file=settings.test_data.image_png_file))
+
+
+def create_course_scenario(session: LoadSession):
+    session.courses_client.create_course(
+        CreateCourseRequestSchema(
+            preview_file_id=session.file.file.id,
+            created_by_user_id=session.user.user.id
+        )
+    )
+
+
+def create_exercise_scenario(session: LoadSession):
+    session.exercises_client.create_exercise(CreateExerciseRequestSchema(course_id=session.course.course.id))
+
+
+def get_exercises_scenario(session: LoadSession):
+    session.exercises_client.get_exercises(GetExercisesQuerySchema(course_id=session.course.course.id))
+
+
+def lms_flow_scenario(session: LoadSession):
+    """
+    Полная цепочка: новый пользователь создаёт файл, курс и задание, затем запрашивает список заданий.
+    """
+    flow_session = LoadSession()
+    login_scenario(flow_session)
+    create_exercise_scenario(flow_session)
+    get_exercises_scenario(flow_session)
+
+
+# Сценарии передаются в рабочие процессы по имени, поэтому все они должны быть зарегистрированы здесь
+SCENARIOS: dict[str, Callable[[LoadSession], None]] = {
+    "create_user": create_user_scenario,
+    "login": login_scenario,
+    "create_file": create_file_scenario,
+    "create_course": create_course_scenario,
+    "create_exercise": create_exercise_scenario,
+    "get_exercises": get_exercises_scenario,
+    "lms_flow": lms_flow_scenario,
+}
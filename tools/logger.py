@@ -1,25 +1,139 @@
+import atexit
+import fnmatch
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 
+from config import settings
 
-def get_logger(name: str) -> logging.Logger:
-    # Инициализация логгера с указанным именем
-    logger = logging.getLogger(name)
-    # Устанавливаем уровень логирования DEBUG для логгера,
-    # чтобы он обрабатывал все сообщения от DEBUG и выше
-    logger.setLevel(logging.DEBUG)
 
-    # Создаем обработчик, который будет выводить логи в консоль
-    handler = logging.StreamHandler()
-    # Устанавливаем уровень логирования DEBUG для обработчика,
-    # чтобы он обрабатывал все сообщения от DEBUG и выше
-    handler.setLevel(logging.DEBUG)
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler, который передаёт запись в очередь как есть.
 
-    # Задаем форматирование лог-сообщений: включаем время, имя логгера, уровень и сообщение
-    formatter = logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s')
-    handler.setFormatter(formatter)  # Применяем форматтер к обработчику
+    Стандартный QueueHandler.prepare форматирует сообщение в вызывающем потоке. Очередь здесь
+    не покидает процесс, поэтому форматирование (включая подстановку %-аргументов) можно
+    отложить до фонового потока QueueListener.
+    """
 
-    # Добавляем обработчик к логгеру
-    logger.addHandler(handler)
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_handler: DeferredQueueHandler | None = None
+_queue_listener: QueueListener | None = None
+_lock = threading.Lock()
+
+
+def get_queue_handler() -> DeferredQueueHandler:
+    """
+    Возвращает общий для всех логгеров обработчик, запуская при первом вызове фоновый поток,
+    который пишет записи в консоль.
+
+    :return: Обработчик, складывающий записи в очередь.
+    """
+    global _queue_handler, _queue_listener
+
+    with _lock:
+        if _queue_handler is None:
+            # Создаем обработчик, который будет выводить логи в консоль из фонового потока
+            stream_handler = logging.StreamHandler()
+            # Задаем форматирование лог-сообщений: включаем время, имя логгера, уровень и сообщение
+            stream_handler.setFormatter(logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s'))
+
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            _queue_handler = DeferredQueueHandler(log_queue)
+            _queue_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+            _queue_listener.start()
+            # При завершении процесса дожидаемся, пока фоновый поток выведет накопленные записи
+            atexit.register(_queue_listener.stop)
+
+        return _queue_handler
+
+
+def restart_queue_listener():
+    """
+    Перезапускает фоновый поток в дочернем процессе после fork (например, в воркерах нагрузочного
+    прогона): поток родителя в дочерний процесс не копируется, и без этого записи копились бы в очереди.
+    """
+    global _queue_listener, _lock
+
+    _lock = threading.Lock()
+    if _queue_handler is None:
+        return
+
+    _queue_handler.queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(_queue_handler.queue, *_queue_listener.handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+
+os.register_at_fork(after_in_child=restart_queue_listener)
+
+
+def get_logger_level(name: str) -> int | str:
+    """
+    Определяет уровень логгера по настройке LOGGING.CHANNELS.
+
+    :param name: Имя логгера, например "HTTP_CLIENT".
+    :return: Уровень канала или общий уровень LOGGING.LEVEL, если канал не настроен.
+    """
+    for pattern, level in settings.logging.channels.items():
+        # Ключ канала может быть шаблоном, например "*_ASSERTIONS"
+        if fnmatch.fnmatchcase(name, pattern):
+            return level
+
+    return settings.logging.level
+
+
+class ChannelLogger(logging.LoggerAdapter):
+    """
+    Логгер канала, уровень которого берётся из настроек при первой записи, а не при создании.
+
+    Логгеры создаются на уровне модулей, поэтому чтение LOGGING.* в get_logger загружало бы
+    настройки (.env, папку allure-results) уже при импорте любого API клиента.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger)
+        self.level_resolved = False
+
+    def isEnabledFor(self, level: int) -> bool:
+        if not self.level_resolved:
+            self.logger.setLevel(get_logger_level(self.logger.name))
+            self.level_resolved = True
+
+        return self.logger.isEnabledFor(level)
+
+    def process(self, msg, kwargs):
+        return msg, kwargs
+
+
+_channel_loggers: dict[str, ChannelLogger] = {}
+
+
+def get_logger(name: str) -> ChannelLogger:
+    """
+    Возвращает логгер с указанным именем. Повторный вызов с тем же именем возвращает тот же логгер
+    и не добавляет обработчиков.
+
+    Записи уходят в очередь и выводятся в консоль фоновым потоком, поэтому тест не ждёт вывода.
+
+    :param name: Имя логгера (канала), например "HTTP_CLIENT".
+    :return: Настроенный логгер.
+    """
+    handler = get_queue_handler()
+
+    with _lock:
+        if name not in _channel_loggers:
+            # Инициализация логгера с указанным именем
+            logger = logging.getLogger(name)
+            if handler not in logger.handlers:
+                logger.addHandler(handler)
+
+            _channel_loggers[name] = ChannelLogger(logger)
 
     # Возвращаем настроенный логгер
-    return logger
\ No newline at end of file
+    return _channel_loggers[name]
\ No newline at end of file
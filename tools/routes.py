@@ -1,4 +1,6 @@
+import threading
 from enum import Enum
+from typing import Iterable
 
 
 class APIRoutes(str, Enum):
@@ -9,4 +11,78 @@ class APIRoutes(str, Enum):
     AUTHENTICATION = "/api/v1/authentication"
 
     def __str__(self):
-        return self.value
\ No newline at end of file
+        return self.value
+
+
+class RouteNode:
+    """
+    Узел префиксного дерева маршрутов: один сегмент пути.
+    """
+
+    def __init__(self):
+        self.children: dict[str, "RouteNode"] = {}  # Статические сегменты
+        self.parameter: RouteNode | None = None  # Сегмент-параметр вида {course_id}
+        self.template: str | None = None  # Шаблон маршрута, который заканчивается в этом узле
+
+
+class RouteRegistry:
+    """
+    Реестр шаблонов маршрутов с сопоставлением конкретного пути шаблону.
+
+    Шаблоны хранятся в префиксном дереве по сегментам пути, поэтому сопоставление занимает
+    O(число сегментов) независимо от количества маршрутов. Статический сегмент имеет приоритет
+    над параметром: "/api/v1/users/me" сопоставится шаблону ".../me", а не ".../{user_id}".
+    """
+
+    def __init__(self, templates: Iterable[str] = ()):
+        self.root = RouteNode()
+        self.lock = threading.Lock()
+        for template in templates:
+            self.register(template)
+
+    @staticmethod
+    def split(path: str) -> list[str]:
+        return [segment for segment in path.split("/") if segment]
+
+    def register(self, template: str):
+        """
+        Добавляет шаблон маршрута, например "/api/v1/courses/{course_id}".
+
+        :param template: Шаблон маршрута с параметрами в фигурных скобках.
+        """
+        with self.lock:
+            node = self.root
+            for segment in self.split(template):
+                if segment.startswith("{") and segment.endswith("}"):
+                    node.parameter = node.parameter or RouteNode()
+                    node = node.parameter
+                else:
+                    node = node.children.setdefault(segment, RouteNode())
+
+            node.template = template
+
+    def match(self, path: str) -> str | None:
+        """
+        Находит шаблон маршрута для конкретного пути.
+
+        :param path: Путь URL, например "/api/v1/courses/5f0c...".
+        :return: Шаблон маршрута или None, если путь не соответствует ни одному шаблону.
+        """
+        return self.match_segments(self.root, self.split(path), 0)
+
+    def match_segments(self, node: RouteNode, segments: list[str], index: int) -> str | None:
+        if index == len(segments):
+            return node.template
+
+        if child := node.children.get(segments[index]):
+            if template := self.match_segments(child, segments, index + 1):
+                return template
+
+        if node.parameter:
+            return self.match_segments(node.parameter, segments, index + 1)
+
+        return None
+
+
+# Реестр пополняется шаблонами из декораторов track_coverage_httpx при импорте API клиентов
+route_registry = RouteRegistry(templates=[str(route) for route in APIRoutes])
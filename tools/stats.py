@@ -0,0 +1,16 @@
+import math
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """
+    Вычисляет перцентиль по методу ближайшего ранга.
+
+    :param samples: Отсортированный по возрастанию список значений.
+    :param percent: Перцентиль в диапазоне от 0 до 100.
+    :return: Значение перцентиля или 0.0, если значений нет.
+    """
+    if not samples:
+        return 0.0
+
+    rank = math.ceil(percent / 100 * len(samples))
+    return samples[max(rank, 1) - 1]
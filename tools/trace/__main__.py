@@ -0,0 +1,28 @@
+import argparse
+from pathlib import Path
+
+from config import settings
+from tools.trace.report import build_trace_stats, format_trace_report, read_trace_records
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.trace",
+        description="Сводный отчёт по JSONL трассировке запросов всех воркеров."
+    )
+    parser.add_argument(
+        "directory",
+        type=Path,
+        nargs="?",
+        default=settings.trace.results_dir,
+        help="Каталог с файлами трассировки (по умолчанию TRACE.RESULTS_DIR)"
+    )
+    parser.add_argument("--top", type=int, default=20, help="Сколько строк выводить в каждой таблице")
+    arguments = parser.parse_args()
+
+    routes, tests = build_trace_stats(read_trace_records(arguments.directory))
+    print(format_trace_report(routes, tests, arguments.top))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
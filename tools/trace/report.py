@@ -0,0 +1,126 @@
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterator
+
+from pydantic import BaseModel
+
+from tools.stats import percentile
+from tools.trace.sink import TraceRecordSchema
+
+
+class RouteTraceStatsSchema(BaseModel):
+    """
+    Статистика обменов по одному маршруту.
+    """
+    route: str  # "<METHOD> <шаблон>"
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+
+class TestTraceStatsSchema(BaseModel):
+    """
+    Количество HTTP-запросов одного теста по фазам.
+    """
+    test: str
+    setup: int = 0  # Запросы фикстур при подготовке теста
+    call: int = 0
+    teardown: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.setup + self.call + self.teardown
+
+
+def read_trace_records(directory: Path) -> Iterator[TraceRecordSchema]:
+    """
+    Последовательно читает записи всех файлов трассировки каталога, не загружая их в память целиком.
+
+    :param directory: Каталог с файлами <worker>-<pid>.jsonl.
+    :return: Итератор записей.
+    """
+    for path in sorted(directory.glob("*.jsonl")):
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield TraceRecordSchema.model_validate_json(line)
+
+
+def build_trace_stats(
+        records: Iterator[TraceRecordSchema]
+) -> tuple[list[RouteTraceStatsSchema], list[TestTraceStatsSchema]]:
+    """
+    Сводит записи трассировки в статистику по маршрутам и по тестам.
+
+    :param records: Записи трассировки всех воркеров.
+    :return: Статистика маршрутов (по убыванию p95) и тестов (по убыванию числа запросов).
+    """
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    tests: dict[str, TestTraceStatsSchema] = {}
+
+    for record in records:
+        route = f"{record.method} {record.route}"
+        latencies[route].append(record.ttfb_ms)
+        if record.status_code >= 400:
+            errors[route] += 1
+
+        test = record.test or "<outside of tests>"
+        stats = tests.setdefault(test, TestTraceStatsSchema(test=test))
+        if record.phase in ("setup", "call", "teardown"):
+            setattr(stats, record.phase, getattr(stats, record.phase) + 1)
+        else:
+            stats.call += 1
+
+    routes: list[RouteTraceStatsSchema] = []
+    for route, samples in latencies.items():
+        samples.sort()
+        routes.append(
+            RouteTraceStatsSchema(
+                route=route,
+                requests=len(samples),
+                errors=errors[route],
+                p50_ms=percentile(samples, 50),
+                p95_ms=percentile(samples, 95),
+                max_ms=samples[-1],
+            )
+        )
+
+    routes.sort(key=lambda item: item.p95_ms, reverse=True)
+    return routes, sorted(tests.values(), key=lambda item: item.total, reverse=True)
+
+
+def format_trace_report(routes: list[RouteTraceStatsSchema], tests: list[TestTraceStatsSchema], top: int) -> str:
+    """
+    Форматирует статистику в виде текстовых таблиц.
+
+    :param routes: Статистика маршрутов.
+    :param tests: Статистика тестов.
+    :param top: Сколько строк выводить в каждой таблице.
+    :return: Текст отчёта.
+    """
+    lines = [
+        "Slowest endpoints (by p95 time to first byte):",
+        f"{'Route':<55} {'Requests':>9} {'Errors':>7} {'Error %':>8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}",
+    ]
+    for route in routes[:top]:
+        lines.append(
+            f"{route.route:<55} {route.requests:>9} {route.errors:>7} {route.error_rate * 100:>8.1f} "
+            f"{route.p50_ms:>9.1f} {route.p95_ms:>9.1f} {route.max_ms:>9.1f}"
+        )
+
+    lines += [
+        "",
+        "Tests by HTTP requests (setup includes fixtures):",
+        f"{'Test':<90} {'Total':>7} {'Setup':>7} {'Call':>7} {'Teardown':>9}",
+    ]
+    for test in tests[:top]:
+        lines.append(f"{test.test:<90} {test.total:>7} {test.setup:>7} {test.call:>7} {test.teardown:>9}")
+
+    return "\n".join(lines)
\ No newline at end of file
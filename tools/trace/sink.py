@@ -0,0 +1,195 @@
+import atexit
+import contextlib
+import os
+import threading
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, TextIO
+
+from pydantic import BaseModel
+
+from config import settings
+from tools.http.timings import RequestTimingsSchema
+
+
+class TraceRecordSchema(BaseModel):
+    """
+    Описание структуры одной строки трассировки: обмен запросом и ответом.
+    """
+    timestamp: float  # Unix-время отправки запроса
+    worker: str  # Воркер pytest-xdist ("master" без xdist)
+    test: str | None  # Node id теста, во время которого выполнен запрос
+    phase: str | None  # Фаза теста: setup (фикстуры), call или teardown
+    method: str
+    route: str  # Шаблон маршрута из track_coverage_httpx или реестра маршрутов либо путь URL
+    status_code: int
+    request_size: int | None  # Размер тела по Content-Length, None — неизвестен (например, chunked)
+    response_size: int | None
+    # Фазы соединения из RequestTimer, None — соединение взято из пула или транспорт их не сообщает
+    connect_ms: float | None = None
+    tls_ms: float | None = None
+    send_ms: float | None = None
+    ttfb_ms: float  # От отправки запроса до получения заголовков ответа
+
+
+# Node id и фаза теста, во время которого выполняется код. В отличие от PYTEST_CURRENT_TEST, общей для
+# всего процесса, значение видно только в контексте теста и в его копиях (например, в корутинах,
+# запущенных через clients.event_loop.run_coroutine), но не в посторонних потоках вроде нагрузочных
+current_test: ContextVar[tuple[str, str] | None] = ContextVar("current_test", default=None)
+
+
+@contextlib.contextmanager
+def trace_test_phase(test: str, phase: str) -> Iterator[None]:
+    """
+    Относит запросы, выполненные внутри блока, к фазе теста.
+
+    :param test: Node id теста.
+    :param phase: Фаза теста: setup, call или teardown.
+    """
+    token = current_test.set((test, phase))
+    try:
+        yield
+    finally:
+        current_test.reset(token)
+
+
+class TraceSink:
+    """
+    Потокобезопасный буферизированный писатель JSONL файла трассировки.
+
+    Строки накапливаются в буфере файла и попадают на диск при его заполнении и при закрытии,
+    поэтому запись строки не приводит к системному вызову на каждый запрос.
+    """
+
+    def __init__(self, path: Path, buffer_size: int):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.lock = threading.Lock()
+        self.file: TextIO | None = None
+
+    def write(self, record: TraceRecordSchema):
+        line = record.model_dump_json() + "\n"
+
+        with self.lock:
+            if self.file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.file = open(self.path, "a", encoding="utf-8", buffering=self.buffer_size)
+
+            self.file.write(line)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def before_fork(self):
+        # Сбрасываем буфер до fork и держим замок, чтобы дочерний процесс не унаследовал
+        # недописанные строки и не записал их в файл родителя второй раз
+        self.lock.acquire()
+        if self.file is not None:
+            self.file.flush()
+
+    def after_fork_in_parent(self):
+        self.lock.release()
+
+    def after_fork_in_child(self):
+        # Буфер пуст, поэтому закрытие закрывает только унаследованный дескриптор
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+@lru_cache(maxsize=None)
+def get_trace_sink() -> TraceSink:
+    """
+    Функция возвращает писатель трассировки текущего процесса.
+
+    Каждый воркер пишет в свой файл <TRACE.RESULTS_DIR>/<worker>-<pid>.jsonl, поэтому
+    воркерам не нужно синхронизироваться между собой. Файл закрывается при завершении процесса.
+    Процесс, созданный через fork (например, воркер нагрузочного прогона), получает свой файл.
+
+    :return: Экземпляр TraceSink.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    sink = TraceSink(
+        path=settings.trace.results_dir / f"{worker}-{os.getpid()}.jsonl",
+        buffer_size=settings.trace.buffer_size
+    )
+    atexit.register(sink.close)
+    return sink
+
+
+def get_created_trace_sink() -> TraceSink | None:
+    return get_trace_sink() if get_trace_sink.cache_info().currsize else None
+
+
+def before_fork():
+    if sink := get_created_trace_sink():
+        sink.before_fork()
+
+
+def after_fork_in_parent():
+    if sink := get_created_trace_sink():
+        sink.after_fork_in_parent()
+
+
+def after_fork_in_child():
+    if sink := get_created_trace_sink():
+        sink.after_fork_in_child()
+        get_trace_sink.cache_clear()
+
+
+os.register_at_fork(before=before_fork, after_in_parent=after_fork_in_parent, after_in_child=after_fork_in_child)
+
+
+def clear_trace_results(directory: Path):
+    """
+    Удаляет файлы трассировки предыдущих прогонов, чтобы отчёт python -m tools.trace
+    учитывал только текущий прогон.
+
+    :param directory: Каталог TRACE.RESULTS_DIR.
+    """
+    for path in directory.glob("*.jsonl"):
+        path.unlink(missing_ok=True)
+
+
+def write_trace_record(
+        method: str,
+        route: str,
+        status_code: int,
+        request_size: int | None,
+        response_size: int | None,
+        started_at: float,
+        timings: RequestTimingsSchema
+):
+    """
+    Записывает обмен запросом и ответом в файл трассировки текущего воркера.
+
+    :param method: HTTP-метод.
+    :param route: Шаблон маршрута или путь URL.
+    :param status_code: Статус-код ответа.
+    :param request_size: Размер тела запроса в байтах, если известен.
+    :param response_size: Размер тела ответа в байтах, если известен.
+    :param started_at: Unix-время отправки запроса.
+    :param timings: Длительности фаз запроса до получения заголовков ответа, ttfb_ms заполнен.
+    """
+    test, phase = current_test.get() or (None, None)
+    get_trace_sink().write(
+        TraceRecordSchema(
+            timestamp=started_at,
+            worker=os.environ.get("PYTEST_XDIST_WORKER", "master"),
+            test=test,
+            phase=phase,
+            method=method,
+            route=route,
+            status_code=status_code,
+            request_size=request_size,
+            response_size=response_size,
+            connect_ms=timings.connect_ms,
+            tls_ms=timings.tls_ms,
+            send_ms=timings.send_ms,
+            ttfb_ms=timings.ttfb_ms,
+        )
+    )
\ No newline at end of file